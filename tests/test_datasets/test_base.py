@@ -0,0 +1,76 @@
+# tests.test_datasets.test_base
+# Tests for the dataset and corpus objects
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Tests for the dataset and corpus objects
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pytest
+
+from unittest import mock
+
+from yellowbrick.datasets.base import Corpus
+from yellowbrick.exceptions import DatasetsError
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+
+@pytest.fixture
+def corpus(tmpdir):
+    """
+    Creates a small corpus of labeled documents on disk.
+    """
+    root = tmpdir.mkdir("tiny")
+    for label in ("books", "games"):
+        folder = root.mkdir(label)
+        for idx in range(5):
+            folder.join("{}.txt".format(idx)).write("{} {}".format(label, idx))
+
+    return Corpus("tiny", data_home=str(tmpdir))
+
+
+##########################################################################
+## Corpus Tests
+##########################################################################
+
+
+def test_corpus_files_cached(corpus):
+    """
+    Assert the file listing is only discovered once per corpus
+    """
+    with mock.patch("os.listdir", wraps=os.listdir) as mock_listdir:
+        files = corpus.files
+        calls = mock_listdir.call_count
+        assert corpus.files is files
+        assert corpus.target == [os.path.basename(os.path.dirname(f)) for f in files]
+        assert mock_listdir.call_count == calls
+
+    assert len(files) == 10
+
+
+@pytest.mark.parametrize("n_workers,prefetch", [(1, 1), (2, 3), (4, 32)])
+def test_corpus_stream(corpus, n_workers, prefetch):
+    """
+    Assert the streamed documents match the eagerly loaded documents
+    """
+    stream = corpus.stream(n_workers=n_workers, prefetch=prefetch)
+    assert list(stream) == list(zip(corpus.data, corpus.target))
+
+
+def test_corpus_stream_invalid(corpus):
+    """
+    Assert the stream requires positive workers and prefetch
+    """
+    with pytest.raises(DatasetsError, match="must be positive"):
+        next(corpus.stream(prefetch=0))
@@ -25,6 +25,7 @@ from tests.fixtures import Dataset
 from yellowbrick.base import Visualizer
 from yellowbrick.features.base import *
 
+from matplotlib.colors import to_rgba_array
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.datasets import make_classification, make_regression
 
@@ -414,6 +415,56 @@ class TestDataVisualizer(object):
         assert len(colors) == len(y)
         assert set(colors) == set(["g", "r", "b", "m", "y"])
 
+    def test_get_rgba_colors_discrete(self):
+        """
+        Test that RGBA colors are fancy-indexed by the encoded labels
+        """
+        X, y = self.discrete
+        oz = DataVisualizer(
+            classes=["a", "b", "c", "d", "e"], colors=["g", "r", "b", "m", "y"]
+        ).fit(X, y)
+
+        colors = oz.get_rgba_colors(y)
+        assert colors.shape == (len(y), 4)
+        npt.assert_array_equal(colors, to_rgba_array(oz.get_colors(y)))
+
+        # Class names can be used in place of the target values
+        npt.assert_array_equal(oz.get_rgba_colors(["c"]), to_rgba_array(["b"]))
+
+        with pytest.raises(YellowbrickKeyError, match="could not determine color"):
+            oz.get_rgba_colors(["foo"])
+
+    def test_get_rgba_colors_mixed_types(self):
+        """
+        Test that unorderable mixed class names, values and None are encoded
+        """
+        X, y = self.discrete
+        oz = DataVisualizer(
+            classes=["a", "b", "c", "d", "e"], colors=["g", "r", "b", "m", "y"]
+        ).fit(X, y)
+
+        label = y[0]
+        expected = to_rgba_array([oz.get_colors([label])[0], "b"])
+        npt.assert_array_equal(oz.get_rgba_colors([label, "c"]), expected)
+        assert oz.get_colors(["c", label, "c"])[::2] == ["b", "b"]
+
+        with pytest.raises(YellowbrickKeyError, match="'None'"):
+            oz.get_rgba_colors(["c", None])
+
+    @pytest.mark.parametrize("dataset", ("discrete", "continuous"))
+    def test_get_rgba_colors(self, dataset):
+        """
+        Test RGBA colors for single and continuous target types
+        """
+        X, y = getattr(self, dataset)
+        oz = DataVisualizer(target_type="continuous").fit(X, y)
+        npt.assert_array_almost_equal(
+            oz.get_rgba_colors(y), to_rgba_array(oz.get_colors(y))
+        )
+
+        oz = DataVisualizer().fit(X)
+        npt.assert_array_equal(oz.get_rgba_colors(y), to_rgba_array(["C0"] * len(y)))
+
     def test_get_colors_not_label_encoded(self):
         """
         Assert exception is raised on unknown class label for get_colors
@@ -0,0 +1,116 @@
+# tests.test_features.test_decomposition
+# Test the explained variance feature visualizer
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Test the explained variance feature visualizer
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+import matplotlib.pyplot as plt
+
+from tests.base import VisualTestCase
+from yellowbrick.exceptions import YellowbrickValueError
+from yellowbrick.features.decomposition import ExplainedVariance
+from yellowbrick.features.decomposition import explained_variance_visualizer
+
+
+##########################################################################
+## ExplainedVariance Tests
+##########################################################################
+
+
+class TestExplainedVariance(VisualTestCase):
+    """
+    Test the ExplainedVariance visualizer
+    """
+
+    def setup_method(self):
+        rng = np.random.RandomState(42)
+        self.X = rng.randn(300, 6) @ rng.randn(6, 6)
+
+    @pytest.mark.parametrize("scale", [True, False])
+    def test_covariance_solver(self, scale):
+        """
+        Test the covariance spectrum matches the full PCA spectrum
+        """
+        _, axes = plt.subplots(ncols=2)
+        full = ExplainedVariance(ax=axes[0], scale=scale).fit(self.X)
+        oz = ExplainedVariance(
+            ax=axes[1], scale=scale, solver="covariance", block_size=64
+        ).fit(self.X)
+
+        npt.assert_allclose(oz.explained_variance_, full.explained_variance_)
+        npt.assert_allclose(oz.total_variance_, full.total_variance_)
+        npt.assert_allclose(
+            np.abs(oz.transform(self.X)), np.abs(full.transform(self.X)), atol=1e-8
+        )
+
+    def test_partial_fit(self):
+        """
+        Test the covariance spectrum accumulated from chunks of rows
+        """
+        _, axes = plt.subplots(ncols=2)
+        full = ExplainedVariance(ax=axes[0], solver="covariance").fit(self.X)
+        oz = ExplainedVariance(ax=axes[1], solver="covariance")
+        for chunk in np.array_split(self.X, 5):
+            oz.partial_fit(chunk)
+
+        npt.assert_allclose(oz.explained_variance_, full.explained_variance_)
+        assert len(oz.ax.lines) == 1
+
+    def test_randomized_solver(self):
+        """
+        Test the randomized solver and its residual variance
+        """
+        _, axes = plt.subplots(ncols=2)
+        full = ExplainedVariance(ax=axes[0]).fit(self.X)
+        oz = ExplainedVariance(ax=axes[1], solver="randomized", n_components=3)
+        oz.fit(self.X)
+
+        npt.assert_allclose(oz.explained_variance_, full.explained_variance_[:3])
+        npt.assert_allclose(
+            oz.residual_variance_, full.explained_variance_[3:].sum()
+        )
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.parametrize("solver", ["full", "covariance"])
+    def test_constant_input(self, solver):
+        """
+        Test the total variance of constant data is zero rather than NaN
+        """
+        oz = ExplainedVariance(solver=solver).fit(np.ones((20, 3)))
+        assert oz.total_variance_ == 0
+        assert oz.residual_variance_ == 0
+
+    def test_quick_method(self):
+        """
+        Test the quick method passes keyword arguments to the visualizer
+        """
+        oz = explained_variance_visualizer(
+            self.X, title="Spectrum", solver="covariance"
+        )
+        assert isinstance(oz, ExplainedVariance)
+        assert oz.title == "Spectrum"
+        npt.assert_allclose(oz.total_variance_, oz.explained_variance_.sum())
+
+    def test_invalid_solver(self):
+        """
+        Test invalid solver arguments raise exceptions
+        """
+        with pytest.raises(YellowbrickValueError, match="not a valid solver"):
+            ExplainedVariance(solver="foo")
+
+        with pytest.raises(YellowbrickValueError, match="n_components"):
+            ExplainedVariance(solver="randomized")
+
+        with pytest.raises(YellowbrickValueError, match="requires solver"):
+            ExplainedVariance().partial_fit(self.X)
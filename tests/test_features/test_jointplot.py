@@ -25,6 +25,7 @@ be tested.
 import sys
 import pytest
 import numpy as np
+import matplotlib.pyplot as plt
 
 from functools import partial
 from unittest.mock import patch, MagicMock
@@ -509,3 +510,56 @@ class TestJointPlotHistogram(VisualTestCase):
 
         # Python 3.6 Travis ImageComparisonFailure: images not close (RMS 0.837)
         self.assert_images_similar(oz, tol=1.0)
+
+    def test_binned(self):
+        """
+        Test binned joint plot counts, marginals and correlation
+        """
+        X = self.continuous.X
+        oz = JointPlot(kind="binned", bins=(10, 20))
+        assert not hasattr(oz, "counts_")
+        oz.fit(X)
+
+        counts, xedges, yedges = np.histogram2d(X[:, 0], X[:, 1], bins=(10, 20))
+        np.testing.assert_array_equal(oz.counts_, counts)
+        np.testing.assert_allclose(oz.xedges_, xedges)
+        np.testing.assert_allclose(oz.yedges_, yedges)
+        np.testing.assert_allclose(oz.corr_, np.corrcoef(X[:, 0], X[:, 1])[0, 1])
+
+        # The marginal histograms are the sums of the counts of the grid
+        heights = [patch.get_height() for patch in oz.xhax.patches]
+        np.testing.assert_array_equal(heights, counts.sum(axis=1))
+        widths = [patch.get_width() for patch in oz.yhax.patches]
+        np.testing.assert_array_equal(widths, counts.sum(axis=0))
+
+    def test_binned_partial_fit(self):
+        """
+        Test binned joint plot accumulated from chunks of data
+        """
+        X = self.continuous.X
+        bin_range = ((X[:, 0].min(), X[:, 0].max()), (X[:, 1].min(), X[:, 1].max()))
+
+        _, axes = plt.subplots(ncols=2)
+        full = JointPlot(ax=axes[0], kind="binned", bin_range=bin_range).fit(X)
+        oz = JointPlot(
+            ax=axes[1], kind="binned", correlation="covariance", bin_range=bin_range
+        )
+        for chunk in np.array_split(X, 4):
+            oz.partial_fit(chunk)
+
+        np.testing.assert_array_equal(oz.counts_, full.counts_)
+        np.testing.assert_allclose(oz.corr_, np.cov(X[:, 0], X[:, 1])[0, 1])
+
+        # Only the artists of the last draw are kept
+        assert len(oz.ax.collections) == 1
+        assert len(oz.xhax.patches) == len(oz.xedges_) - 1
+
+    def test_binned_invalid(self):
+        """
+        Test binned joint plot invalid arguments
+        """
+        with pytest.raises(YellowbrickValueError, match="cannot be computed"):
+            JointPlot(kind="binned", correlation="spearman")
+
+        with pytest.raises(YellowbrickValueError, match="requires kind='binned'"):
+            JointPlot(kind="scatter").partial_fit(self.continuous.X)
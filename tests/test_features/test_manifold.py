@@ -18,9 +18,11 @@ Tests for the Manifold High Dimensional Visualizations
 ##########################################################################
 
 import pytest
+import numpy.testing as npt
 
 from yellowbrick.features.manifold import *
 from yellowbrick.utils.types import is_estimator
+from yellowbrick.utils.cache import EmbeddingCache
 from yellowbrick.features.base import TargetType
 from yellowbrick.exceptions import YellowbrickValueError, ModelError, NotFitted
 
@@ -200,6 +202,63 @@ class TestManifold(VisualTestCase):
         with pytest.raises(ModelError, match=msg):
             manifold.transform(X)
 
+    @patch("yellowbrick.features.manifold.Manifold.draw", spec=True)
+    @pytest.mark.parametrize("manifolds", ["mds", "tsne"])
+    def test_manifold_landmarks(self, mock_draw, manifolds):
+        """
+        Test that landmark mode embeds a sample and transforms new data
+        """
+        X, y = self.s_curves
+        oz = Manifold(manifold=manifolds, landmarks=100, random_state=42)
+
+        Xp = oz.fit_transform(X, y)
+        assert Xp.shape == (X.shape[0], 2)
+        assert oz.landmarks_.shape == (100, X.shape[1])
+        assert oz.landmark_embedding_.shape == (100, 2)
+
+        # Interpolating the landmarks recovers their embedding
+        npt.assert_array_almost_equal(
+            oz._interpolate(oz.landmarks_), oz.landmark_embedding_
+        )
+
+        # New data can be transformed and drawn without refitting
+        Xn = oz.transform(X[:50], y[:50])
+        assert Xn.shape == (50, 2)
+        assert mock_draw.call_count == 2
+
+    def test_manifold_landmarks_invalid(self):
+        """
+        Test that invalid landmarks raise an exception on fit
+        """
+        X, y = self.s_curves
+        with pytest.raises(YellowbrickValueError, match="between 0 and 1"):
+            Manifold(manifold="tsne", landmarks=1.5).fit(X, y)
+
+        with pytest.raises(YellowbrickValueError, match="landmarks are required"):
+            Manifold(manifold="tsne", landmarks=2).fit(X, y)
+
+    @patch("yellowbrick.features.manifold.Manifold.draw", spec=True)
+    def test_manifold_cache(self, mock_draw, tmpdir):
+        """
+        Test that a cached embedding is drawn without refitting the manifold
+        """
+        X, y = self.s_curves
+        cache = EmbeddingCache(str(tmpdir))
+
+        oz = Manifold(manifold="mds", random_state=42, cache=cache)
+        Xp = oz.fit_transform(X, y)
+        assert oz.cache_key_ in cache
+
+        oz = Manifold(manifold="mds", random_state=42, cache=cache)
+        with patch.object(oz.manifold, "fit_transform") as mock_fit_transform:
+            npt.assert_array_equal(oz.fit_transform(X, y), Xp)
+            mock_fit_transform.assert_not_called()
+
+        # A different random state is a cache miss
+        oz = Manifold(manifold="mds", random_state=43, cache=cache)
+        assert oz.fit_transform(X, y).shape == Xp.shape
+        assert len(cache) == 2
+
     @pytest.mark.filterwarnings("ignore:Conversion of the second argument")
     def test_manifold_classification(self):
         """
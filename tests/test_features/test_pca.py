@@ -24,12 +24,14 @@ import sys
 import pytest
 import numpy as np
 import numpy.testing as npt
+import scipy.sparse as sp
 
 from unittest import mock
 from tests.base import VisualTestCase, IS_WINDOWS_OR_CONDA
 
 from yellowbrick.features.pca import *
 from yellowbrick.exceptions import YellowbrickError, NotFitted
+from yellowbrick.exceptions import YellowbrickValueError
 
 # Note: this can be removed when we deprecate mpl in #826
 try:
@@ -131,6 +133,78 @@ class TestPCA(VisualTestCase):
         # AppVeyor tests fail with RMS 12.115
         self.assert_images_similar(visualizer, windows_tol=12.5)
 
+    @pytest.mark.parametrize(
+        "solver", ["full", "randomized", "incremental", "truncated"]
+    )
+    def test_solvers(self, solver):
+        """
+        Test that each solver computes components for the biplot and heatmap
+        """
+        X, y = self.discrete
+        oz = PCA(solver=solver, proj_features=True, heatmap=True, random_state=12)
+        Xp = oz.fit_transform(X, y)
+
+        assert Xp.shape == (X.shape[0], 2)
+        assert oz.pca_components_.shape == (2, X.shape[1])
+
+        # All solvers of centered data span the same top components
+        expected = PCA(random_state=12).fit(X, y).pca_components_
+        npt.assert_array_almost_equal(
+            np.abs(oz.pca_components_), np.abs(expected), decimal=1
+        )
+
+    def test_transformer_kept(self):
+        """
+        Test that user changes to the pipeline are only replaced with the solver
+        """
+        X, y = self.discrete
+        oz = PCA(solver="full", random_state=12)
+        oz.pca_transformer.set_params(pca__whiten=True)
+        oz.fit(X, y)
+        assert oz.pca_transformer.named_steps["pca"].whiten
+
+        oz.solver = "randomized"
+        oz.fit(X, y)
+        pca = oz.pca_transformer.named_steps["pca"]
+        assert pca.svd_solver == "randomized"
+        assert not pca.whiten
+
+    def test_sparse_truncated(self):
+        """
+        Test that sparse data is decomposed with TruncatedSVD without densifying
+        """
+        X = sp.random(200, 30, density=0.1, format="csr", random_state=23)
+        y = self.discrete.y[:200]
+
+        oz = PCA(scale=False, random_state=23)
+        Xp = oz.fit_transform(X, y)
+
+        assert isinstance(oz.pca_transformer.named_steps["pca"], TruncatedSVD)
+        assert oz.pca_components_.shape == (2, 30)
+        assert Xp.shape == (200, 2)
+
+    def test_partial_fit(self):
+        """
+        Test that the incremental solver can be fit over chunks of data
+        """
+        X, y = self.discrete
+        oz = PCA(solver="incremental", random_state=12)
+        for start in range(0, len(X), 250):
+            oz.partial_fit(X[start : start + 250], y[start : start + 250])
+
+        assert oz.pca_components_.shape == (2, X.shape[1])
+        assert oz.transform(X, y).shape == (X.shape[0], 2)
+
+        with pytest.raises(YellowbrickValueError, match="incremental"):
+            PCA().partial_fit(X, y)
+
+    def test_invalid_solver(self):
+        """
+        Test that an unknown solver raises an exception
+        """
+        with pytest.raises(YellowbrickValueError, match="not a valid solver"):
+            PCA(solver="eigen")
+
     def test_scale_true_2d(self):
         """
         Test the PCA visualizer 2 dimensions scaled.
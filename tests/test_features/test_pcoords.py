@@ -20,6 +20,7 @@ Testing for the parallel coordinates feature visualizers
 
 import pytest
 import numpy as np
+import matplotlib.pyplot as plt
 
 from yellowbrick.datasets import load_occupancy
 from yellowbrick.features.pcoords import *
@@ -91,6 +92,94 @@ class TestParallelCoordinates(VisualTestCase):
         visualizer.finalize()
         self.assert_images_similar(visualizer, tol=0.25)
 
+    def test_draw_instances_collection(self):
+        """
+        Assert that all instances are drawn as a single line collection
+        """
+        visualizer = ParallelCoordinates(alpha=0.3)
+        visualizer.fit_transform(self.dataset.X, self.dataset.y)
+
+        assert len(visualizer.ax.lines) == 0
+        assert len(visualizer.ax.collections) == 1
+
+        lines = visualizer.ax.collections[0]
+        assert len(lines.get_segments()) == len(self.dataset.X)
+        np.testing.assert_array_equal(
+            lines.get_segments()[4][:, 1], self.dataset.X[4]
+        )
+
+        colors = lines.get_colors()
+        assert colors.shape == (len(self.dataset.X), 4)
+        assert np.all(colors[:, 3] == 0.3)
+
+    def test_density(self):
+        """
+        Assert that density mode counts every line segment per class
+        """
+        X, y = self.dataset.X, self.dataset.y
+        visualizer = ParallelCoordinates(density=True, resolution=(8, 32))
+        visualizer.fit_transform(X, y)
+
+        n_classes = len(np.unique(y))
+        n_gaps = X.shape[1] - 1
+        assert visualizer.density_.shape == (n_classes, 32, n_gaps * 8)
+        assert visualizer.density_range_ == (X.min(), X.max())
+
+        # Every instance passes through each horizontal pixel exactly once
+        for idx, label in enumerate(np.unique(y)):
+            columns = visualizer.density_[idx].sum(axis=0)
+            assert np.all(columns == (y == label).sum())
+
+        assert len(visualizer.ax.images) == n_classes
+        assert len(visualizer.ax.lines) == 0
+        assert len(visualizer.ax.collections) == 0
+
+    def test_density_partial_fit(self):
+        """
+        Assert that density chunks accumulate to the counts of the full data
+        """
+        X, y = self.dataset.X, self.dataset.y
+
+        _, axes = plt.subplots(ncols=2)
+        full = ParallelCoordinates(axes[0], density="linear", resolution=(8, 32))
+        full.fit(X, y)
+
+        # Fit on all of the data to share the range, then count it in chunks
+        chunked = ParallelCoordinates(axes[1], density="linear", resolution=(8, 32))
+        chunked.fit(X, y)
+        chunked.density_ = None
+        for start in range(0, len(X), 37):
+            chunked.partial_fit(X[start : start + 37], y[start : start + 37])
+
+        np.testing.assert_array_equal(chunked.density_, full.density_)
+        assert len(chunked.ax.images) == len(np.unique(y))
+
+    def test_partial_fit_normalizer(self):
+        """
+        Assert that chunks are normalized with the visualizer's own normalizer
+        """
+        X, y = self.dataset.X, self.dataset.y
+
+        _, axes = plt.subplots(ncols=2)
+        oz = ParallelCoordinates(axes[0], normalize="minmax")
+        oz.fit(X[:50], y[:50])
+        expected = oz.normalizer_.transform(X[50:])
+
+        # Fitting another visualizer must not change the normalization
+        ParallelCoordinates(axes[1], normalize="minmax").fit(X * 10, y)
+        assert oz.normalizer_ is not ParallelCoordinates.NORMALIZERS["minmax"]
+
+        oz.partial_fit(X[50:], y[50:])
+        segments = oz.ax.collections[-1].get_segments()
+        np.testing.assert_allclose(segments[0][:, 1], expected[0])
+
+    def test_density_invalid_arg(self):
+        """
+        Invalid density scales should raise
+        """
+        with pytest.raises(YellowbrickValueError):
+            ParallelCoordinates(density="sqrt")
+
     def test_alpha(self):
         """
         Test image closeness on opaque alpha for random 3 class dataset
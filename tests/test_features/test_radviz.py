@@ -103,6 +103,23 @@ class TestRadViz(VisualTestCase):
         Xp = RadViz.normalize(X)
         npt.assert_array_almost_equal(Xp, Xe)
 
+    def test_projected_points(self):
+        """
+        Assert the projected points match the weighted average of the anchors
+        """
+        X, y = self.dataset.X, self.dataset.y
+        visualizer = RadViz()
+        visualizer.fit(X, y)
+
+        assert visualizer.points_.shape == (X.shape[0], 2)
+        assert len(visualizer.ax.collections) == len(np.unique(y))
+
+        Xn = RadViz.normalize(X)
+        anchors = RadViz.anchors(X.shape[1])
+        for idx in (0, 17, 42):
+            expected = (anchors * Xn[idx][:, np.newaxis]).sum(axis=0) / Xn[idx].sum()
+            npt.assert_array_almost_equal(visualizer.points_[idx], expected)
+
     def test_radviz(self):
         """
         Assert image similarity on test dataset
@@ -20,9 +20,13 @@ Test the Rankd feature analysis visualizers
 import pytest
 import numpy as np
 import numpy.testing as npt
+import scipy.sparse as sp
 
 from yellowbrick.features.rankd import RankDBase
-from yellowbrick.features.rankd import kendalltau
+from scipy.stats import shapiro, spearmanr
+from scipy.stats import kendalltau as sp_kendalltau
+
+from yellowbrick.features.rankd import kendalltau, spearman
 from yellowbrick.features.rankd import Rank1D, rank1d
 from yellowbrick.features.rankd import Rank2D, rank2d
 from yellowbrick.exceptions import YellowbrickValueError
@@ -77,6 +81,27 @@ class TestKendallTau(object):
         for (i, j), val in np.ndenumerate(corr):
             assert corr[j][i] == pytest.approx(val)
 
+    def test_kendalltau_scipy(self):
+        """
+        Assert the triangle-only parallel computation matches scipy pairwise
+        """
+        rng = np.random.RandomState(42)
+        X = rng.randint(0, 5, size=(100, 6)).astype(float)
+        X[:, 2] = rng.normal(size=100)
+        X[:, 4] = 1.0
+
+        expected = np.array([[sp_kendalltau(a, b)[0] for b in X.T] for a in X.T])
+        npt.assert_array_almost_equal(kendalltau(X), expected)
+        npt.assert_array_almost_equal(kendalltau(X, n_jobs=2), expected)
+
+    def test_spearman_scipy(self):
+        """
+        Assert the vectorized spearman ranking matches scipy
+        """
+        rng = np.random.RandomState(42)
+        X = rng.randint(0, 5, size=(100, 6)).astype(float)
+        npt.assert_array_almost_equal(spearman(X), spearmanr(X, axis=0)[0])
+
     def test_kendalltau_1D(self):
         """
         Assert that a 2D matrix is required as input
@@ -158,6 +183,35 @@ class TestRank1D(VisualTestCase):
         oz.finalize()
         self.assert_images_similar(oz)
 
+    def test_rank1d_shapiro_sample(self):
+        """
+        Test Rank1D shapiro with reproducible subsampling and parallel jobs
+        """
+        rng = np.random.RandomState(42)
+        X = np.column_stack([rng.normal(size=6000), rng.exponential(size=6000)])
+
+        full = Rank1D(n_jobs=2).rank(X)
+        npt.assert_array_almost_equal(full, [shapiro(x)[0] for x in X.T])
+
+        oz = Rank1D(sample_size=500, random_state=7)
+        ranks = oz.rank(X)
+        npt.assert_array_equal(ranks, Rank1D(sample_size=500, random_state=7).rank(X))
+        assert not np.allclose(ranks, full)
+        assert ranks[0] > ranks[1]
+
+    @pytest.mark.parametrize("algorithm", ["skew", "kurtosis", "jarque_bera"])
+    def test_rank1d_moments(self, algorithm):
+        """
+        Test Rank1D with the vectorized normality scores
+        """
+        rng = np.random.RandomState(42)
+        X = np.column_stack([rng.normal(size=500), rng.exponential(size=500)])
+
+        oz = Rank1D(algorithm=algorithm)
+        npt.assert_array_equal(oz.fit_transform(X), X)
+        assert oz.ranks_.shape == (2,)
+        assert abs(oz.ranks_[0]) < abs(oz.ranks_[1])
+
     def test_rank1d_vertical(self):
         """
         Test Rank1D using vertical orientation
@@ -536,6 +590,36 @@ class TestRank2D(VisualTestCase):
         oz.finalize()
         self.assert_images_similar(oz, tol=0.1)
 
+    @pytest.mark.parametrize("algorithm", ["pearson", "covariance"])
+    def test_rank2d_stream(self, algorithm):
+        """
+        Test Rank2D computed from row blocks and sparse matrices
+        """
+        rng = np.random.RandomState(42)
+        X = rng.normal(size=(200, 5))
+        X[X < 0] = 0
+        expected = Rank2D(algorithm=algorithm).rank(X)
+
+        oz = Rank2D(algorithm=algorithm)
+        assert oz.fit_stream(X[i : i + 32] for i in range(0, 200, 32)) is oz
+        npt.assert_array_almost_equal(oz.ranks_, expected)
+        npt.assert_array_equal(oz.features_, np.arange(5))
+
+        oz = Rank2D(algorithm=algorithm)
+        oz.fit_transform(sp.csr_matrix(X))
+        npt.assert_array_almost_equal(oz.ranks_, expected)
+
+    def test_rank2d_stream_unsupported(self):
+        """
+        Assert that only pearson and covariance can be computed from row blocks
+        """
+        oz = Rank2D(algorithm="spearman")
+        with pytest.raises(YellowbrickValueError, match="row blocks"):
+            oz.fit_stream([np.ones((10, 3))])
+
+        with pytest.raises(YellowbrickValueError, match="empty"):
+            Rank2D().fit_stream([])
+
     @pytest.mark.xfail(
         IS_WINDOWS_OR_CONDA,
         reason="font rendering different in OS and/or Python; see #892",
@@ -0,0 +1,13 @@
+# tests.test_gridsearch
+# Tests for the grid search visualizers.
+#
+# Copyright (C) 2018 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Tests for the grid search visualizers.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
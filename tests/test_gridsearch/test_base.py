@@ -0,0 +1,118 @@
+# tests.test_gridsearch.test_base
+# Tests for the grid search parameter projection utilities.
+#
+# Copyright (C) 2018 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Tests for the grid search parameter projection utilities.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+from yellowbrick.gridsearch.base import *
+from yellowbrick.exceptions import YellowbrickKeyError, YellowbrickValueError
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+
+@pytest.fixture
+def cv_results():
+    """
+    Mock grid search results where gamma does not apply to the linear kernel
+    """
+    kernel = ["linear", "linear", "rbf", "rbf", "rbf", "rbf"]
+    C = [0, 1, 0, 1, 1, 0]
+    gamma = np.ma.masked_array(
+        [0.1, 0.1, 0.1, 0.1, 1.0, 1.0], mask=[1, 1, 0, 0, 0, 0], dtype=object
+    )
+    return {
+        "param_kernel": np.ma.masked_array(kernel, dtype=object),
+        "param_C": np.ma.masked_array(C, dtype=object),
+        "param_gamma": gamma,
+        "mean_test_score": np.array([0.5, 0.6, 0.7, 0.2, 0.9, 0.3]),
+        "mean_fit_time": np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        "params": [{}] * 6,
+    }
+
+
+##########################################################################
+## Projection Tests
+##########################################################################
+
+
+class TestParamProjection(object):
+    """
+    Grid search parameter projection
+    """
+
+    def test_param_projection(self, cv_results):
+        """
+        Assert the best score is taken for each pair and NaN for missing pairs
+        """
+        xs, ys, scores = param_projection(cv_results, "C", "gamma")
+        assert xs == [0, 1]
+        assert ys == [0.1, 1.0]
+        npt.assert_array_equal(scores, [[0.7, 0.2], [0.3, 0.9]])
+
+        xs, ys, scores = param_projection(cv_results, "kernel", "C")
+        assert xs == ["linear", "rbf"]
+        npt.assert_array_equal(scores, [[0.5, 0.7], [0.6, 0.9]])
+
+    def test_missing_cells(self, cv_results):
+        """
+        Assert that cells without any applicable trials are NaN
+        """
+        _, _, scores = param_projection(cv_results, "kernel", "gamma")
+        npt.assert_array_equal(scores, [[np.nan, 0.7], [np.nan, 0.9]])
+
+    def test_failed_cells(self, cv_results):
+        """
+        Assert that cells where every trial failed with a NaN score are NaN
+        """
+        cv_results["mean_test_score"][[0, 2]] = np.nan
+        _, _, scores = param_projection(cv_results, "kernel", "C")
+        npt.assert_array_equal(scores, [[np.nan, 0.3], [0.6, 0.9]])
+
+    def test_multiple_metrics(self, cv_results):
+        """
+        Assert several metrics can be projected at once
+        """
+        _, _, scores = param_projection(
+            cv_results, "C", "gamma", ["mean_test_score", "mean_fit_time"]
+        )
+        assert scores.shape == (2, 2, 2)
+        npt.assert_array_equal(scores[1], [[3.0, 4.0], [6.0, 5.0]])
+
+    def test_param_projections(self, cv_results):
+        """
+        Assert several parameter pairs can be projected at once
+        """
+        pairs = [("C", "gamma"), ("kernel", "C")]
+        projections = param_projections(cv_results, pairs)
+        assert set(projections.keys()) == set(pairs)
+        for pair in pairs:
+            expected = param_projection(cv_results, *pair)
+            npt.assert_array_equal(projections[pair][2], expected[2])
+
+    def test_bad_params(self, cv_results):
+        """
+        Assert an exception is raised for unknown params and metrics
+        """
+        with pytest.raises(YellowbrickKeyError):
+            param_projection(cv_results, "C", "foo")
+
+        with pytest.raises(YellowbrickKeyError):
+            param_projection(cv_results, "C", "gamma", "foo")
+
+        with pytest.raises(YellowbrickValueError):
+            param_projection(cv_results, "C", "gamma", "params")
@@ -18,6 +18,7 @@ Tests for the CVScores visualizer
 ##########################################################################
 
 import pytest
+import numpy as np
 import numpy.testing as npt
 
 from unittest.mock import patch
@@ -31,7 +32,10 @@ from sklearn.neighbors import KNeighborsClassifier
 from sklearn.linear_model import RidgeCV, LogisticRegressionCV
 from sklearn.model_selection import ShuffleSplit, StratifiedKFold
 from sklearn.pipeline import Pipeline
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.exceptions import FitFailedWarning
 
+from yellowbrick.exceptions import NotFitted
 from yellowbrick.datasets import load_mushroom
 from yellowbrick.model_selection.cross_validation import *
 
@@ -73,6 +77,76 @@ class TestCrossValidation(VisualTestCase):
         for param in params:
             assert hasattr(oz, param)
 
+    @patch.object(CVScores, "draw")
+    def test_fit_times(self, mock_draw):
+        """
+        Assert that the fit and score times of each fold are stored
+        """
+        X, y = self.classification
+
+        oz = CVScores(SVC(), cv=4, n_jobs=2)
+        oz.fit(X, y)
+
+        assert oz.fit_times_.shape == (4,)
+        assert oz.score_times_.shape == (4,)
+        assert not hasattr(oz, "fold_predictions_")
+
+        with pytest.raises(NotFitted):
+            oz.fold_scores(accuracy_score)
+
+    @patch.object(CVScores, "draw")
+    def test_fold_scores(self, mock_draw):
+        """
+        Test that metrics can be recomputed from out-of-fold predictions
+        """
+        X, y = self.classification
+
+        cv = StratifiedKFold(3, shuffle=True, random_state=288)
+        oz = CVScores(SVC(), cv=cv, scoring="accuracy", return_predictions=True)
+        oz.fit(X, y)
+
+        assert len(oz.fold_predictions_) == 3
+        npt.assert_array_almost_equal(oz.fold_scores(accuracy_score), oz.cv_scores_)
+
+        f1 = oz.fold_scores(f1_score, average="macro")
+        assert f1.shape == (3,)
+
+        # The scores match those computed without storing predictions
+        base = CVScores(SVC(), cv=cv, scoring="accuracy").fit(X, y)
+        npt.assert_array_almost_equal(oz.cv_scores_, base.cv_scores_)
+        assert oz.fit_times_.shape == (3,)
+
+    @patch.object(CVScores, "draw")
+    def test_fold_scores_failed_fit(self, mock_draw):
+        """
+        Test that folds whose estimator fails to fit are scored as NaN
+        """
+        X, y = self.classification
+
+        oz = CVScores(SVC(C=-1), cv=3, return_predictions=True)
+        with pytest.warns(FitFailedWarning):
+            oz.fit(X, y)
+
+        assert np.isnan(oz.cv_scores_).all()
+        assert np.isnan(oz.fold_scores(accuracy_score)).all()
+
+    @pytest.mark.skipif(pd is None, reason="test requires pandas")
+    @patch.object(CVScores, "draw")
+    def test_fold_scores_pandas(self, mock_draw):
+        """
+        Test that folds of DataFrames are predicted in parallel workers
+        """
+        X, y = self.classification
+        X, y = pd.DataFrame(X), pd.Series(y)
+
+        cv = StratifiedKFold(3, shuffle=True, random_state=288)
+        oz = CVScores(SVC(), cv=cv, n_jobs=2, return_predictions=True)
+        oz.fit(X, y)
+
+        for test, y_true, y_pred in oz.fold_predictions_:
+            npt.assert_array_equal(y_true, y.iloc[test])
+            assert len(y_pred) == len(test)
+
     def test_classifier(self):
         """
         Test image closeness on a classification dataset with kNN
@@ -20,6 +20,7 @@ Tests for the DroppingCurve visualizer
 import sys
 import pytest
 import numpy as np
+import numpy.testing as npt
 
 from unittest.mock import patch
 from tests.base import VisualTestCase
@@ -30,7 +31,9 @@ from sklearn.tree import DecisionTreeRegressor
 from sklearn.preprocessing import OneHotEncoder, MinMaxScaler
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.model_selection import ShuffleSplit, StratifiedKFold
-from sklearn.pipeline import Pipeline
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.feature_selection import SelectKBest
+from sklearn.model_selection import validation_curve
 
 from yellowbrick.datasets import load_mushroom
 from yellowbrick.exceptions import YellowbrickValueError
@@ -83,6 +86,31 @@ class TestDroppingCurve(VisualTestCase):
         for param in params:
             assert hasattr(oz, param)
 
+    def test_feature_subsets(self):
+        """
+        Assert the column subsets score as randomly selecting the best k features
+        """
+        X, y = self.classification
+        cv = ShuffleSplit(3, random_state=288)
+
+        oz = DroppingCurve(BernoulliNB(), cv=cv, n_jobs=2, random_state=42)
+        oz.fit(X, y)
+
+        selector = SelectKBest(
+            lambda X, y: np.random.default_rng(42).standard_normal(X.shape[-1])
+        )
+        train_scores, valid_scores = validation_curve(
+            make_pipeline(selector, BernoulliNB()),
+            X,
+            y,
+            param_name="selectkbest__k",
+            param_range=oz.feature_sizes_,
+            cv=cv,
+        )
+
+        npt.assert_array_almost_equal(oz.valid_scores_, valid_scores)
+        npt.assert_array_almost_equal(oz.train_scores_, train_scores)
+
     @pytest.mark.xfail(sys.platform == "win32", reason="images not close on windows")
     def test_classifier(self):
         """
@@ -20,6 +20,7 @@ Tests for the LearningCurve visualizer
 import sys
 import pytest
 import numpy as np
+import numpy.testing as npt
 
 from unittest.mock import patch
 from tests.base import VisualTestCase
@@ -31,7 +32,7 @@ from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import OneHotEncoder, LabelEncoder
 from sklearn.impute import SimpleImputer
 from sklearn.model_selection import ShuffleSplit
-from sklearn.model_selection import StratifiedKFold
+from sklearn.model_selection import StratifiedKFold, LeaveOneOut
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 
@@ -190,6 +191,105 @@ class TestLearningCurve(VisualTestCase):
         assert oz.train_scores_.shape == (3, 12)
         assert oz.test_scores_.shape == (3, 12)
 
+    @patch.object(LearningCurve, "draw")
+    def test_fit_stream(self, mock_draw):
+        """
+        Test the out-of-core learning curve with partial_fit estimators
+        """
+        X, y = self.classification
+        X = np.abs(X)
+        chunks = ((X[i : i + 64], y[i : i + 64]) for i in range(0, 400, 64))
+
+        oz = LearningCurve(
+            MultinomialNB(), cv=4, train_sizes=[0.25, 0.5, 1.0], random_state=12
+        )
+        assert oz.fit_stream(chunks, X[400:], y[400:], n_samples=400) is oz
+        mock_draw.assert_called_once()
+
+        npt.assert_array_equal(oz.train_sizes_, [100, 200, 400])
+        assert oz.train_scores_.shape == (3, 4)
+        assert oz.test_scores_.shape == (3, 4)
+        assert np.all(oz.test_scores_ > 0.2)
+
+        # Each fold model learns the instances not assigned to its fold
+        assert oz.fold_train_sizes_.shape == (3, 4)
+        npt.assert_array_equal(oz.fold_train_sizes_.sum(axis=1), oz.train_sizes_ * 3)
+
+    @patch.object(LearningCurve, "draw")
+    def test_fit_stream_clusters(self, mock_draw):
+        """
+        Test the out-of-core learning curve with absolute train sizes
+        """
+        X, _ = self.clusters
+        chunks = ((X[i : i + 50], None) for i in range(0, 400, 50))
+
+        oz = LearningCurve(
+            MiniBatchKMeans(3, n_init=3, random_state=2),
+            train_sizes=[120, 240, 360],
+            random_state=12,
+        )
+        oz.fit_stream(chunks, X[400:], None)
+
+        npt.assert_array_equal(oz.train_sizes_, [120, 240, 360])
+        assert oz.test_scores_.shape == (3, 5)
+
+    @patch.object(LearningCurve, "draw")
+    def test_fit_stream_unfitted_folds(self, mock_draw):
+        """
+        Test that fold models without any instances at a checkpoint are NaN
+        """
+        X, y = self.classification
+        X = np.abs(X)
+        chunks = [(X[:100], y[:100])]
+
+        oz = LearningCurve(MultinomialNB(), cv=3, train_sizes=[1, 50], random_state=7)
+        oz.fit_stream(chunks, X[400:], y[400:])
+
+        # The first instance is learned by two of the three models
+        learned = oz.fold_train_sizes_[0] > 0
+        npt.assert_array_equal(learned, ~np.isnan(oz.test_scores_[0]))
+        assert np.isnan(oz.test_scores_[0]).sum() == 1
+        assert np.isnan(oz.train_scores_[0]).sum() == 1
+        assert not np.isnan(oz.test_scores_mean_).any()
+        assert not np.isnan(oz.train_scores_mean_).any()
+
+    @patch.object(LearningCurve, "draw")
+    def test_fit_stream_leave_one_out(self, mock_draw):
+        """
+        Test that the number of folds of LeaveOneOut is taken from the holdout set
+        """
+        X, y = self.classification
+        X = np.abs(X)
+        chunks = [(X[:100], y[:100])]
+
+        oz = LearningCurve(MultinomialNB(), cv=LeaveOneOut(), train_sizes=[50, 100])
+        oz.fit_stream(chunks, X[400:405], y[400:405])
+        assert oz.test_scores_.shape == (2, 5)
+
+    def test_fit_stream_errors(self):
+        """
+        Test the out-of-core learning curve with bad estimators and sizes
+        """
+        X, y = self.classification
+        X = np.abs(X)
+        chunks = [(X[:100], y[:100])]
+
+        with pytest.raises(ModelError, match="partial_fit"):
+            LearningCurve(RandomForestClassifier()).fit_stream(chunks, X, y)
+
+        with pytest.raises(YellowbrickValueError, match="n_samples"):
+            LearningCurve(MultinomialNB()).fit_stream(chunks, X, y)
+
+        with pytest.raises(YellowbrickValueError, match="exhausted"):
+            LearningCurve(MultinomialNB(), train_sizes=[200]).fit_stream(
+                chunks, X, y
+            )
+
+        with pytest.warns(YellowbrickWarning, match="200, 300 were not reached"):
+            oz = LearningCurve(MultinomialNB(), train_sizes=[50, 200, 300])
+            oz.fit_stream(chunks, X, y)
+        npt.assert_array_equal(oz.train_sizes_, [50])
+
     def test_bad_train_sizes(self):
         """
         Test learning curve with bad input for training size.
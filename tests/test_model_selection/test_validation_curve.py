@@ -203,3 +203,56 @@ class TestValidationCurve(VisualTestCase):
         """
         with pytest.raises(YellowbrickValueError):
             ValidationCurve(SVC(), param_name="gamma", param_range=100)
+
+    def test_successive_halving(self):
+        """
+        Test that abandoned values are only evaluated on the first folds
+        """
+        X, y = self.classification
+
+        pr = np.logspace(-6, 1, 8)
+        cv = ShuffleSplit(n_splits=4, test_size=0.2, random_state=14)
+        oz = ValidationCurve(
+            SVC(), param_name="gamma", param_range=pr, cv=cv, halving_factor=2
+        )
+        oz.fit(X, y)
+        oz.finalize()
+
+        assert oz.test_scores_.shape == (8, 4)
+
+        # 8 values on 1 fold, 4 values on 2 folds, 2 values on 4 folds
+        evaluated = (~np.isnan(oz.test_scores_)).sum(axis=1)
+        assert sorted(evaluated) == [1, 1, 1, 1, 2, 2, 4, 4]
+        assert oz.abandoned_.sum() == 6
+        assert not np.isnan(oz.test_scores_mean_).any()
+
+        # The survivors are the best values on the first fold
+        first = oz.test_scores_[:, 0]
+        assert first[~oz.abandoned_].min() >= np.sort(first)[-4]
+
+    @patch("yellowbrick.model_selection.validation_curve.sk_validation_curve")
+    def test_fold_failures(self, mock_curve):
+        """
+        Test that fold failures are not treated as abandoned without halving
+        """
+        X, y = self.classification
+        scores = np.array([[0.8, 0.9], [np.nan, 0.7], [0.6, 0.5]])
+        mock_curve.return_value = (scores, scores)
+
+        oz = ValidationCurve(SVC(), param_name="gamma", param_range=[0.1, 1, 10])
+        oz.fit(X, y)
+
+        assert not oz.abandoned_.any()
+        assert np.isnan(oz.test_scores_mean_[1])
+        assert np.isnan(oz.train_scores_std_[1])
+
+    def test_bad_halving_factor(self):
+        """
+        Test successive halving with a bad halving factor
+        """
+        X, y = self.classification
+        oz = ValidationCurve(
+            SVC(), param_name="gamma", param_range=[0.1, 1.0], halving_factor=1
+        )
+        with pytest.raises(YellowbrickValueError, match="halving_factor"):
+            oz.fit(X, y)
@@ -18,8 +18,11 @@ Tests for the word correlation plot text visualization
 ##########################################################################
 
 import pytest
+import numpy.testing as npt
 import matplotlib.pyplot as plt
 
+from sklearn.feature_extraction.text import CountVectorizer
+
 from tests.base import VisualTestCase
 from yellowbrick.datasets import load_hobbies
 from yellowbrick.exceptions import YellowbrickValueError
@@ -117,4 +120,31 @@ class TestWordCorrelationPlot(VisualTestCase):
         
         viz = WordCorrelationPlot(words)
         with pytest.raises(YellowbrickValueError):
-            viz.fit(corpus.data)
\ No newline at end of file
+            viz.fit(corpus.data)
+
+    def test_word_correlation_vocabulary(self):
+        """
+        Assert that an existing document-term matrix gives the same coefficients as
+        the documents.
+        """
+        words = ["game", "player", "score", "oil"]
+        docs = [
+            "the player won the game",
+            "the final score of the game",
+            "oil prices rose",
+            "the player kept score",
+            "a game about oil",
+        ]
+        vecs = CountVectorizer()
+        dtm = vecs.fit_transform(docs)
+
+        _, axes = plt.subplots(ncols=2)
+        expected = WordCorrelationPlot(words, ax=axes[0]).fit(docs)
+        viz = WordCorrelationPlot(words, vocabulary=vecs.vocabulary_, ax=axes[1])
+        viz.fit(dtm)
+
+        npt.assert_array_equal(viz.correlation_matrix_, expected.correlation_matrix_)
+
+        with pytest.raises(YellowbrickValueError, match="does not exist"):
+            viz = WordCorrelationPlot(["NotACorpusWord"], vocabulary=vecs.vocabulary_)
+            viz.fit(dtm)
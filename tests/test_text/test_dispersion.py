@@ -139,3 +139,52 @@ class TestDispersionPlot(VisualTestCase):
 
         with pytest.raises(YellowbrickValueError, match=msg):
             visualizer.fit(text, target)
+
+    def test_dispersion_plot_points(self):
+        """
+        Assert the occurrences of the search terms are drawn per class
+        """
+        text = [
+            "the Game was a game".split(),
+            "the player lost".split(),
+            "no terms here".split(),
+            "game player game".split(),
+        ]
+        target = ["b", "a", "a", "b"]
+
+        _, ax = plt.subplots()
+        visualizer = DispersionPlot(["game", "player"], ax=ax, annotate_docs=True)
+        visualizer.fit(iter(text), target)
+
+        # The search terms are indexed from the bottom of the plot
+        assert list(visualizer.boundaries_) == [5, 8, 11, 14]
+        assert list(visualizer.word_categories_) == ["b", "a", "b", "b", "b"]
+
+        # One scatter per class in order of first occurrence
+        points = {
+            c.get_label(): c.get_offsets().data.tolist() for c in ax.collections
+        }
+        assert list(points) == ["b", "a"]
+        assert points["b"] == [[5, 1], [12, 1], [13, 0], [14, 1]]
+        assert points["a"] == [[7, 0]]
+
+        with pytest.raises(YellowbrickValueError, match="'player' is not found"):
+            DispersionPlot(["game", "player"]).fit(text[:1])
+
+    def test_dispersion_plot_generator_documents(self):
+        """
+        Assert the offsets are counted when each document is a generator
+        """
+        text = [
+            "the Game was a game".split(),
+            "the player lost".split(),
+            "game player game".split(),
+        ]
+
+        _, ax = plt.subplots()
+        visualizer = DispersionPlot(["game", "player"], ax=ax, annotate_docs=True)
+        visualizer.fit(iter(doc) for doc in text)
+
+        assert list(visualizer.boundaries_) == [5, 8, 11]
+        points = ax.collections[0].get_offsets().data.tolist()
+        assert points == [[5, 1], [7, 0], [9, 1], [10, 0], [11, 1]]
@@ -18,9 +18,13 @@ Tests for the frequency distribution text visualization
 ##########################################################################
 
 import pytest
+import numpy as np
+import numpy.testing as npt
+import matplotlib.pyplot as plt
 
 from yellowbrick.datasets import load_hobbies
 from yellowbrick.text.freqdist import *
+from yellowbrick.exceptions import YellowbrickValueError
 from tests.base import IS_WINDOWS_OR_CONDA, VisualTestCase
 
 from sklearn.feature_extraction.text import CountVectorizer
@@ -31,6 +35,16 @@ from sklearn.feature_extraction.text import CountVectorizer
 
 corpus = load_hobbies()
 
+documents = [
+    "the cat sat on the mat",
+    "the dog sat on the log",
+    "a cat and a dog",
+    "the bird flew over the cat",
+    "dogs and cats and birds",
+    "the mat is on the floor",
+]
+labels = np.array(["cats", "dogs", "pets", "cats", "pets", "floor"])
+
 ##########################################################################
 ## FreqDist Tests
 ##########################################################################
@@ -71,3 +85,55 @@ class TestFreqDist(VisualTestCase):
 
         # yellowbrick.exceptions.ImageComparisonFailure: images not close (RMS 1.401)
         self.assert_images_similar(viz, tol=1.5)
+
+    def test_partial_fit(self):
+        """
+        Assert counts accumulated over batches match the counts of the corpus
+        """
+        vectorizer = CountVectorizer()
+        docs = vectorizer.fit_transform(documents)
+        features = vectorizer.get_feature_names_out()
+
+        _, axes = plt.subplots(ncols=2)
+        full = FreqDistVisualizer(features, n=5, ax=axes[0]).fit(docs, labels)
+        viz = FreqDistVisualizer(features, n=5, ax=axes[1])
+        for start in range(0, docs.shape[0], 4):
+            viz.partial_fit(docs[start : start + 4], labels[start : start + 4])
+
+        npt.assert_array_equal(viz.freqdist_, full.freqdist_)
+        for label in set(labels):
+            expected = np.asarray(docs[labels == label].sum(axis=0)).ravel()
+            npt.assert_array_equal(viz.conditional_freqdist_[label], expected)
+            npt.assert_array_equal(full.conditional_freqdist_[label], expected)
+
+        # The top terms and statistics of the corpus
+        npt.assert_array_equal(
+            full.freqdist_[full.sorted_], np.sort(full.freqdist_)[::-1][:5]
+        )
+        assert viz.hapaxes_ == np.sum(full.freqdist_ == 1)
+        assert viz.words_ == docs.sum()
+
+        # Only the bars of the last batch are drawn
+        assert len(viz.ax.patches) == 5 * len(set(labels))
+
+    def test_merge(self):
+        """
+        Assert counts of parts of the corpus can be merged
+        """
+        vectorizer = CountVectorizer()
+        docs = vectorizer.fit_transform(documents)
+        features = vectorizer.get_feature_names_out()
+
+        _, axes = plt.subplots(ncols=3)
+        full = FreqDistVisualizer(features, ax=axes[0]).fit(docs)
+        viz = FreqDistVisualizer(features, ax=axes[1]).fit(docs[:3].toarray())
+        viz.merge(FreqDistVisualizer(features, ax=axes[2]).fit(docs[3:]))
+
+        npt.assert_array_equal(viz.freqdist_, full.freqdist_)
+        assert viz.hapaxes_ == full.hapaxes_
+
+        with pytest.raises(YellowbrickValueError, match="unfitted"):
+            viz.merge(FreqDistVisualizer(features))
+
+        with pytest.raises(YellowbrickValueError, match="cannot count"):
+            viz.partial_fit(docs[:, :3])
@@ -18,6 +18,7 @@ Tests for the part-of-speech tagging visualization
 ##########################################################################
 
 import pytest
+import joblib
 import matplotlib.pyplot as plt
 
 from tests.base import VisualTestCase
@@ -389,3 +390,80 @@ class TestPosTag(VisualTestCase):
         assert ticks_ax == sorted_tags
 
         self.assert_images_similar(ax=ax)
+
+    @pytest.mark.skipif(nltk is None, reason="test requires nltk")
+    def test_nltk_parallel_batches(self, monkeypatch):
+        """
+        Assert tagging in parallel batches produces the same counts as serially
+        """
+        # Use a trivial tagger so that the test does not require the nltk data
+        monkeypatch.setattr(nltk.data, "find", lambda resource: resource)
+        monkeypatch.setattr(nltk, "sent_tokenize", lambda doc: doc.split(","))
+        monkeypatch.setattr(nltk, "word_tokenize", lambda sent: sent.split())
+        monkeypatch.setattr(
+            nltk, "pos_tag", lambda tokens: [(token, "NN") for token in tokens]
+        )
+
+        _, axes = plt.subplots(ncols=2)
+        serial = PosTagVisualizer(ax=axes[0])
+        serial._parser = "nltk_word"
+        serial.fit(sonnets)
+
+        # Thread workers share the patched tagger with the test process
+        viz = PosTagVisualizer(ax=axes[1], n_jobs=2, batch_size=1)
+        viz._parser = "nltk_word"
+        with joblib.parallel_backend("threading"):
+            tagged = list(viz.parse_nltk(iter(sonnets)))
+            viz.fit(sonnets)
+
+        assert tagged == list(serial.parse_nltk(sonnets))
+        assert viz.pos_tag_counts_ == serial.pos_tag_counts_
+
+    @pytest.mark.skipif(nltk is None, reason="test requires nltk")
+    def test_nltk_cache(self, monkeypatch, tmp_path):
+        """
+        Assert only new or changed documents are tagged when using the cache
+        """
+        monkeypatch.setattr(nltk.data, "find", lambda resource: resource)
+        monkeypatch.setattr(nltk, "sent_tokenize", lambda doc: doc.split(","))
+        monkeypatch.setattr(nltk, "word_tokenize", lambda sent: sent.split())
+        monkeypatch.setattr(
+            nltk,
+            "pos_tag",
+            lambda tokens: [(tok, "NN" if len(tok) > 3 else "DT") for tok in tokens],
+        )
+
+        _, axes = plt.subplots(ncols=3)
+        expected = PosTagVisualizer(ax=axes[0])
+        expected._parser = "nltk_word"
+        expected.fit(sonnets)
+
+        viz = PosTagVisualizer(ax=axes[1], cache=str(tmp_path), batch_size=2)
+        viz._parser = "nltk_word"
+        viz.fit(sonnets)
+        assert viz.cached_docs_ == 0
+        assert viz.pos_tag_counts_ == expected.pos_tag_counts_
+
+        # Refitting reads the counts of unchanged documents from the cache
+        viz.fit(sonnets[:2] + ["a changed document"])
+        assert viz.cached_docs_ == 2
+
+        # The counts are kept apart from the embeddings of the cache
+        assert len(list(tmp_path.glob("*.npy"))) == 0
+        assert len(list(tmp_path.joinpath("postag").glob("*.npy"))) == 4
+
+        # Stacked counts are read from the cache per label
+        viz = PosTagVisualizer(ax=axes[2], cache=str(tmp_path), stack=True)
+        viz._parser = "nltk_word"
+        viz.fit(sonnets, ["a", "b", "a"])
+        assert viz.cached_docs_ == 3
+        assert sum(viz.pos_tag_counts_["a"].values()) + sum(
+            viz.pos_tag_counts_["b"].values()
+        ) == sum(expected.pos_tag_counts_["documents"].values())
+
+    def test_invalid_batch_size(self):
+        """
+        Ensure an exception is raised if the batch size is not positive
+        """
+        with pytest.raises(YellowbrickValueError, match="batch_size"):
+            PosTagVisualizer(batch_size=0)
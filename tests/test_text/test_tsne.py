@@ -21,11 +21,14 @@ import pytest
 from unittest import mock
 
 from yellowbrick.text.tsne import *
+from yellowbrick.text.tsne import PyNNDescentTransformer
+from yellowbrick.utils.cache import EmbeddingCache
 from tests.base import VisualTestCase
 from yellowbrick.datasets import load_hobbies
 from yellowbrick.exceptions import YellowbrickValueError
 
 from sklearn.manifold import TSNE
+from sklearn.neighbors import KNeighborsTransformer
 from sklearn.datasets import make_classification
 from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -305,6 +308,106 @@ class TestTSNE(VisualTestCase):
         assert "alpha" in scatter_kwargs
         assert scatter_kwargs["alpha"] == 0.5
 
+    def test_cache(self, tmpdir):
+        """
+        Test that a cached embedding is drawn without refitting TSNE
+        """
+        X, y = make_classification(
+            n_samples=100, n_features=10, n_classes=2, random_state=42
+        )
+        cache = EmbeddingCache(str(tmpdir))
+
+        tsne = TSNEVisualizer(decompose=None, random_state=42, cache=cache)
+        tsne.fit(X, y)
+        assert tsne.cache_key_ in cache
+
+        tsne = TSNEVisualizer(decompose=None, random_state=42, cache=cache)
+        with mock.patch.object(tsne.transformer_, "fit_transform") as mock_fit:
+            tsne.fit(X, y)
+            mock_fit.assert_not_called()
+        assert tsne.n_instances_ == 100
+
+    def test_reuse_decomposition(self):
+        """
+        Test that the decomposition is reused when only the TSNE changes
+        """
+        X, y = make_classification(
+            n_samples=120, n_features=60, n_classes=2, random_state=42
+        )
+
+        tsne = TSNEVisualizer(
+            decompose_by=10, decompose_sample=0.5, block_size=25, random_state=42
+        )
+        tsne.ax = mock.MagicMock(autospec=True)
+        svd = tsne.transformer_.named_steps["svd"]
+
+        with mock.patch.object(svd, "fit", wraps=svd.fit) as mock_fit:
+            tsne.fit(X, y)
+            tsne.transformer_.set_params(tsne__perplexity=10)
+            tsne.fit(X, y)
+
+            # The decomposition is fit once on the sample of the instances
+            mock_fit.assert_called_once()
+            assert mock_fit.call_args[0][0].shape == (60, 60)
+
+        assert tsne._decomposed.shape == (120, 10)
+        assert tsne.n_instances_ == 120
+
+    def test_small_decompose_sample(self):
+        """
+        Test that the decomposition sample has more instances than components
+        """
+        X, y = make_classification(
+            n_samples=120, n_features=60, n_classes=2, random_state=42
+        )
+
+        tsne = TSNEVisualizer(decompose_by=10, decompose_sample=3, random_state=42)
+        tsne.ax = mock.MagicMock(autospec=True)
+        svd = tsne.transformer_.named_steps["svd"]
+
+        with mock.patch.object(svd, "fit", wraps=svd.fit) as mock_fit:
+            tsne.fit(X, y)
+            assert mock_fit.call_args[0][0].shape == (11, 60)
+
+        # The sample, and so the decomposition, depends on the random state
+        key = tsne._decomposed_key
+        tsne.random_state = 23
+        tsne._decompose(X, svd)
+        assert tsne._decomposed_key != key
+
+    def test_neighbors_transformer(self):
+        """
+        Test the TSNE with a precomputed neighbors graph
+        """
+        X, y = make_classification(
+            n_samples=100, n_features=20, n_classes=2, random_state=42
+        )
+
+        neighbors = KNeighborsTransformer(mode="distance", n_neighbors=31)
+        tsne = TSNEVisualizer(
+            decompose_by=10, neighbors=neighbors, perplexity=10, random_state=42
+        )
+        assert list(tsne.transformer_.named_steps) == ["svd", "neighbors", "tsne"]
+        assert tsne.transformer_.named_steps["tsne"].metric == "precomputed"
+
+        tsne.ax = mock.MagicMock(autospec=True)
+        tsne.fit(X, y)
+        assert tsne.transformer_.named_steps["tsne"].embedding_.shape == (100, 2)
+
+    def test_bad_neighbors(self):
+        """
+        Test invalid neighbors and sample arguments raise exceptions
+        """
+        with pytest.raises(YellowbrickValueError, match="neighbors method"):
+            TSNEVisualizer(neighbors="foo")
+
+        with pytest.raises(YellowbrickValueError, match="between 0 and 1"):
+            TSNEVisualizer(decompose_sample=1.5)
+
+        if PyNNDescentTransformer is None:
+            with pytest.raises(YellowbrickValueError, match="pynndescent"):
+                TSNEVisualizer(neighbors="approximate")
+
     def test_quick_method(self):
         """
         Test for tsne quick  method with hobbies dataset
@@ -20,6 +20,7 @@ Tests for the UMAP visual corpus embedding mechanism.
 import sys
 import pytest
 import warnings
+import numpy.testing as npt
 
 from unittest import mock
 from tests.base import VisualTestCase
@@ -322,6 +323,76 @@ class TestUMAP(VisualTestCase):
         assert "alpha" in scatter_kwargs
         assert scatter_kwargs["alpha"] == 0.5
 
+    def test_partial_fit(self):
+        """
+        Test that new documents are projected into the fitted embedding
+        """
+        X, y = make_classification(
+            n_samples=200, n_features=50, n_classes=2, random_state=42
+        )
+
+        umap = UMAPVisualizer(random_state=64)
+        umap.ax = mock.MagicMock(autospec=True)
+        umap.partial_fit(X[:150], y[:150])
+        assert umap.embedding_.shape == (150, 2)
+
+        with mock.patch.object(
+            umap.transformer_, "fit_transform"
+        ) as mock_fit, mock.patch.object(
+            umap.transformer_, "fit"
+        ) as mock_refit:
+            umap.partial_fit(X[150:], y[150:])
+            mock_fit.assert_not_called()
+            mock_refit.assert_not_called()
+
+        assert umap.embedding_.shape == (200, 2)
+        assert umap.n_instances_ == 200
+
+        with pytest.raises(YellowbrickValueError, match="not seen in fit"):
+            umap.partial_fit(X[:10], [5] * 10)
+
+        with pytest.raises(YellowbrickValueError, match="specify y"):
+            umap.partial_fit(X[:10])
+
+    def test_partial_fit_cached(self, tmpdir):
+        """
+        Test that the fitted model is restored with a cached embedding
+        """
+        X, y = make_classification(
+            n_samples=200, n_features=50, n_classes=2, random_state=42
+        )
+
+        umap = UMAPVisualizer(random_state=64, cache=str(tmpdir))
+        umap.ax = mock.MagicMock(autospec=True)
+        umap.fit(X[:150], y[:150])
+        expected = umap.transform(X[150:])
+
+        cached = UMAPVisualizer(random_state=64, cache=str(tmpdir))
+        cached.ax = mock.MagicMock(autospec=True)
+        with mock.patch.object(cached.transformer_, "fit_transform") as mock_fit:
+            cached.fit(X[:150], y[:150])
+            mock_fit.assert_not_called()
+
+        cached.partial_fit(X[150:], y[150:])
+        assert cached.embedding_.shape == (200, 2)
+        npt.assert_array_almost_equal(cached.embedding_[150:], expected)
+
+    def test_partial_fit_labels_without_target(self):
+        """
+        Test that documents can be added to an embedding fit with labels only
+        """
+        X, _ = make_classification(
+            n_samples=200, n_features=50, n_classes=2, random_state=42
+        )
+
+        umap = UMAPVisualizer(random_state=64, labels=["documents"])
+        umap.ax = mock.MagicMock(autospec=True)
+        umap.fit(X[:150])
+        umap.partial_fit(X[150:])
+
+        assert umap.embedding_.shape == (200, 2)
+        assert umap.n_instances_ == 200
+
     def test_quick_method(self):
         """
         Test for umap quick  method with hobbies dataset
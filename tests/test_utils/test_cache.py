@@ -0,0 +1,164 @@
+# tests.test_utils.test_cache
+# Tests for the on-disk embedding cache.
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Tests for the on-disk embedding cache.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+from scipy import sparse
+from sklearn.manifold import TSNE
+from yellowbrick.utils.cache import *
+from yellowbrick.exceptions import YellowbrickTypeError, YellowbrickValueError
+
+
+##########################################################################
+## Fingerprint Tests
+##########################################################################
+
+
+class TestFingerprint(object):
+    """
+    Fingerprints of data and transformers
+    """
+
+    def test_fingerprint(self):
+        """
+        Assert keys only depend on the data and unfitted parameters
+        """
+        X = np.random.rand(20, 4)
+        key = fingerprint(X, TSNE(random_state=3))
+
+        assert key == fingerprint(X.copy(), TSNE(random_state=3))
+        assert key != fingerprint(X + 1, TSNE(random_state=3))
+        assert key != fingerprint(X, TSNE(random_state=4))
+        assert key != fingerprint(X, TSNE(random_state=3), landmarks=10)
+
+    def test_fingerprint_sparse(self):
+        """
+        Assert sparse matrices can be fingerprinted
+        """
+        X = sparse.random(20, 4, density=0.5, format="csr", random_state=1)
+        assert fingerprint(X, TSNE()) == fingerprint(X.copy(), TSNE())
+
+
+##########################################################################
+## Embedding Cache Tests
+##########################################################################
+
+
+class TestEmbeddingCache(object):
+    """
+    On-disk embedding cache
+    """
+
+    def test_get_set(self, tmpdir):
+        """
+        Assert embeddings are stored and loaded by key
+        """
+        cache = EmbeddingCache(str(tmpdir))
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+        embedding = np.random.rand(10, 2)
+        cache.set("a", embedding)
+        assert "a" in cache
+        npt.assert_array_equal(cache.get("a"), embedding)
+
+    def test_lru_eviction(self, tmpdir):
+        """
+        Assert the least recently used embeddings are evicted beyond max size
+        """
+        embedding = np.zeros((100, 2))
+        size = 100 * 2 * 8 + 128
+
+        cache = EmbeddingCache(str(tmpdir), max_size=2 * size)
+        cache.set("a", embedding)
+        cache.set("b", embedding)
+
+        # Make "a" the most recently used embedding
+        os.utime(os.path.join(str(tmpdir), "b.npy"), (0, 0))
+        assert cache.get("a") is not None
+
+        cache.set("c", embedding)
+        assert cache.keys() == ["a", "c"]
+
+    def test_invalidation(self, tmpdir):
+        """
+        Assert embeddings can be removed by key or cleared
+        """
+        cache = EmbeddingCache(str(tmpdir))
+        for key in "abc":
+            cache.set(key, np.ones((3, 2)))
+
+        cache.remove("b")
+        assert len(cache) == 2 and "b" not in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_namespace(self, tmpdir):
+        """
+        Assert namespaces are stored and evicted apart from the embeddings
+        """
+        cache = EmbeddingCache(str(tmpdir), max_size=1024)
+        counts = cache.namespace("counts")
+        assert counts.max_size == cache.max_size
+
+        cache.set("a", np.ones((3, 2)))
+        for key in "bcdefghijk":
+            counts.set(key, np.ones(10), evict=False)
+        assert len(counts) == 10
+
+        counts.evict()
+        assert 0 < len(counts) < 10
+        assert cache.keys() == ["a"]
+
+    def test_model_cache(self, tmpdir):
+        """
+        Assert fitted models are stored in a namespace and restored on a hit
+        """
+        cache = EmbeddingCache(str(tmpdir))
+        models = cache.namespace("models", ModelCache)
+        assert isinstance(models, ModelCache)
+
+        X = np.random.RandomState(3).rand(20, 3)
+        model = TSNE(perplexity=5, init="random", random_state=3)
+        model.fit(X)
+        models.set("a", model)
+
+        assert models.keys() == ["a"] and len(cache) == 0
+        npt.assert_array_equal(models.get("a").embedding_, model.embedding_)
+        assert models.get("b") is None
+
+    def test_invalid_max_size(self, tmpdir):
+        """
+        Assert the maximum size must be positive
+        """
+        with pytest.raises(YellowbrickValueError):
+            EmbeddingCache(str(tmpdir), max_size=0)
+
+    def test_resolve_cache(self, tmpdir):
+        """
+        Assert the cache parameter of visualizers is resolved
+        """
+        assert resolve_cache(None) is None
+        assert resolve_cache(False) is None
+
+        cache = EmbeddingCache(str(tmpdir))
+        assert resolve_cache(cache) is cache
+        assert resolve_cache(str(tmpdir)).path == str(tmpdir)
+
+        with pytest.raises(YellowbrickTypeError):
+            resolve_cache(42)
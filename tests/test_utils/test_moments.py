@@ -0,0 +1,90 @@
+# tests.test_utils.test_moments
+# Tests for the one-pass moment accumulation utilities.
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Tests for the one-pass moment accumulation utilities.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+import scipy.sparse as sp
+
+from yellowbrick.utils.moments import *
+from yellowbrick.exceptions import YellowbrickValueError
+
+
+##########################################################################
+## CoMoments Tests
+##########################################################################
+
+
+class TestCoMoments(object):
+    """
+    One-pass co-moment accumulator
+    """
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.RandomState(23)
+        X = rng.normal(loc=1e4, size=(503, 6))
+        X[:, 1] = 2 * X[:, 0] + rng.normal(size=503)
+        return X
+
+    @pytest.mark.parametrize("block_size", [1, 50, 503, 1000])
+    def test_blocks(self, data, block_size):
+        """
+        Assert the accumulated statistics match numpy for any block size
+        """
+        moments = CoMoments(row_blocks(data, block_size))
+        assert moments.n_samples_ == 503
+        npt.assert_array_almost_equal(moments.mean_, data.mean(axis=0))
+        npt.assert_array_almost_equal(moments.covariance(), np.cov(data.T))
+        npt.assert_array_almost_equal(moments.covariance(0), np.cov(data.T, ddof=0))
+        npt.assert_array_almost_equal(moments.correlation(), np.corrcoef(data.T))
+
+    def test_sparse(self, data):
+        """
+        Assert that sparse matrices are accumulated in dense row blocks
+        """
+        data[data < 1e4] = 0
+        blocks = list(row_blocks(sp.csr_matrix(data), 100))
+        assert all(isinstance(block, np.ndarray) for block in blocks)
+
+        moments = CoMoments(blocks)
+        npt.assert_array_almost_equal(moments.covariance(), np.cov(data.T))
+
+    def test_merge(self, data):
+        """
+        Assert accumulators of separate parts of the data can be merged
+        """
+        left = CoMoments([data[:200]])
+        right = CoMoments(row_blocks(data[200:], 64))
+        merged = CoMoments().merge(left).merge(right).merge(CoMoments())
+        npt.assert_array_almost_equal(merged.covariance(), np.cov(data.T))
+
+        with pytest.raises(YellowbrickValueError, match="cannot merge"):
+            merged.merge(CoMoments([data[:, :3]]))
+
+    def test_constant_column(self, data):
+        """
+        Assert the correlation of a constant column is NaN
+        """
+        data[:, 2] = 7.0
+        corr = CoMoments([data]).correlation()
+        assert np.isnan(corr[2]).all()
+        assert not np.isnan(np.delete(corr, 2, axis=1)[[0, 1, 3, 4, 5]]).any()
+
+    def test_empty(self):
+        """
+        Assert an exception is raised when no data has been accumulated
+        """
+        with pytest.raises(YellowbrickValueError, match="no data"):
+            CoMoments([np.empty((0, 3))]).covariance()
@@ -21,8 +21,12 @@ Loading utilities for the yellowbrick datasets.
 
 import os
 import json
+import itertools
 import numpy as np
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from .download import download_data
 from .path import find_dataset_path, dataset_exists
 
@@ -35,6 +39,19 @@ except ImportError:
     pd = None
 
 
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def _read_document(path):
+    """
+    Reads the contents of a document of a corpus.
+    """
+    with open(path, "r", encoding="UTF-8") as f:
+        return f.read()
+
+
 ##########################################################################
 ## Dataset Object
 ##########################################################################
@@ -303,10 +320,10 @@ class Corpus(BaseDataset):
             if os.path.isdir(os.path.join(self.root, name))
         ]
 
-    @property
+    @memoized
     def files(self):
         """
-        Returns the list of file names for all documents.
+        Discovers and caches the list of file names for all documents.
         """
         return [
             os.path.join(self.root, label, name)
@@ -319,12 +336,48 @@ class Corpus(BaseDataset):
         """
         Read all of the documents from disk into an in-memory list.
         """
+        return [_read_document(f) for f in self.files]
+
+    def stream(self, n_workers=4, prefetch=16):
+        """
+        Lazily iterates over the documents of the corpus, yielding the text and
+        the label of each document in the same order as ``data`` and ``target``.
+        The files are read by a pool of threads that reads at most ``prefetch``
+        documents ahead of the consumer, so that large corpora can be processed
+        without loading all of the documents into memory.
+
+        Parameters
+        ----------
+        n_workers : int, default: 4
+            The number of threads that read the documents from disk.
+
+        prefetch : int, default: 16
+            The maximum number of documents that are read ahead of the consumer.
+
+        Yields
+        ------
+        text, label : str
+            The contents and the label of each document.
+        """
+        if n_workers < 1 or prefetch < 1:
+            raise DatasetsError("n_workers and prefetch must be positive integers")
+
+        files = iter(self.files)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            pending = deque(
+                (executor.submit(_read_document, path), path)
+                for path in itertools.islice(files, prefetch)
+            )
+
+            while pending:
+                future, path = pending.popleft()
 
-        def read(path):
-            with open(path, "r", encoding="UTF-8") as f:
-                return f.read()
+                # Schedule the next read before waiting on the oldest one
+                ahead = next(files, None)
+                if ahead is not None:
+                    pending.append((executor.submit(_read_document, ahead), ahead))
 
-        return [read(f) for f in self.files]
+                yield future.result(), os.path.basename(os.path.dirname(path))
 
     @property
     def target(self):
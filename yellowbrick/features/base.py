@@ -29,7 +29,7 @@ from yellowbrick.utils.target import target_color_type, TargetType
 from yellowbrick.exceptions import YellowbrickKeyError, YellowbrickValueError
 from yellowbrick.style import palettes
 
-from matplotlib.colors import Normalize
+from matplotlib.colors import Normalize, to_rgba_array
 from sklearn.base import TransformerMixin
 
 
@@ -475,17 +475,11 @@ class DataVisualizer(MultiFeatureVisualizer):
             return [self._colors] * len(y)
 
         if self._target_color_type == TargetType.DISCRETE:
-            try:
-                # Use the label encoder to get the class name (or use the value
-                # if the label is not mapped in the encoder) then use the class
-                # name to get the color from the color map.
-                return [self._colors[self._label_encoder.get(yi, yi)] for yi in y]
-            except KeyError:
-                unknown = set(y) - set(self._label_encoder.keys())
-                unknown = ", ".join(["'{}'".format(uk) for uk in unknown])
-                raise YellowbrickKeyError(
-                    "could not determine color for classes {}".format(unknown)
-                )
+            # Fancy-index the colors of the classes with the encoded labels
+            colors = np.empty(len(self.classes_), dtype=object)
+            for idx, label in enumerate(self.classes_):
+                colors[idx] = self._colors[label]
+            return list(colors[self._encode_labels(y)])
 
         if self._target_color_type == TargetType.CONTINUOUS:
             # Normalize values into target range and compute colors from colormap
@@ -496,3 +490,80 @@ class DataVisualizer(MultiFeatureVisualizer):
         raise YellowbrickValueError(
             "unknown target color type '{}'".format(self._target_color_type)
         )
+
+    def get_rgba_colors(self, y):
+        """
+        Returns the colors for the specified value(s) of y as an RGBA array,
+        which can be passed directly to matplotlib. For discrete targets the
+        labels are encoded once and the colors are fancy-indexed from an array
+        of the class colors, avoiding a color lookup per instance.
+
+        Parameters
+        ----------
+        y : array-like
+            The values of y to get the associated colors for.
+
+        Returns
+        -------
+        colors : ndarray of shape (n, 4)
+            Returns the RGBA color for each value in y.
+        """
+        if self._colors is None:
+            raise NotFitted("cannot determine colors on unfitted visualizer")
+
+        if self._target_color_type == TargetType.SINGLE:
+            return np.repeat(to_rgba_array(self._colors)[:1], len(y), axis=0)
+
+        if self._target_color_type == TargetType.DISCRETE:
+            return self._class_rgba_colors()[self._encode_labels(y)]
+
+        if self._target_color_type == TargetType.CONTINUOUS:
+            norm = Normalize(*self.range_)
+            return self._colors(norm(np.asarray(y)))
+
+        # This is a developer error, we should never get here!
+        raise YellowbrickValueError(
+            "unknown target color type '{}'".format(self._target_color_type)
+        )
+
+    def _class_rgba_colors(self):
+        """
+        Returns an array of shape (n_classes, 4) of the RGBA colors of the
+        classes, ordered as ``classes_`` so it can be indexed by encoded labels.
+        """
+        return to_rgba_array([self._colors[label] for label in self.classes_])
+
+    def _encode_labels(self, y):
+        """
+        Encodes the values of a discrete target as the index of their class in
+        ``classes_``. The unique values are mapped with the label encoder (or
+        used directly if they are class names), so only one lookup is made per
+        class rather than per instance.
+        """
+        index = {label: idx for idx, label in enumerate(self.classes_)}
+
+        # Lists are not coerced so that mixed class names and values are kept
+        y = np.asarray(y) if hasattr(y, "dtype") else np.asarray(y, dtype=object)
+        try:
+            uniques, codes = np.unique(y, return_inverse=True)
+        except TypeError:
+            # Values that cannot be sorted (e.g. mixed types or None) are
+            # mapped with a dictionary in order of appearance instead
+            seen = {}
+            codes = np.array([seen.setdefault(yi, len(seen)) for yi in y.ravel()])
+            uniques = list(seen)
+
+        try:
+            mapping = np.array(
+                [index[self._label_encoder.get(yi, yi)] for yi in uniques], dtype=int
+            )
+        except KeyError:
+            unknown = [
+                yi for yi in uniques if self._label_encoder.get(yi, yi) not in index
+            ]
+            unknown = ", ".join(["'{}'".format(uk) for uk in unknown])
+            raise YellowbrickKeyError(
+                "could not determine color for classes {}".format(unknown)
+            )
+
+        return mapping[codes.ravel()]
@@ -12,8 +12,12 @@
 ## Imports
 ##########################################################################
 
+import numpy as np
+
 from yellowbrick.style import palettes
 from yellowbrick.features.base import FeatureVisualizer
+from yellowbrick.exceptions import YellowbrickValueError
+from yellowbrick.utils.moments import CoMoments, row_blocks, DEFAULT_BLOCK_SIZE
 
 from sklearn.pipeline import Pipeline
 from sklearn.decomposition import PCA
@@ -31,6 +35,8 @@ def explained_variance_visualizer(
     scale=True,
     center=True,
     colormap=palettes.DEFAULT_SEQUENCE,
+    solver="full",
+    block_size=DEFAULT_BLOCK_SIZE,
     **kwargs
 ):
     """Produce a plot of the explained variance produced by a dimensionality
@@ -57,6 +63,14 @@ def explained_variance_visualizer(
             Use either color to colorize the lines on a per class basis or
             colormap to color them on a continuous scale.
 
+        solver : str, default: 'full'
+            How the spectrum is computed: 'full' fits a full PCA, 'randomized' a
+            randomized top n_components SVD and 'covariance' the eigenvalues of the
+            covariance matrix accumulated over blocks of rows.
+
+        block_size : int, default: 4096
+            The number of rows accumulated at a time when solver='covariance'.
+
         kwargs : dict
             Keyword arguments that are passed to the base class and may influence
             the visualization as defined in other Visualizers.
@@ -76,10 +90,18 @@ def explained_variance_visualizer(
         """
 
     # Instantiate the visualizer
-    visualizer = ExplainedVariance(X=X)
+    visualizer = ExplainedVariance(
+        ax=ax,
+        scale=scale,
+        center=center,
+        colormap=colormap,
+        solver=solver,
+        block_size=block_size,
+        **kwargs
+    )
 
     # Fit and transform the visualizer (calls draw)
-    visualizer.fit(X, y, **kwargs)
+    visualizer.fit(X, y)
     visualizer.transform(X)
     visualizer.finalize()
 
@@ -108,10 +130,33 @@ class ExplainedVariance(FeatureVisualizer):
         Use either color to colorize the lines on a per class basis or
         colormap to color them on a continuous scale.
 
+    solver : str, default: 'full'
+        How the spectrum is computed: 'full' fits a full PCA and 'randomized' a
+        randomized SVD of the top n_components, both of which hold X in memory.
+        'covariance' accumulates the covariance matrix of X over blocks of rows and
+        computes its eigenvalues, so its memory only depends on the number of
+        features; with this solver X can be a memory map or be passed in chunks to
+        ``partial_fit``.
+
+    block_size : int, default: 4096
+        The number of rows accumulated at a time when solver='covariance'.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
 
+    Attributes
+    ----------
+    explained_variance_ : ndarray of shape (n_components,)
+        The variance explained by each of the components, in decreasing order.
+
+    total_variance_ : float
+        The total variance of the (scaled) data.
+
+    residual_variance_ : float
+        The variance that is not explained by the computed components, i.e. the
+        error of truncating the spectrum to n_components.
+
 
     Examples
     --------
@@ -123,6 +168,8 @@ class ExplainedVariance(FeatureVisualizer):
 
     """
 
+    SOLVERS = ("full", "randomized", "covariance")
+
     def __init__(
         self,
         ax=None,
@@ -130,39 +177,142 @@ class ExplainedVariance(FeatureVisualizer):
         center=True,
         n_components=None,
         colormap=palettes.DEFAULT_SEQUENCE,
+        solver="full",
+        block_size=DEFAULT_BLOCK_SIZE,
         **kwargs
     ):
 
         super(ExplainedVariance, self).__init__(ax=ax, **kwargs)
 
+        if solver not in self.SOLVERS:
+            raise YellowbrickValueError(
+                "'{}' is not a valid solver, use one of {}".format(
+                    solver, ", ".join(self.SOLVERS)
+                )
+            )
+
+        if solver == "randomized" and n_components is None:
+            raise YellowbrickValueError(
+                "n_components must be specified for the randomized solver"
+            )
+
         self.colormap = colormap
         self.n_components = n_components
         self.center = center
         self.scale = scale
+        self.solver = solver
+        self.block_size = block_size
         self.pipeline = Pipeline(
             [
                 ("scale", StandardScaler(with_mean=self.center, with_std=self.scale)),
-                ("pca", PCA(n_components=self.n_components)),
+                (
+                    "pca",
+                    PCA(
+                        n_components=self.n_components,
+                        svd_solver="randomized" if solver == "randomized" else "auto",
+                    ),
+                ),
             ]
         )
         self.pca_features = None
 
-    @property
-    def explained_variance_(self):
-        return self.pipeline.steps[-1][1].explained_variance_
-
     def fit(self, X, y=None):
-        self.pipeline.fit(X)
+        if self.solver == "covariance":
+            self.moments_ = CoMoments(row_blocks(X, self.block_size))
+            self._fit_spectrum()
+        else:
+            self.pipeline.fit(X)
+            pca = self.pipeline.steps[-1][1]
+            self.explained_variance_ = pca.explained_variance_
+            self.total_variance_ = self._total_variance(X)
+            self.residual_variance_ = max(
+                self.total_variance_ - self.explained_variance_.sum(), 0
+            )
+
         self.draw()
         return self
 
+    def _total_variance(self, X):
+        """
+        Computes the total (sample) variance of the scaled data from the fitted
+        scaler, rather than from a scaled copy of X.
+        """
+        scaler = self.pipeline.named_steps["scale"]
+        if scaler.with_std:
+            variances = scaler.var_ / scaler.scale_ ** 2
+        else:
+            # The scaler does not record the variance of the data it does not
+            # scale, so it is accumulated over blocks of rows instead.
+            scaler = StandardScaler()
+            for block in row_blocks(X, self.block_size):
+                scaler.partial_fit(block)
+            variances = scaler.var_
+
+        n = scaler.n_samples_seen_
+        return variances.sum() * n / (n - 1)
+
+    def partial_fit(self, X, y=None):
+        """
+        Accumulates a chunk of rows into the covariance matrix and redraws the
+        spectrum, only with solver='covariance'.
+        """
+        if self.solver != "covariance":
+            raise YellowbrickValueError(
+                "partial_fit requires solver='covariance' not '{}'".format(self.solver)
+            )
+
+        if not hasattr(self, "moments_"):
+            self.moments_ = CoMoments()
+
+        for block in row_blocks(X, self.block_size):
+            self.moments_.update(block)
+
+        self._fit_spectrum()
+        self.draw()
+        return self
+
+    def _fit_spectrum(self):
+        """
+        Computes the spectrum and the components from the accumulated moments. As
+        with the scaler in the pipeline, the features are scaled by their standard
+        deviation (without the degrees of freedom correction) if scale is True.
+        """
+        n = self.moments_.n_samples_
+        cov = self.moments_.covariance()
+
+        self.mean_ = self.moments_.mean_
+        self.scale_ = np.ones_like(self.mean_)
+        if self.scale:
+            std = np.sqrt(np.diag(self.moments_.comoment_) / n)
+            self.scale_[std > 0] = std[std > 0]
+            cov = cov / np.outer(self.scale_, self.scale_)
+
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        order = np.argsort(eigvals)[::-1][: self.n_components]
+
+        self.explained_variance_ = np.clip(eigvals[order], 0, None)
+        self.components_ = eigvecs[:, order].T
+        self.total_variance_ = np.trace(cov)
+        self.residual_variance_ = max(
+            self.total_variance_ - self.explained_variance_.sum(), 0
+        )
+
     def transform(self, X):
-        self.pca_features = self.pipeline.transform(X)
+        if self.solver == "covariance":
+            X = (np.asarray(X, dtype=float) - self.mean_) / self.scale_
+            self.pca_features = X @ self.components_.T
+        else:
+            self.pca_features = self.pipeline.transform(X)
         return self.pca_features
 
     def draw(self):
         X = self.explained_variance_
-        self.ax.plot(X)
+
+        # Replace the curve drawn for previously accumulated chunks
+        if getattr(self, "_line", None) is not None:
+            self._line.remove()
+
+        self._line, = self.ax.plot(X)
         return self.ax
 
     def finalize(self, **kwargs):
@@ -26,6 +26,7 @@ from .base import FeatureVisualizer
 
 # from ..bestfit import draw_best_fit # TODO: return in #728
 from ..utils.types import is_dataframe
+from ..utils.moments import CoMoments
 from ..exceptions import YellowbrickValueError
 from scipy.stats import pearsonr, spearmanr, kendalltau
 
@@ -90,9 +91,13 @@ class JointPlot(FeatureVisualizer):
         The algorithm used to compute the relationship between the variables in the
         joint plot, one of: 'pearson', 'covariance', 'spearman', 'kendalltau'.
 
-    kind : str in {'scatter', 'hex'}, default: 'scatter'
+    kind : str in {'scatter', 'hex', 'binned'}, default: 'scatter'
         The type of plot to render in the joint axes. Note that when kind='hex' the
-        target cannot be plotted by color.
+        target cannot be plotted by color. When kind='binned' the data is counted in
+        a 2D histogram grid that is drawn as a mesh, the marginal histograms are the
+        sums of the same counts and the correlation is accumulated in a single pass,
+        so only the 'pearson' and 'covariance' correlations are supported. Binned
+        plots can be built from chunks of data using ``partial_fit``.
 
     hist : {True, False, None, 'density', 'frequency'}, default: True
         Draw histograms showing the distribution of the variables plotted jointly.
@@ -104,6 +109,14 @@ class JointPlot(FeatureVisualizer):
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    bins : int or (int, int), default: 50
+        The number of bins of the grid along each axis when kind='binned'.
+
+    bin_range : ((float, float), (float, float)), default: None
+        The ((xmin, xmax), (ymin, ymax)) range of the grid when kind='binned'. If None
+        the range of the first data passed to ``fit`` or ``partial_fit`` is used, later
+        values outside of the range are not counted.
+
     {joint, hist}_kws : dict, default: None
         Additional keyword arguments for the plot components.
 
@@ -117,6 +130,12 @@ class JointPlot(FeatureVisualizer):
         The correlation or relationship of the data in the joint plot, specified by the
         correlation algorithm.
 
+    counts_ : ndarray of shape (n_xbins, n_ybins)
+        The number of instances in each cell of the grid, only when kind='binned'.
+
+    xedges_, yedges_ : ndarray
+        The edges of the bins of the grid along each axis, only when kind='binned'.
+
     Examples
     --------
 
@@ -133,6 +152,12 @@ class JointPlot(FeatureVisualizer):
         "kendalltau": lambda x, y: kendalltau(x, y)[0],
     }
 
+    # Correlations that can be computed from the accumulated moments
+    binned_correlations = {
+        "pearson": lambda moments: moments.correlation()[0, 1],
+        "covariance": lambda moments: moments.covariance()[0, 1],
+    }
+
     def __init__(
         self,
         ax=None,
@@ -141,6 +166,8 @@ class JointPlot(FeatureVisualizer):
         kind="scatter",
         hist=True,
         alpha=0.65,
+        bins=50,
+        bin_range=None,
         joint_kws=None,
         hist_kws=None,
         **kwargs
@@ -172,10 +199,18 @@ class JointPlot(FeatureVisualizer):
 
         # Set and validate the kind of plot
         self.kind = kind
-        if self.kind not in {"scatter", "hex", "hexbin"}:
+        if self.kind not in {"scatter", "hex", "hexbin", "binned"}:
+            raise YellowbrickValueError(
+                (
+                    "'{}' is invalid joint plot kind, use 'scatter', 'hex' or 'binned'"
+                ).format(self.kind)
+            )
+
+        # Binned plots accumulate the correlation from the moments in one pass
+        if self.kind == "binned" and self.correlation not in self.binned_correlations:
             raise YellowbrickValueError(
-                ("'{}' is invalid joint plot kind, use 'scatter' or 'hex'").format(
-                    self.kind
+                "'{}' correlation cannot be computed for binned plots, use {}".format(
+                    self.correlation, " or ".join(self.binned_correlations)
                 )
             )
 
@@ -195,9 +230,15 @@ class JointPlot(FeatureVisualizer):
 
         # Set the additional visual parameters
         self.alpha = alpha
+        self.bins = bins
+        self.bin_range = bin_range
         self.joint_kws = joint_kws
         self.hist_kws = hist_kws
 
+        # Internal state of binned plots
+        self._moments = None
+        self._binned_artists = []
+
     @property
     def xhax(self):
         """
@@ -275,6 +316,42 @@ class JointPlot(FeatureVisualizer):
             An vector or 1D array that has the same length as X. May be used to either
             directly plot data or to color data points.
         """
+        # Reset the grid of binned plots
+        self._moments = None
+
+        x, y, labels = self._select_columns(X, y)
+        self.draw(x, y, **labels)
+        return self
+
+    def partial_fit(self, X, y=None):
+        """
+        Adds a chunk of data to the counts and the correlation of a binned joint plot
+        and redraws it, so that the joint plot of columns that do not fit in memory can
+        be drawn one chunk at a time. The columns are selected as in ``fit``; if the
+        ``bin_range`` is not specified it is fixed by the first chunk.
+
+        Parameters
+        ----------
+        X : array-like
+            An array-like object of either 1 or 2 dimensions depending on self.columns.
+
+        y : array-like, default: None
+            An vector or 1D array that has the same length as X.
+        """
+        if self.kind != "binned":
+            raise YellowbrickValueError(
+                "partial_fit requires kind='binned' not '{}'".format(self.kind)
+            )
+
+        x, y, labels = self._select_columns(X, y)
+        self.draw(x, y, **labels)
+        return self
+
+    def _select_columns(self, X, y=None):
+        """
+        Selects the data for the x and y axes of the joint plot as described in
+        ``fit``, returning x, y and a dict with the labels of the axes.
+        """
         # Convert python objects to numpy arrays
         if isinstance(X, (list, tuple)):
             X = np.array(X)
@@ -296,12 +373,10 @@ class JointPlot(FeatureVisualizer):
 
             if y is None:
                 # Draw the first column as x and the second column as y
-                self.draw(X[:, 0], X[:, 1], xlabel="0", ylabel="1")
-                return self
+                return X[:, 0], X[:, 1], {"xlabel": "0", "ylabel": "1"}
 
             # Draw x against y
-            self.draw(X, y, xlabel="x", ylabel="y")
-            return self
+            return X, y, {"xlabel": "x", "ylabel": "y"}
 
         # Case where a single string or int index is specified
         if isinstance(self.columns, (int, str)):
@@ -312,8 +387,7 @@ class JointPlot(FeatureVisualizer):
 
             # fetch the index from X -- raising index error if not possible
             x = self._index_into(self.columns, X)
-            self.draw(x, y, xlabel=str(self.columns), ylabel="target")
-            return self
+            return x, y, {"xlabel": str(self.columns), "ylabel": "target"}
 
         # Case where there is a double index for both columns
         columns = tuple(self.columns)
@@ -327,8 +401,7 @@ class JointPlot(FeatureVisualizer):
         # TODO: color the points based on the target if it is given
         x = self._index_into(columns[0], X)
         y = self._index_into(columns[1], X)
-        self.draw(x, y, xlabel=str(columns[0]), ylabel=str(columns[1]))
-        return self
+        return x, y, {"xlabel": str(columns[0]), "ylabel": str(columns[1])}
 
     def draw(self, x, y, xlabel=None, ylabel=None):
         """
@@ -342,6 +415,10 @@ class JointPlot(FeatureVisualizer):
         xlabel, ylabel : str
             The labels for the x and y axes.
         """
+        # Binned plots are drawn from the accumulated counts
+        if self.kind == "binned":
+            return self.draw_binned(x, y, xlabel=xlabel, ylabel=ylabel)
+
         # This is a little weird to be here, but it is the best place to perform
         # this computation given how fit calls draw and returns.
         self.corr_ = self.correlation_methods[self.correlation](x, y)
@@ -391,6 +468,99 @@ class JointPlot(FeatureVisualizer):
         plt.sca(self.ax)
         return self.ax
 
+    def draw_binned(self, x, y, xlabel=None, ylabel=None):
+        """
+        Adds x and y to the counts of the grid and to the moments of the binned plot,
+        then draws the grid as a mesh and the marginal histograms as the row and column
+        sums of the counts, so that the data is only binned once.
+
+        Parameters
+        ----------
+        x, y : 1D array-like
+            The data to add to the counts for the x axis and the y axis
+
+        xlabel, ylabel : str
+            The labels for the x and y axes.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+
+        # Fix the edges of the grid with the first data that is seen
+        if self._moments is None:
+            self.xedges_, self.yedges_ = self._bin_edges(x, y)
+            self.counts_ = np.zeros((len(self.xedges_) - 1, len(self.yedges_) - 1))
+            self._moments = CoMoments()
+
+        # Accumulate the counts and the moments in a single pass over the data
+        counts, _, _ = np.histogram2d(x, y, bins=(self.xedges_, self.yedges_))
+        self.counts_ += counts
+        self._moments.update(np.column_stack((x, y)))
+        self.corr_ = self.binned_correlations[self.correlation](self._moments)
+
+        # Remove the artists of previously drawn chunks
+        for artist in self._binned_artists:
+            artist.remove()
+        self._binned_artists = []
+
+        # Draw the grid with the empty cells masked out
+        joint_kws = dict(self.joint_kws or {})
+        joint_kws.setdefault("alpha", self.alpha)
+        joint_kws.setdefault("cmap", "Blues")
+        mesh = self.ax.pcolormesh(
+            self.xedges_,
+            self.yedges_,
+            np.ma.masked_equal(self.counts_.T, 0),
+            **joint_kws
+        )
+        self._binned_artists.append(mesh)
+
+        # Set the X and Y axis labels on the plot
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+
+        # Draw the marginal histograms from the sums of the counts
+        if self.hist:
+            hist_kws = dict(self.hist_kws or {})
+            hist_kws.pop("bins", None)
+            if self.hist == "density":
+                hist_kws.setdefault("density", True)
+
+            _, _, xpatches = self.xhax.hist(
+                self.xedges_[:-1],
+                bins=self.xedges_,
+                weights=self.counts_.sum(axis=1),
+                **hist_kws
+            )
+            _, _, ypatches = self.yhax.hist(
+                self.yedges_[:-1],
+                bins=self.yedges_,
+                weights=self.counts_.sum(axis=0),
+                orientation="horizontal",
+                **hist_kws
+            )
+            self._binned_artists.extend([xpatches, ypatches])
+
+        # Ensure the current axes is always the main joint plot axes
+        plt.sca(self.ax)
+        return self.ax
+
+    def _bin_edges(self, x, y):
+        """
+        Computes the edges of the grid from the bins and the bin_range, or from the
+        range of x and y if the bin_range is not specified.
+        """
+        bins = self.bins
+        if isinstance(bins, int):
+            bins = (bins, bins)
+
+        bin_range = self.bin_range
+        if bin_range is None:
+            bin_range = (None, None)
+
+        xedges = np.histogram_bin_edges(x, bins=bins[0], range=bin_range[0])
+        yedges = np.histogram_bin_edges(y, bins=bins[1], range=bin_range[1])
+        return xedges, yedges
+
     def finalize(self, **kwargs):
         """
         Finalize executes any remaining image modifications making it ready to show.
@@ -456,6 +626,8 @@ def joint_plot(
         kind="scatter",
         hist=True,
         alpha=0.65,
+        bins=50,
+        bin_range=None,
         joint_kws=None,
         hist_kws=None,
         show=True,
@@ -513,9 +685,13 @@ def joint_plot(
         The algorithm used to compute the relationship between the variables in the
         joint plot, one of: 'pearson', 'covariance', 'spearman', 'kendalltau'.
 
-    kind : str in {'scatter', 'hex'}, default: 'scatter'
+    kind : str in {'scatter', 'hex', 'binned'}, default: 'scatter'
         The type of plot to render in the joint axes. Note that when kind='hex' the
-        target cannot be plotted by color.
+        target cannot be plotted by color. When kind='binned' the data is counted in
+        a 2D histogram grid that is drawn as a mesh, the marginal histograms are the
+        sums of the same counts and the correlation is accumulated in a single pass,
+        so only the 'pearson' and 'covariance' correlations are supported. Binned
+        plots can be built from chunks of data using ``partial_fit``.
 
     hist : {True, False, None, 'density', 'frequency'}, default: True
         Draw histograms showing the distribution of the variables plotted jointly.
@@ -527,6 +703,14 @@ def joint_plot(
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    bins : int or (int, int), default: 50
+        The number of bins of the grid along each axis when kind='binned'.
+
+    bin_range : ((float, float), (float, float)), default: None
+        The ((xmin, xmax), (ymin, ymax)) range of the grid when kind='binned'. If None
+        the range of the first data passed to ``fit`` or ``partial_fit`` is used, later
+        values outside of the range are not counted.
+
     {joint, hist}_kws : dict, default: None
         Additional keyword arguments for the plot components.
 
@@ -552,6 +736,8 @@ def joint_plot(
         kind=kind,
         hist=hist,
         alpha=alpha,
+        bins=bins,
+        bin_range=bin_range,
         joint_kws=joint_kws,
         hist_kws=hist_kws,
         **kwargs
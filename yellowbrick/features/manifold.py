@@ -18,15 +18,19 @@ Use manifold algorithms for high dimensional visualization.
 ##########################################################################
 
 import warnings
+import numpy as np
 
 from yellowbrick.utils.timer import Timer
+from yellowbrick.utils.cache import fingerprint, resolve_cache
 from yellowbrick.utils.types import is_estimator
 from yellowbrick.exceptions import ModelError, NotFitted
 from yellowbrick.features.projection import ProjectionVisualizer
 from yellowbrick.exceptions import YellowbrickValueError, YellowbrickWarning
 
 from sklearn.base import clone
+from sklearn.utils import check_random_state
 from sklearn.exceptions import NotFittedError
+from sklearn.neighbors import NearestNeighbors
 from sklearn.manifold import LocallyLinearEmbedding
 from sklearn.manifold import Isomap, MDS, TSNE, SpectralEmbedding
 
@@ -170,6 +174,24 @@ class Manifold(ProjectionVisualizer):
         If the target_type is "continous" draw a colorbar to the right of the
         scatter plot. The colobar axes is accessible using the cax property.
 
+    landmarks : int or float, default: None
+        If specified, only a random sample of landmark instances is embedded by
+        the manifold and every other instance is placed by interpolating the
+        embedding of its nearest landmarks with barycentric weights. If an int,
+        the number of landmarks, if a float the fraction of instances to use.
+        Landmark mode allows manifolds without ``transform`` (e.g. t-SNE or
+        MDS) to transform new data and large datasets to be embedded in time
+        that only grows quadratically with the number of landmarks.
+
+    landmark_neighbors : int, default: 10
+        The number of nearest landmarks used to interpolate an instance.
+
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding, so that fitting the same data with
+        the same manifold and landmark parameters skips straight to drawing. A
+        fitted manifold (or landmarks) is not available after a cache hit. See
+        ``EmbeddingCache`` for the accepted values.
+
     kwargs : dict
         Keyword arguments passed to the base class and may influence the
         feature visualization properties.
@@ -246,6 +268,9 @@ class Manifold(ProjectionVisualizer):
         alpha=0.75,
         random_state=None,
         colorbar=True,
+        landmarks=None,
+        landmark_neighbors=10,
+        cache=None,
         **kwargs
     ):
 
@@ -266,6 +291,9 @@ class Manifold(ProjectionVisualizer):
 
         self.n_neighbors = n_neighbors
         self.random_state = random_state
+        self.landmarks = landmarks
+        self.landmark_neighbors = landmark_neighbors
+        self.cache = cache
         self.manifold = manifold  # must be set last
 
     @property
@@ -355,7 +383,7 @@ class Manifold(ProjectionVisualizer):
             Returns the visualizer object.
 
         """
-        if not hasattr(self.manifold, "transform"):
+        if self.landmarks is None and not hasattr(self.manifold, "transform"):
             name = self.manifold.__class__.__name__
             raise ModelError(
                 (
@@ -367,7 +395,10 @@ class Manifold(ProjectionVisualizer):
         # Call super to compute features, classes, colors, etc.
         super(Manifold, self).fit(X, y)
         with Timer() as self.fit_time_:
-            self.manifold.fit(X)
+            if self.landmarks is not None:
+                self._fit_landmarks(X)
+            else:
+                self.manifold.fit(X)
         return self
 
     def fit_transform(self, X, y=None, **kwargs):
@@ -400,8 +431,32 @@ class Manifold(ProjectionVisualizer):
 
         # Call super fit to compute features, classes, colors, etc.
         super(Manifold, self).fit(X, y)
+
+        # Fingerprint the data and manifold to look up a cached embedding
+        cache = resolve_cache(self.cache)
+        if cache is not None:
+            self.cache_key_ = fingerprint(
+                X,
+                self.manifold,
+                landmarks=self.landmarks,
+                landmark_neighbors=self.landmark_neighbors,
+                random_state=self.random_state,
+            )
+
+        # On a cache hit the fit time is the time to load the embedding
         with Timer() as self.fit_time_:
-            Xp = self.manifold.fit_transform(X)
+            Xp = cache.get(self.cache_key_) if cache is not None else None
+            if Xp is None:
+                if self.landmarks is not None:
+                    indices = self._fit_landmarks(X)
+                    Xp = self._interpolate(X)
+                    Xp[indices] = self.landmark_embedding_
+                else:
+                    Xp = self.manifold.fit_transform(X)
+
+                if cache is not None:
+                    cache.set(self.cache_key_, Xp)
+
         self.draw(Xp, y)
         return Xp
 
@@ -425,8 +480,16 @@ class Manifold(ProjectionVisualizer):
         Note
         ----
         This method does not work with MDS, TSNE and SpectralEmbedding because
-        it is yet to be implemented in sklearn.
+        it is yet to be implemented in sklearn, unless landmarks are used.
         """
+        # In landmark mode new data is interpolated from the landmark embedding
+        if self.landmarks is not None:
+            if not hasattr(self, "landmark_embedding_"):
+                raise NotFitted.from_estimator(self, "transform")
+            Xp = self._interpolate(X)
+            self.draw(Xp, y)
+            return Xp
+
         # Because some manifolds do not have transform we cannot call super
         try:
             Xp = self.manifold.transform(X)
@@ -445,6 +508,74 @@ class Manifold(ProjectionVisualizer):
 
         return Xp
 
+    def _fit_landmarks(self, X):
+        """
+        Samples the landmarks from X, embeds them with the manifold and indexes
+        them for nearest neighbor queries. Returns the indices of the landmarks.
+        """
+        X = np.asarray(X)
+        n_samples = X.shape[0]
+
+        if isinstance(self.landmarks, float):
+            if not 0 < self.landmarks <= 1:
+                raise YellowbrickValueError(
+                    "landmarks fraction must be between 0 and 1"
+                )
+            n_landmarks = int(self.landmarks * n_samples)
+        else:
+            n_landmarks = min(int(self.landmarks), n_samples)
+
+        n_neighbors = min(self.landmark_neighbors, n_landmarks)
+        if n_landmarks <= self.projection or n_neighbors < 1:
+            raise YellowbrickValueError(
+                "at least {} landmarks are required, {} were sampled".format(
+                    self.projection + 1, n_landmarks
+                )
+            )
+
+        rng = check_random_state(self.random_state)
+        indices = np.sort(rng.choice(n_samples, n_landmarks, replace=False))
+
+        self.landmarks_ = X[indices]
+        self.landmark_embedding_ = self.manifold.fit_transform(self.landmarks_)
+        self._landmark_index = NearestNeighbors(n_neighbors=n_neighbors)
+        self._landmark_index.fit(self.landmarks_)
+        return indices
+
+    def _interpolate(self, X, reg=1e-3, block_size=10000):
+        """
+        Places the instances of X in the embedding as the barycentric
+        combination of the embedding of their nearest landmarks. The weights
+        best reconstruct each instance from its landmarks and sum to one (as
+        in locally linear embedding), computed in blocks of rows. Instances
+        that coincide with a landmark are placed at its embedding.
+        """
+        X = np.asarray(X, dtype=float)
+        Xp = np.empty((X.shape[0], self.landmark_embedding_.shape[1]))
+
+        for start in range(0, X.shape[0], block_size):
+            block = X[start : start + block_size]
+            distances, indices = self._landmark_index.kneighbors(block)
+
+            # Solve the regularized local Gram system of every instance at once
+            Z = self.landmarks_[indices] - block[:, np.newaxis, :]
+            G = Z @ Z.transpose(0, 2, 1)
+            trace = np.trace(G, axis1=1, axis2=2)
+            R = np.where(trace > 0, reg * trace, reg)
+            G += np.eye(indices.shape[1]) * R[:, np.newaxis, np.newaxis]
+
+            weights = np.linalg.solve(G, np.ones(indices.shape + (1,)))[..., 0]
+            weights /= weights.sum(axis=1, keepdims=True)
+
+            Xb = np.einsum("nk,nkd->nd", weights, self.landmark_embedding_[indices])
+
+            # Instances that coincide with a landmark are placed on it
+            exact = distances[:, 0] == 0
+            Xb[exact] = self.landmark_embedding_[indices[exact, 0]]
+            Xp[start : start + block_size] = Xb
+
+        return Xp
+
     def draw(self, Xp, y=None):
         # Calls draw method from super class which draws scatter plot.
         super(Manifold, self).draw(Xp, y)
@@ -484,6 +615,9 @@ def manifold_embedding(
     alpha=0.75,
     random_state=None,
     colorbar=True,
+    landmarks=None,
+    landmark_neighbors=10,
+    cache=None,
     show=True,
     **kwargs
 ):
@@ -576,6 +710,24 @@ def manifold_embedding(
         If the target_type is "continous" draw a colorbar to the right of the
         scatter plot. The colobar axes is accessible using the cax property.
 
+    landmarks : int or float, default: None
+        If specified, only a random sample of landmark instances is embedded by
+        the manifold and every other instance is placed by interpolating the
+        embedding of its nearest landmarks with barycentric weights. If an int,
+        the number of landmarks, if a float the fraction of instances to use.
+        Landmark mode allows manifolds without ``transform`` (e.g. t-SNE or
+        MDS) to transform new data and large datasets to be embedded in time
+        that only grows quadratically with the number of landmarks.
+
+    landmark_neighbors : int, default: 10
+        The number of nearest landmarks used to interpolate an instance.
+
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding, so that fitting the same data with
+        the same manifold and landmark parameters skips straight to drawing. A
+        fitted manifold (or landmarks) is not available after a cache hit. See
+        ``EmbeddingCache`` for the accepted values.
+
     show: bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -604,6 +756,9 @@ def manifold_embedding(
         alpha=alpha,
         random_state=random_state,
         colorbar=colorbar,
+        landmarks=landmarks,
+        landmark_neighbors=landmark_neighbors,
+        cache=cache,
         **kwargs
     )
 
@@ -22,6 +22,7 @@ Decomposition based feature visualization with PCA.
 
 # NOTE: must import mplot3d to load the 3D projection
 import numpy as np
+import scipy.sparse as sp
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
@@ -29,8 +30,10 @@ from yellowbrick.style import palettes
 from yellowbrick.features.projection import ProjectionVisualizer
 from yellowbrick.exceptions import YellowbrickValueError, NotFitted
 
+from sklearn.base import clone
 from sklearn.pipeline import Pipeline
 from sklearn.decomposition import PCA as PCATransformer
+from sklearn.decomposition import IncrementalPCA, TruncatedSVD
 from sklearn.preprocessing import StandardScaler
 from sklearn.exceptions import NotFittedError
 
@@ -111,6 +114,21 @@ class PCA(ProjectionVisualizer):
         Also draws a colorbar for readability purpose. The heatmap is accessible
         using lax property and colorbar using uax property.
 
+    solver : string, default: "auto"
+        The decomposition used to compute the principal components. "auto",
+        "full" and "randomized" select the SVD solver of scikit-learn's PCA,
+        where "randomized" computes only the top components with a randomized
+        SVD. "incremental" uses ``IncrementalPCA`` to fit the data in batches
+        of ``batch_size`` rows and enables ``partial_fit`` over chunks of
+        data. "truncated" uses ``TruncatedSVD``, which does not center the
+        data and so works directly on sparse matrices; it is selected by
+        "auto" if X is sparse, in which case the data is not centered when
+        scaled so that no dense copy of X is made.
+
+    batch_size : int, default: None
+        The number of rows in each batch of the "incremental" solver, if None
+        it is inferred from the number of features.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
@@ -148,6 +166,8 @@ class PCA(ProjectionVisualizer):
 
     """
 
+    SOLVERS = ("auto", "full", "randomized", "incremental", "truncated")
+
     def __init__(
         self,
         ax=None,
@@ -162,6 +182,8 @@ class PCA(ProjectionVisualizer):
         random_state=None,
         colorbar=True,
         heatmap=False,
+        solver="auto",
+        batch_size=None,
         **kwargs
     ):
         super(PCA, self).__init__(
@@ -180,13 +202,19 @@ class PCA(ProjectionVisualizer):
         self.scale = scale
         self.proj_features = proj_features
 
+        # Validate the solver argument
+        if solver not in self.SOLVERS:
+            raise YellowbrickValueError(
+                "'{}' is not a valid solver, use one of {}".format(
+                    solver, ", ".join(self.SOLVERS)
+                )
+            )
+
         # Create the PCA transformer
-        self.pca_transformer = Pipeline(
-            [
-                ("scale", StandardScaler(with_std=self.scale)),
-                ("pca", PCATransformer(self.projection, random_state=random_state)),
-            ]
-        )
+        self.solver = solver
+        self.batch_size = batch_size
+        self._random_state = random_state
+        self.pca_transformer = self._make_transformer()
         self.alpha = alpha
 
         # Visual Parameters
@@ -200,7 +228,6 @@ class PCA(ProjectionVisualizer):
             raise YellowbrickValueError(
                 "heatmap and colorbar are not compatible with 3d projections"
             )
-        self._random_state = random_state
 
     @property
     def random_state(self):
@@ -209,7 +236,47 @@ class PCA(ProjectionVisualizer):
     @random_state.setter
     def random_state(self, val):
         self._random_state = val
-        self.pca_transformer.set_params(pca__random_state=val)
+        if "random_state" in self.pca_transformer.named_steps["pca"].get_params():
+            self.pca_transformer.set_params(pca__random_state=val)
+
+    def _make_transformer(self, sparse=False):
+        """
+        Creates the scaling and decomposition pipeline for the solver. Sparse
+        data is not centered by the scaler and is decomposed with TruncatedSVD
+        when the solver is "auto" so that it is never densified.
+        """
+        self._transformer_key = (self.solver, self.batch_size, sparse)
+
+        solver = self.solver
+        if solver == "auto" and sparse:
+            solver = "truncated"
+
+        if solver == "truncated":
+            decomposition = TruncatedSVD(
+                self.projection, random_state=self.random_state
+            )
+        elif solver == "incremental":
+            decomposition = IncrementalPCA(self.projection, batch_size=self.batch_size)
+        else:
+            decomposition = PCATransformer(
+                self.projection, svd_solver=solver, random_state=self.random_state
+            )
+
+        return Pipeline(
+            [
+                ("scale", StandardScaler(with_mean=not sparse, with_std=self.scale)),
+                ("pca", decomposition),
+            ]
+        )
+
+    def _check_transformer(self, sparse=False):
+        """
+        Recreates the pipeline only if the solver, the batch size or the sparsity
+        of the data have changed since it was created, so that any changes made
+        to the pipeline by the user are kept.
+        """
+        if self._transformer_key != (self.solver, self.batch_size, sparse):
+            self.pca_transformer = self._make_transformer(sparse=sparse)
 
     @property
     def uax(self):
@@ -293,10 +360,55 @@ class PCA(ProjectionVisualizer):
         """
         # Call super fit to compute features, classes, colors, etc.
         super(PCA, self).fit(X=X, y=y, **kwargs)
+        self._check_transformer(sparse=sp.issparse(X))
         self.pca_transformer.fit(X)
         self.pca_components_ = self.pca_transformer.named_steps["pca"].components_
         return self
 
+    def partial_fit(self, X, y=None, **kwargs):
+        """
+        Incrementally fits the scaler and the "incremental" solver on a chunk
+        of X, so that data that does not fit into memory can be decomposed one
+        chunk at a time and then drawn by calling ``transform`` on each chunk.
+        The features, classes and colors are determined from the first chunk.
+
+        Parameters
+        ----------
+        X : ndarray, sparse matrix or DataFrame of shape n x m
+            A chunk of n instances with m features, sparse chunks are
+            densified one at a time.
+
+        y : ndarray or Series of length n
+            An array or series of target or class values.
+
+        Returns
+        -------
+        self : visualizer
+            Returns self for use in Pipelines.
+        """
+        if self.solver != "incremental":
+            raise YellowbrickValueError(
+                "partial_fit requires the 'incremental' solver not '{}'".format(
+                    self.solver
+                )
+            )
+
+        if sp.issparse(X):
+            X = X.toarray()
+
+        # The first chunk determines the features, classes, colors, etc.
+        if not hasattr(self, "pca_components_"):
+            super(PCA, self).fit(X=X, y=y, **kwargs)
+            self._check_transformer()
+            self.pca_transformer = clone(self.pca_transformer)
+
+        scaler = self.pca_transformer.named_steps["scale"]
+        decomposition = self.pca_transformer.named_steps["pca"]
+        decomposition.partial_fit(scaler.partial_fit(X).transform(X))
+
+        self.pca_components_ = decomposition.components_
+        return self
+
     def transform(self, X, y=None, **kwargs):
         """
         Calls the internal `transform` method of the scikit-learn PCA transformer, which
@@ -478,6 +590,8 @@ def pca_decomposition(
     random_state=None,
     colorbar=True,
     heatmap=False,
+    solver="auto",
+    batch_size=None,
     show=True,
     **kwargs
 ):
@@ -558,6 +672,21 @@ def pca_decomposition(
         Also draws a colorbar for readability purpose. The heatmap is accessible
         using lax property and colorbar using uax property.
 
+    solver : string, default: "auto"
+        The decomposition used to compute the principal components. "auto",
+        "full" and "randomized" select the SVD solver of scikit-learn's PCA,
+        where "randomized" computes only the top components with a randomized
+        SVD. "incremental" uses ``IncrementalPCA`` to fit the data in batches
+        of ``batch_size`` rows and enables ``partial_fit`` over chunks of
+        data. "truncated" uses ``TruncatedSVD``, which does not center the
+        data and so works directly on sparse matrices; it is selected by
+        "auto" if X is sparse, in which case the data is not centered when
+        scaled so that no dense copy of X is made.
+
+    batch_size : int, default: None
+        The number of rows in each batch of the "incremental" solver, if None
+        it is inferred from the number of features.
+
     show : bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -611,6 +740,8 @@ def pca_decomposition(
         random_state=random_state,
         colorbar=colorbar,
         heatmap=heatmap,
+        solver=solver,
+        batch_size=batch_size,
         **kwargs
     )
 
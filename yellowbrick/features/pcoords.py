@@ -21,12 +21,16 @@ Implementation of parallel coordinates for multi-dimensional feature analysis.
 import numpy as np
 
 from numpy.random import RandomState
+from matplotlib.colors import to_rgba_array
+from matplotlib.collections import LineCollection
+from sklearn.base import clone
 from sklearn.preprocessing import MinMaxScaler, MaxAbsScaler
 from sklearn.preprocessing import Normalizer, StandardScaler
 
 from yellowbrick.draw import manual_legend
 from yellowbrick.features.base import DataVisualizer
 from yellowbrick.utils import is_dataframe, is_series
+from yellowbrick.utils.target import TargetType
 from yellowbrick.exceptions import YellowbrickTypeError, YellowbrickValueError
 
 
@@ -48,6 +52,8 @@ def parallel_coordinates(
     colormap=None,
     alpha=None,
     fast=False,
+    density=False,
+    resolution=(64, 256),
     vlines=True,
     vlines_kwds=None,
     show=True,
@@ -112,7 +118,8 @@ def parallel_coordinates(
     alpha : float, default: None
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered lines more visible.
-        If None, the alpha is set to 0.5 in "fast" mode and 0.25 otherwise.
+        If None, the alpha is set to 0.5 in "fast" mode, 1.0 in "density" mode
+        and 0.25 otherwise.
 
     fast : bool, default: False
         Fast mode improves the performance of the drawing time of parallel
@@ -120,6 +127,19 @@ def parallel_coordinates(
         instances in the same class. Fast mode should be used when drawing all
         instances is too burdensome and sampling is not an option.
 
+    density : bool or str, default: False
+        Density mode accumulates every line segment into a per-class count
+        buffer at pixel resolution and renders the buffer as an image, so that
+        the drawing time does not depend on the number of instances and no
+        instances have to be sampled away. The opacity of each pixel is scaled
+        by the number of lines that pass through it; if "log" or True the
+        counts are log scaled, if "linear" they are linearly scaled. Density
+        mode takes precedence over fast mode.
+
+    resolution : tuple of int, default: (64, 256)
+        The (horizontal, vertical) number of pixels of the density buffer, the
+        horizontal resolution is the number of pixels between adjacent axes.
+
     vlines : boolean, default: True
         flag to determine vertical line display
 
@@ -153,6 +173,8 @@ def parallel_coordinates(
         colormap=colormap,
         alpha=alpha,
         fast=fast,
+        density=density,
+        resolution=resolution,
         vlines=vlines,
         vlines_kwds=vlines_kwds,
         **kwargs
@@ -235,7 +257,8 @@ class ParallelCoordinates(DataVisualizer):
     alpha : float, default: None
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered lines more visible.
-        If None, the alpha is set to 0.5 in "fast" mode and 0.25 otherwise.
+        If None, the alpha is set to 0.5 in "fast" mode, 1.0 in "density" mode
+        and 0.25 otherwise.
 
     fast : bool, default: False
         Fast mode improves the performance of the drawing time of parallel
@@ -243,6 +266,19 @@ class ParallelCoordinates(DataVisualizer):
         instances in the same class. Fast mode should be used when drawing all
         instances is too burdensome and sampling is not an option.
 
+    density : bool or str, default: False
+        Density mode accumulates every line segment into a per-class count
+        buffer at pixel resolution and renders the buffer as an image, so that
+        the drawing time does not depend on the number of instances and no
+        instances have to be sampled away. The opacity of each pixel is scaled
+        by the number of lines that pass through it; if "log" or True the
+        counts are log scaled, if "linear" they are linearly scaled. Density
+        mode takes precedence over fast mode.
+
+    resolution : tuple of int, default: (64, 256)
+        The (horizontal, vertical) number of pixels of the density buffer, the
+        horizontal resolution is the number of pixels between adjacent axes.
+
     vlines : boolean, default: True
         flag to determine vertical line display
 
@@ -269,6 +305,14 @@ class ParallelCoordinates(DataVisualizer):
         available if the target type is discrete. This is guaranteed to be
         strings even if the classes are a different type.
 
+    density_ : ndarray, shape (n_classes, height, width)
+        The number of lines of each class that pass through each pixel of the
+        density buffer. Only available in density mode.
+
+    density_range_ : (min, max)
+        The range of the (normalized) feature values spanned by the vertical
+        pixels of the density buffer. Only available in density mode.
+
     Examples
     --------
 
@@ -286,6 +330,11 @@ class ParallelCoordinates(DataVisualizer):
         "l2": Normalizer("l2"),
     }
 
+    DENSITY_SCALES = (False, True, "log", "linear")
+
+    # Maximum number of interpolated points held in memory when counting lines
+    DENSITY_BLOCK_SIZE = 2 ** 20
+
     def __init__(
         self,
         ax=None,
@@ -299,6 +348,8 @@ class ParallelCoordinates(DataVisualizer):
         colormap=None,
         alpha=None,
         fast=False,
+        density=False,
+        resolution=(64, 256),
         vlines=True,
         vlines_kwds=None,
         **kwargs
@@ -354,8 +405,18 @@ class ParallelCoordinates(DataVisualizer):
         else:
             self._rng = None
 
+        # Validate 'density' argument
+        if density not in self.DENSITY_SCALES:
+            raise YellowbrickValueError(
+                "'{}' is an unrecognized density scale, use 'log' or 'linear'".format(
+                    density
+                )
+            )
+
         # Visual and drawing parameters
         self.fast = fast
+        self.density = density
+        self.resolution = resolution
         self.alpha = alpha
         self.show_vlines = vlines
         self.vlines_kwds = vlines_kwds or {"linewidth": 1, "color": "black"}
@@ -363,6 +424,7 @@ class ParallelCoordinates(DataVisualizer):
         # Internal properties
         self._increments = None
         self._colors = None
+        self._density_images = []
 
     def fit(self, X, y=None, **kwargs):
         """
@@ -403,8 +465,61 @@ class ParallelCoordinates(DataVisualizer):
 
         # Normalize instances
         if self.normalize is not None:
-            X = self.NORMALIZERS[self.normalize].fit_transform(X)
+            self.normalizer_ = clone(self.NORMALIZERS[self.normalize])
+            X = self.normalizer_.fit_transform(X)
+
+        # Reset the density buffer to the range of the data
+        if self.density:
+            X = np.asarray(X, dtype=float)
+            self.density_range_ = (X.min(), X.max()) if len(X) else (0.0, 1.0)
+            self.density_ = None
+
+        self.draw(X, y, **kwargs)
+        return self
+
+    def partial_fit(self, X, y=None, **kwargs):
+        """
+        Draws an additional chunk of instances so that data that does not fit
+        into memory can be visualized one chunk at a time. The first call fits
+        the visualizer, determining the features, classes and colors; so every
+        class must be present in the first chunk (or in the target passed to
+        ``fit``). Later chunks are normalized with the normalizer fitted on the
+        first chunk and are not subsampled.
+
+        In density mode the lines of each chunk are added to the density
+        buffer and the image is redrawn, lines that fall outside of the range
+        of the first chunk are not counted.
+
+        Parameters
+        ----------
+        X : ndarray or DataFrame of shape n x m
+            A matrix of n instances with m features
+
+        y : ndarray or Series of length n
+            An array or series of target or class values
+
+        kwargs : dict
+            Pass generic arguments to the drawing method
+
+        Returns
+        -------
+        self : instance
+            Returns the instance of the transformer/visualizer
+        """
+        if self._increments is None:
+            return self.fit(X, y, **kwargs)
+
+        # Convert from pandas data types
+        if is_dataframe(X):
+            X = X.values
+        if is_series(y):
+            y = y.values
+
+        # Normalize instances with the already fitted normalizer
+        if self.normalize is not None:
+            X = self.normalizer_.transform(X)
 
+        self.n_samples_ += len(X)
         self.draw(X, y, **kwargs)
         return self
 
@@ -425,6 +540,8 @@ class ParallelCoordinates(DataVisualizer):
             Pass generic arguments to the drawing method
 
         """
+        if self.density:
+            return self.draw_density(X, y, **kwargs)
         if self.fast:
             return self.draw_classes(X, y, **kwargs)
         return self.draw_instances(X, y, **kwargs)
@@ -432,10 +549,13 @@ class ParallelCoordinates(DataVisualizer):
     def draw_instances(self, X, y, **kwargs):
         """
         Draw the instances colored by the target y such that each line is a
-        single instance. This is the "slow" mode of drawing, since each
-        instance has to be drawn individually. However, in so doing, the
-        density of instances in braids is more apparent since lines have an
-        independent alpha that is compounded in the figure.
+        single instance. The density of instances in braids is apparent since
+        lines have an independent alpha that is compounded in the figure.
+
+        All of the instances are drawn as a single ``LineCollection`` artist
+        that is created from one (n, m, 2) array of vertices rather than one
+        ``Line2D`` per instance, so drawing scales to a large number of rows.
+        The instances are rendered in the order of X with per-instance colors.
 
         This is the default method of drawing.
 
@@ -455,12 +575,18 @@ class ParallelCoordinates(DataVisualizer):
         # Get alpha from param or default
         alpha = self.alpha or 0.25
 
-        for idx in range(len(X)):
-            Xi = X[idx]
-            yi = y[idx]
-            color = self.get_colors([yi])[0]
+        # Create the vertices of every instance's polyline at once
+        X = np.asarray(X, dtype=float)
+        increments = np.broadcast_to(self._increments, X.shape)
+        segments = np.stack([increments, X], axis=-1)
+
+        # Compute the per-instance colors, the alpha is applied to each line
+        colors = self.get_rgba_colors(y)
+        colors[:, 3] = alpha
 
-            self.ax.plot(self._increments, Xi, color=color, alpha=alpha, **kwargs)
+        lines = LineCollection(segments, colors=colors, **kwargs)
+        self.ax.add_collection(lines)
+        self.ax.autoscale_view()
 
         return self.ax
 
@@ -511,6 +637,111 @@ class ParallelCoordinates(DataVisualizer):
 
         return self.ax
 
+    def draw_density(self, X, y, **kwargs):
+        """
+        Draw the density of the instances of each class as an image. Every
+        line segment between adjacent axes is sampled once per horizontal pixel
+        and the samples are counted in a per-class buffer of shape
+        ``(n_classes, height, width)`` with a single ``np.bincount`` per block
+        of rows, so the cost is linear in the number of instances and the
+        drawing time only depends on the resolution. The opacity of each pixel
+        is the (log) scaled count of its class; classes are layered in order.
+
+        Parameters
+        ----------
+        X : ndarray of shape n x m
+            A matrix of n instances with m features
+
+        y : ndarray of length n
+            An array or series of target or class values
+
+        kwargs : dict
+            Pass generic arguments to ``imshow``
+
+        Notes
+        -----
+        This method can be used to count additional instances before the
+        figure is finalized, the image is redrawn from the updated buffer.
+        """
+        # Get alpha from param or default
+        alpha = self.alpha or 1.0
+
+        X = np.asarray(X, dtype=float)
+        width, height = self.resolution
+        n_gaps = len(self._increments) - 1
+
+        # Encode the target as the index of each class in the buffer
+        if self._target_color_type == TargetType.SINGLE:
+            labels = [None]
+            codes = np.zeros(len(X), dtype=int)
+        elif self._target_color_type == TargetType.DISCRETE:
+            labels = list(self.classes_)
+            codes = self._encode_labels(y)
+        else:
+            raise YellowbrickValueError(
+                "density mode requires a discrete target or no target"
+            )
+
+        shape = (len(labels), height, n_gaps * width)
+        if getattr(self, "density_", None) is None:
+            self.density_ = np.zeros(shape, dtype=np.int64)
+
+        # The horizontal pixel centers between two axes and their columns
+        steps = (np.arange(width) + 0.5) / width
+        columns = np.arange(n_gaps)[:, None] * width + np.arange(width)
+
+        low, high = self.density_range_
+        span = (high - low) or 1.0
+
+        # Count the interpolated points of blocks of rows to bound memory
+        block_size = max(1, self.DENSITY_BLOCK_SIZE // max(1, n_gaps * width))
+        for start in range(0, len(X), block_size):
+            block = X[start : start + block_size]
+            left, right = block[:, :-1, None], block[:, 1:, None]
+            points = left + (right - left) * steps
+
+            rows = np.floor((points - low) / span * height)
+            valid = (rows >= 0) & (rows <= height)
+            rows = np.minimum(rows, height - 1).astype(np.int64)
+
+            cells = codes[start : start + block_size, None, None] * height + rows
+            cells = cells * shape[2] + columns
+            self.density_ += np.bincount(
+                cells[valid], minlength=self.density_.size
+            ).reshape(shape)
+
+        # Scale the counts relative to the densest pixel of any class
+        counts = self.density_.astype(float)
+        if self.density == "linear":
+            scaled = counts / max(counts.max(), 1.0)
+        else:
+            scaled = np.log1p(counts) / np.log1p(max(counts.max(), 1.0))
+
+        # Remove the images of previously counted chunks
+        for image in self._density_images:
+            image.remove()
+        self._density_images = []
+
+        extent = (self._increments[0], self._increments[-1], low, high)
+        for idx, label in enumerate(labels):
+            color = self._colors if label is None else self._colors[label]
+            rgba = np.zeros(shape[1:] + (4,))
+            rgba[..., :3] = to_rgba_array(color)[0, :3]
+            rgba[..., 3] = scaled[idx] * alpha
+
+            self._density_images.append(
+                self.ax.imshow(
+                    rgba,
+                    extent=extent,
+                    origin="lower",
+                    aspect="auto",
+                    interpolation="nearest",
+                    **kwargs
+                )
+            )
+
+        return self.ax
+
     def finalize(self, **kwargs):
         """
         Performs the final rendering for the multi-axis visualization, including
@@ -18,6 +18,7 @@ Base class for all projection (decomposition) high dimensional data visualizers.
 ##########################################################################
 
 import warnings
+import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
@@ -318,10 +319,13 @@ class ProjectionVisualizer(DataVisualizer):
             if y is None:
                 raise YellowbrickValueError("y is required for discrete target")
 
-            try:
-                scatter_kwargs["c"] = [self._colors[self.classes_[yi]] for yi in y]
-            except IndexError:
+            # Fancy-index the class colors with the label encoded target
+            y = np.asarray(y)
+            if y.dtype.kind not in "iu" or (
+                y.size and (y.min() < 0 or y.max() >= len(self.classes_))
+            ):
                 raise YellowbrickValueError("Target needs to be label encoded.")
+            scatter_kwargs["c"] = self._class_rgba_colors()[y]
 
         elif self._target_color_type == TargetType.CONTINUOUS:
             if y is None:
@@ -100,6 +100,11 @@ class RadialVisualizer(DataVisualizer):
         The class labels that define the discrete values in the target. Only
         available if the target type is discrete. This is guaranteed to be
         strings even if the classes are a different type.
+
+    points_ : ndarray, shape (n_samples, 2)
+        The projected locations of the instances in the RadViz circle, in the
+        order of the instances that were drawn (instances with missing values
+        are not drawn), so they can be reused without redrawing.
     """
 
     def __init__(
@@ -133,6 +138,34 @@ class RadialVisualizer(DataVisualizer):
         b = X.max(axis=0)
         return (X - a[np.newaxis, :]) / ((b - a)[np.newaxis, :])
 
+    @staticmethod
+    def anchors(n_features):
+        """
+        Computes the (x, y) locations of the feature axes that are spaced evenly
+        around the circumference of the unit circle, one row per feature.
+        """
+        theta = 2.0 * np.pi * np.arange(n_features) / float(n_features)
+        return np.column_stack([np.cos(theta), np.sin(theta)])
+
+    def project(self, X):
+        """
+        Projects the instances into the circle as the average of the feature
+        anchors weighted by the normalized feature values, computed as a single
+        matrix product of the normalized data with the anchor coordinates.
+
+        Parameters
+        ----------
+        X : ndarray of shape n x m
+            A matrix of n instances with m features without missing values
+
+        Returns
+        -------
+        points : ndarray of shape n x 2
+            The location of each instance in the RadViz circle
+        """
+        X = self.normalize(np.asarray(X, dtype=float))
+        return (X @ self.anchors(X.shape[1])) / X.sum(axis=1)[:, np.newaxis]
+
     def fit(self, X, y=None, **kwargs):
         """
         The fit method is the primary drawing input for the
@@ -173,43 +206,25 @@ class RadialVisualizer(DataVisualizer):
         nan_warnings.warn_if_nans_exist(X)
         X, y = nan_warnings.filter_missing(X, y)
 
-        # Get the shape of the data
-        nrows, ncols = X.shape
-
         # Set the axes limits
         self.ax.set_xlim([-1, 1])
         self.ax.set_ylim([-1, 1])
 
-        # Create a data structure to hold scatter plot representations
-        to_plot = {label: [[], []] for label in self.classes_}
-
-        # Compute the arcs around the circumference for each feature axis
-        # TODO: make this an independent function for override
-        s = np.array(
-            [
-                (np.cos(t), np.sin(t))
-                for t in [2.0 * np.pi * (i / float(ncols)) for i in range(ncols)]
-            ]
-        )
-
-        # Compute the locations of the scatter plot for each class
-        # Normalize the data first to plot along the 0, 1 axis
-        for i, row in enumerate(self.normalize(X)):
-            row_ = np.repeat(np.expand_dims(row, axis=1), 2, axis=1)
-            xy = (s * row_).sum(axis=0) / row.sum()
-            label = self._label_encoder[y[i]]
+        # Compute the locations of the scatter plot of every instance at once
+        s = self.anchors(X.shape[1])
+        self.points_ = self.project(X)
 
-            to_plot[label][0].append(xy[0])
-            to_plot[label][1].append(xy[1])
+        # Encode the target as the index of each instance's class label
+        codes = self._encode_labels(y)
 
-        # Add the scatter plots from the to_plot function
+        # Add a single scatter plot for each class
         # TODO: store these plots to add more instances to later
-        # TODO: make this a separate function
-        for label in self.classes_:
+        for idx, label in enumerate(self.classes_):
+            points = self.points_[codes == idx]
             color = self.get_colors([label])[0]
             self.ax.scatter(
-                to_plot[label][0],
-                to_plot[label][1],
+                points[:, 0],
+                points[:, 1],
                 color=color,
                 label=label,
                 alpha=self.alpha,
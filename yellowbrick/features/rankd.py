@@ -18,14 +18,20 @@ Implements 1D (histograms) and 2D (joint plot) feature rankings.
 ##########################################################################
 
 import warnings
+import itertools
 import numpy as np
 import matplotlib as mpl
+import scipy.sparse as sp
 
+from joblib import Parallel, delayed, effective_n_jobs
 from scipy.stats import shapiro
-from scipy.stats import spearmanr
+from scipy.stats import rankdata
+from scipy.stats import skew, kurtosis
+from sklearn.utils import check_random_state
 from scipy.stats import kendalltau as sp_kendalltau
 
 from yellowbrick.utils import is_dataframe
+from yellowbrick.utils.moments import CoMoments, row_blocks
 from yellowbrick.features.base import MultiFeatureVisualizer
 from yellowbrick.exceptions import YellowbrickValueError, YellowbrickWarning
 
@@ -38,24 +44,118 @@ __all__ = ["rank1d", "rank2d", "Rank1D", "Rank2D"]
 ##########################################################################
 
 
-def kendalltau(X):
+def kendalltau(X, n_jobs=None):
     """
     Accepts a matrix X and returns a correlation matrix so that each column
     is the variable and each row is the observations.
 
+    Because the matrix is symmetric only the upper triangle is computed, the
+    pairs are split into batches that are evaluated in parallel.
+
     Parameters
     ----------
     X : ndarray or DataFrame of shape n x m
         A matrix of n instances with m features
 
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to compute the pairwise correlations.
+
     """
-    corrs = np.zeros((X.shape[1], X.shape[1]))
-    for idx, cola in enumerate(X.T):
-        for jdx, colb in enumerate(X.T):
-            corrs[idx, jdx] = sp_kendalltau(cola, colb)[0]
+    m = X.shape[1]
+
+    # Compute the correlations of the upper triangle in batches
+    rows, cols = np.triu_indices(m, k=1)
+    batches = np.array_split(np.arange(len(rows)), effective_n_jobs(n_jobs))
+    taus = Parallel(n_jobs=n_jobs)(
+        delayed(_kendalltau_pairs)(X, rows[batch], cols[batch]) for batch in batches
+    )
+
+    # The diagonal is undefined for constant columns, like scipy
+    corrs = np.diag(np.where(np.ptp(X, axis=0) > 0, 1.0, np.nan))
+    corrs[rows, cols] = np.concatenate(taus)
+    corrs[cols, rows] = corrs[rows, cols]
     return corrs
 
 
+def _kendalltau_pairs(X, rows, cols):
+    """
+    Computes the Kendall tau correlation of the specified pairs of columns.
+    """
+    return np.array([sp_kendalltau(X[:, i], X[:, j])[0] for i, j in zip(rows, cols)])
+
+
+def shapiro_wilk(X, sample_size=None, random_state=None, n_jobs=None):
+    """
+    Accepts a matrix X and returns the Shapiro-Wilk W statistic of each column.
+
+    The test is only accurate for up to 5000 samples, so a reproducible random
+    subsample of the rows can be used instead of the full data. The columns
+    are split into batches that are tested in parallel.
+
+    Parameters
+    ----------
+    X : ndarray or DataFrame of shape n x m
+        A matrix of n instances with m features
+
+    sample_size : int or None, default: None
+        If specified and less than n, the columns are tested on a random
+        subsample of this many rows.
+
+    random_state : int, RandomState instance or None, default: None
+        Seeds the random subsample of the rows so that rankings are repeatable.
+
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to test the columns.
+
+    """
+    if sample_size is not None and X.shape[0] > sample_size:
+        rng = check_random_state(random_state)
+        X = X[np.sort(rng.choice(X.shape[0], sample_size, replace=False))]
+
+    batches = np.array_split(np.arange(X.shape[1]), effective_n_jobs(n_jobs))
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_shapiro_columns)(X[:, batch]) for batch in batches
+    )
+    return np.concatenate(scores)
+
+
+def _shapiro_columns(X):
+    """
+    Computes the Shapiro-Wilk W statistic of each column of X.
+    """
+    return np.array([shapiro(x)[0] for x in X.T], dtype=float)
+
+
+def jarque_bera(X):
+    """
+    Accepts a matrix X and returns the Jarque-Bera statistic of each column,
+    a normality score computed from the skewness and excess kurtosis of all of
+    the columns in a single vectorized pass. Zero indicates a normal shape.
+
+    Parameters
+    ----------
+    X : ndarray or DataFrame of shape n x m
+        A matrix of n instances with m features
+
+    """
+    n = X.shape[0]
+    return n / 6.0 * (skew(X, axis=0) ** 2 + kurtosis(X, axis=0) ** 2 / 4.0)
+
+
+def spearman(X):
+    """
+    Accepts a matrix X and returns the Spearman rank correlation matrix, the
+    Pearson correlation of the columns ranked once in a single vectorized pass.
+
+    Parameters
+    ----------
+    X : ndarray or DataFrame of shape n x m
+        A matrix of n instances with m features
+
+    """
+    return np.corrcoef(rankdata(X, axis=0).T)
+
+
 ##########################################################################
 ## Base Feature Visualizer
 ##########################################################################
@@ -192,7 +292,14 @@ class RankDBase(MultiFeatureVisualizer):
         if is_dataframe(X):
             X = X.values
 
-        return self.ranking_methods[algorithm](X)
+        return self.ranking_methods[algorithm](X, **self._ranking_params(algorithm))
+
+    def _ranking_params(self, algorithm):
+        """
+        Returns additional keyword arguments for the specified ranking method,
+        allowing subclasses to pass their hyperparameters to the ranking.
+        """
+        return {}
 
     def finalize(self, **kwargs):
         """
@@ -240,8 +347,10 @@ class Rank1D(RankDBase):
         The axis to plot the figure on. If None is passed in the current axes
         will be used (or generated if required).
 
-    algorithm : one of {'shapiro', }, default: 'shapiro'
-        The ranking algorithm to use, default is 'Shapiro-Wilk.
+    algorithm : one of {'shapiro', 'skew', 'kurtosis', 'jarque_bera'}
+        The ranking algorithm to use, default is 'Shapiro-Wilk. The 'skew',
+        'kurtosis' (excess kurtosis) and 'jarque_bera' normality scores are
+        computed for all columns in a single vectorized pass.
 
     features : list
         A list of feature names to use.
@@ -258,6 +367,17 @@ class Rank1D(RankDBase):
     color: string
         Specify color for barchart
 
+    sample_size : int or None, default: None
+        If specified, the 'shapiro' ranking is computed on a random subsample
+        of this many instances, the Shapiro-Wilk test is only accurate for up
+        to 5000 samples.
+
+    random_state : int, RandomState instance or None, default: None
+        Seeds the random subsample of the instances for repeatable rankings.
+
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to compute the 'shapiro' ranking.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
@@ -276,7 +396,12 @@ class Rank1D(RankDBase):
     >>> visualizer.show()
     """
 
-    ranking_methods = {"shapiro": lambda X: np.array([shapiro(x)[0] for x in X.T])}
+    ranking_methods = {
+        "shapiro": shapiro_wilk,
+        "skew": lambda X: skew(X, axis=0),
+        "kurtosis": lambda X: kurtosis(X, axis=0),
+        "jarque_bera": jarque_bera,
+    }
 
     def __init__(
         self,
@@ -286,6 +411,9 @@ class Rank1D(RankDBase):
         orient="h",
         show_feature_names=True,
         color=None,
+        sample_size=None,
+        random_state=None,
+        n_jobs=None,
         **kwargs
     ):
         """
@@ -301,6 +429,21 @@ class Rank1D(RankDBase):
         )
         self.color = color
         self.orientation_ = orient
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def _ranking_params(self, algorithm):
+        """
+        Passes the subsampling and parallel options to the shapiro ranking.
+        """
+        if algorithm == "shapiro":
+            return {
+                "sample_size": self.sample_size,
+                "random_state": self.random_state,
+                "n_jobs": self.n_jobs,
+            }
+        return {}
 
     def draw(self, **kwargs):
         """
@@ -375,6 +518,10 @@ class Rank2D(RankDBase):
     show_feature_names : boolean, default: True
         If True, the feature names are used to label the axis ticks in the plot.
 
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to compute the pairwise 'kendalltau'
+        correlations.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
@@ -393,6 +540,13 @@ class Rank2D(RankDBase):
     >>> visualizer.transform(X)
     >>> visualizer.show()
 
+    The 'pearson' and 'covariance' rankings can also be computed in a single
+    pass over row blocks, e.g. read from disk, or over a sparse matrix:
+
+    >>> visualizer = Rank2D(algorithm="covariance")
+    >>> visualizer.fit_stream(pd.read_csv("data.csv", chunksize=100000))
+    >>> visualizer.show()
+
     Notes
     -----
     These parameters can be influenced later on in the visualization
@@ -402,8 +556,14 @@ class Rank2D(RankDBase):
     ranking_methods = {
         "pearson": lambda X: np.corrcoef(X.transpose()),
         "covariance": lambda X: np.cov(X.transpose()),
-        "spearman": lambda X: spearmanr(X, axis=0)[0],
-        "kendalltau": lambda X: kendalltau(X),
+        "spearman": spearman,
+        "kendalltau": kendalltau,
+    }
+
+    # Ranking methods that can be computed from the one-pass co-moments
+    streaming_methods = {
+        "pearson": lambda moments: moments.correlation(),
+        "covariance": lambda moments: moments.covariance(),
     }
 
     def __init__(
@@ -413,6 +573,7 @@ class Rank2D(RankDBase):
         features=None,
         colormap="RdBu_r",
         show_feature_names=True,
+        n_jobs=None,
         **kwargs
     ):
         """
@@ -427,6 +588,98 @@ class Rank2D(RankDBase):
             **kwargs
         )
         self.colormap = colormap
+        self.n_jobs = n_jobs
+
+    def _ranking_params(self, algorithm):
+        """
+        Passes the number of parallel jobs to the kendalltau ranking.
+        """
+        if algorithm == "kendalltau":
+            return {"n_jobs": self.n_jobs}
+        return {}
+
+    def fit_stream(self, blocks):
+        """
+        Fits the visualizer and computes the ranking in a single pass over an
+        iterable of row blocks without ever holding all of the data in memory,
+        then draws the heatmap. Only the 'pearson' and 'covariance' algorithms
+        can be computed from streamed blocks.
+
+        Parameters
+        ----------
+        blocks : iterable of ndarray, DataFrame or sparse matrix
+            Row blocks of shape n_rows x m, e.g. the chunks of a CSV file read
+            with pandas or the row slices of a memory mapped array.
+
+        Returns
+        -------
+        self : Rank2D
+            Returns the visualizer for chaining.
+        """
+        blocks = iter(blocks)
+        try:
+            first = next(blocks)
+        except StopIteration:
+            raise YellowbrickValueError("cannot rank an empty stream of row blocks")
+
+        # Determine the feature names from the first block
+        self.fit(first)
+
+        self.ranks_ = self.rank_stream(itertools.chain([first], blocks))
+        self.draw()
+        return self
+
+    def rank(self, X, algorithm=None):
+        """
+        Returns the feature ranking, sparse matrices are ranked in one pass
+        over dense row blocks rather than being densified as a whole.
+
+        Parameters
+        ----------
+        X : ndarray, DataFrame or sparse matrix of shape n x m
+            A matrix of n instances with m features
+
+        algorithm : str or None
+            The ranking mechanism to use, or None for the default
+
+        Returns
+        -------
+        ranks : ndarray
+            An array of rank scores with shape (m,m).
+        """
+        if sp.issparse(X):
+            return self.rank_stream(row_blocks(X), algorithm)
+        return super(Rank2D, self).rank(X, algorithm)
+
+    def rank_stream(self, blocks, algorithm=None):
+        """
+        Returns the feature ranking computed in a single pass over the row
+        blocks, using O(m^2) memory independent of the number of rows.
+
+        Parameters
+        ----------
+        blocks : iterable of ndarray, DataFrame or sparse matrix
+            Row blocks of shape n_rows x m.
+
+        algorithm : str or None
+            The ranking mechanism to use, or None for the default
+
+        Returns
+        -------
+        ranks : ndarray
+            An array of rank scores with shape (m,m).
+        """
+        algorithm = algorithm or self.ranking_
+        algorithm = algorithm.lower()
+
+        if algorithm not in self.streaming_methods:
+            raise YellowbrickValueError(
+                "'{}' ranking cannot be computed from row blocks, use one of {}".format(
+                    algorithm, ", ".join(self.streaming_methods)
+                )
+            )
+
+        return self.streaming_methods[algorithm](CoMoments(blocks))
 
     def draw(self, **kwargs):
         """
@@ -478,6 +731,9 @@ def rank1d(
     orient="h",
     show_feature_names=True,
     color=None,
+    sample_size=None,
+    random_state=None,
+    n_jobs=None,
     show=True,
     **kwargs
 ):
@@ -497,7 +753,7 @@ def rank1d(
     ax : matplotlib axes
         the axis to plot the figure on.
 
-    algorithm : one of {'shapiro', }, default: 'shapiro'
+    algorithm : one of {'shapiro', 'skew', 'kurtosis', 'jarque_bera'}
         The ranking algorithm to use, default is 'Shapiro-Wilk.
 
     features : list
@@ -515,6 +771,16 @@ def rank1d(
     color: string
         Specify color for barchart
 
+    sample_size : int or None, default: None
+        If specified, the 'shapiro' ranking is computed on a random subsample
+        of this many instances.
+
+    random_state : int, RandomState instance or None, default: None
+        Seeds the random subsample of the instances for repeatable rankings.
+
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to compute the 'shapiro' ranking.
+
     show: bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -538,6 +804,9 @@ def rank1d(
         orient=orient,
         show_feature_names=show_feature_names,
         color=color,
+        sample_size=sample_size,
+        random_state=random_state,
+        n_jobs=n_jobs,
         **kwargs
     )
 
@@ -562,6 +831,7 @@ def rank2d(
     features=None,
     colormap="RdBu_r",
     show_feature_names=True,
+    n_jobs=None,
     show=True,
     **kwargs
 ):
@@ -600,6 +870,10 @@ def rank2d(
     show_feature_names : boolean, default: True
         If True, the feature names are used to label the axis ticks in the plot.
 
+    n_jobs : int or None, default: None
+        The number of parallel jobs used to compute the pairwise 'kendalltau'
+        correlations.
+
     show: bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -621,6 +895,7 @@ def rank2d(
         features=features,
         colormap=colormap,
         show_feature_names=show_feature_names,
+        n_jobs=n_jobs,
         **kwargs
     )
 
@@ -32,6 +32,121 @@ from ..exceptions import (
 ##########################################################################
 
 
+def _encode_param(cv_results, param):
+    """
+    Integer encodes the values of a parameter in the grid search results.
+
+    Returns the sorted unique values of the parameter along with an array that
+    contains the index of each trial's value in the unique values, or -1 if the
+    parameter is not applicable to the trial (e.g. masked in the results).
+    """
+    try:
+        vals = cv_results["param_" + param]
+    except KeyError:
+        raise YellowbrickKeyError(
+            "Parameter '{}' does not exist in the grid "
+            "search results".format(param)
+        )
+
+    # These are masked arrays where the cases where each parameter is
+    # non-applicable are masked.
+    mask = np.ma.getmaskarray(vals)
+    codes = np.full(len(mask), -1, dtype=int)
+    unique_vals, codes[~mask] = np.unique(
+        np.ma.getdata(vals)[~mask], return_inverse=True
+    )
+    return unique_vals.tolist(), codes
+
+
+def _get_metric(cv_results, metric):
+    """
+    Returns the values of the metric in the grid search results as floats.
+    """
+    if metric not in cv_results:
+        raise YellowbrickKeyError(
+            "Metric '{}' does not exist in the grid " "search results".format(metric)
+        )
+
+    try:
+        return np.asarray(cv_results[metric], dtype=float)
+    except (TypeError, ValueError):
+        raise YellowbrickValueError(
+            "Cannot display grid search results for metric '{}': "
+            "result values may not all be numeric".format(metric)
+        )
+
+
+def param_projections(cv_results, param_pairs, metric="mean_test_score"):
+    """
+    Projects the grid search results onto 2 dimensions for several pairs of
+    parameters and metrics in one pass.
+
+    The display value is taken as the max over the non-displayed dimensions.
+    Each parameter is integer encoded only once and the best score of each
+    grid cell is computed with a grouped maximum over the encoded trials, so
+    that large randomized searches can be projected efficiently.
+
+    Parameters
+    ----------
+    cv_results : dict
+        A dictionary of results from the `GridSearchCV` object's `cv_results_`
+        attribute.
+
+    param_pairs : list of (string, string) tuples
+        The names of the parameters to be visualized on the horizontal and
+        vertical axes respectively.
+
+    metric : string or list of strings (default 'mean_test_score')
+        The field(s) from the grid search's `cv_results` that we want to
+        display.
+
+    Returns
+    -------
+    projections : dict
+        A dictionary mapping each parameter pair to a tuple of the unique x
+        values, the unique y values and the best scores. The best scores are a
+        2D numpy array (n_y by n_x) if a single metric is specified, otherwise
+        a 3D numpy array (n_metrics by n_y by n_x).
+    """
+    metrics = [metric] if isinstance(metric, str) else list(metric)
+    scores = np.stack([_get_metric(cv_results, m) for m in metrics])
+
+    encoded = {}
+    projections = {}
+
+    for x_param, y_param in param_pairs:
+        for param in (x_param, y_param):
+            if param not in encoded:
+                encoded[param] = _encode_param(cv_results, param)
+
+        unique_x_vals, idx_x = encoded[x_param]
+        unique_y_vals, idx_y = encoded[y_param]
+        n_x, n_y = len(unique_x_vals), len(unique_y_vals)
+
+        # Flat index of the grid cell of each trial where both params apply
+        valid = (idx_x >= 0) & (idx_y >= 0)
+        cells = idx_y[valid] * n_x + idx_x[valid]
+
+        # Grouped max of the scores in each cell, NaN where there are no trials
+        # or where every trial in the cell failed with a NaN score
+        best_scores = np.full((len(metrics), n_y * n_x), -np.inf)
+        for best, values in zip(best_scores, scores):
+            values = values[valid]
+            np.fmax.at(best, cells, values)
+            scored = np.bincount(
+                cells, weights=~np.isnan(values), minlength=n_y * n_x
+            )
+            best[scored == 0] = np.nan
+        best_scores = best_scores.reshape(len(metrics), n_y, n_x)
+
+        if isinstance(metric, str):
+            best_scores = best_scores[0]
+
+        projections[(x_param, y_param)] = (unique_x_vals, unique_y_vals, best_scores)
+
+    return projections
+
+
 def param_projection(cv_results, x_param, y_param, metric="mean_test_score"):
     """
     Projects the grid search results onto 2 dimensions.
@@ -50,7 +165,7 @@ def param_projection(cv_results, x_param, y_param, metric="mean_test_score"):
     y_param : string
         The name of the parameter to be visualized on the vertical axis.
 
-    metric : string (default 'mean_test_score')
+    metric : string or list of strings (default 'mean_test_score')
         The field from the grid search's `cv_results` that we want to display.
 
     Returns
@@ -62,72 +177,11 @@ def param_projection(cv_results, x_param, y_param, metric="mean_test_score"):
         The parameter values that will be used to label the y axis.
 
     best_scores: 2D numpy array (n_y by n_x)
-        Array of scores to be displayed for each parameter value pair.
+        Array of scores to be displayed for each parameter value pair. If a
+        list of metrics is specified, a 3D array (n_metrics by n_y by n_x).
     """
-    # Extract the parameter values and score corresponding to each gridsearch
-    # trial.
-    # These are masked arrays where the cases where each parameter is
-    # non-applicable are masked.
-    try:
-        x_vals = cv_results["param_" + x_param]
-    except KeyError:
-        raise YellowbrickKeyError(
-            "Parameter '{}' does not exist in the grid "
-            "search results".format(x_param)
-        )
-    try:
-        y_vals = cv_results["param_" + y_param]
-    except KeyError:
-        raise YellowbrickKeyError(
-            "Parameter '{}' does not exist in the grid "
-            "search results".format(y_param)
-        )
-
-    if metric not in cv_results:
-        raise YellowbrickKeyError(
-            "Metric '{}' does not exist in the grid " "search results".format(metric)
-        )
-
-    # Get unique, unmasked values of the two display parameters
-    unique_x_vals = sorted(list(set(x_vals.compressed())))
-    unique_y_vals = sorted(list(set(y_vals.compressed())))
-    n_x = len(unique_x_vals)
-    n_y = len(unique_y_vals)
-
-    # Get mapping of each parameter value -> an integer index
-    int_mapping_1 = {value: idx for idx, value in enumerate(unique_x_vals)}
-    int_mapping_2 = {value: idx for idx, value in enumerate(unique_y_vals)}
-
-    # Translate each gridsearch result to indices on the grid
-    idx_x = [int_mapping_1[value] if value else None for value in x_vals]
-    idx_y = [int_mapping_2[value] if value else None for value in y_vals]
-
-    # Create an array of all scores for each value of the display parameters.
-    # This is a n_x by n_y array of lists with `None` in place of empties
-    # (my kingdom for a dataframe...)
-    all_scores = [[None for _ in range(n_x)] for _ in range(n_y)]
-    for x, y, score in zip(idx_x, idx_y, cv_results[metric]):
-        if x is not None and y is not None:
-            if all_scores[y][x] is None:
-                all_scores[y][x] = []
-            all_scores[y][x].append(score)
-
-    # Get a numpy array consisting of the best scores for each parameter pair
-    best_scores = np.empty((n_y, n_x))
-    for x in range(n_x):
-        for y in range(n_y):
-            if all_scores[y][x] is None:
-                best_scores[y, x] = np.nan
-            else:
-                try:
-                    best_scores[y, x] = max(all_scores[y][x])
-                except ValueError:
-                    raise YellowbrickValueError(
-                        "Cannot display grid search results for metric '{}': "
-                        "result values may not all be numeric".format(metric)
-                    )
-
-    return unique_x_vals, unique_y_vals, best_scores
+    projections = param_projections(cv_results, [(x_param, y_param)], metric)
+    return projections[(x_param, y_param)]
 
 
 ##########################################################################
@@ -23,7 +23,14 @@ import numpy as np
 import matplotlib.ticker as ticker
 
 from yellowbrick.base import ModelVisualizer
-from sklearn.model_selection import cross_val_score
+from yellowbrick.exceptions import NotFitted
+
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv, cross_validate
+
+from yellowbrick.model_selection.utils import fit_and_score
 
 
 ##########################################################################
@@ -70,6 +77,19 @@ class CVScores(ModelVisualizer):
     color: string
         Specify color for barchart
 
+    n_jobs : integer, optional
+        Number of jobs to run in parallel, the folds are fit and scored in
+        parallel (default 1). ``-1`` means using all processors.
+
+    pre_dispatch : integer or string, optional
+        Number of predispatched jobs for parallel execution (default is
+        '2*n_jobs'). The option can reduce the allocated memory.
+
+    return_predictions : bool, default: False
+        If True, the out-of-fold predictions of each fitted fold estimator are
+        stored on the visualizer so that other metrics can be computed with
+        ``fold_scores`` without re-running the cross validation.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
@@ -82,6 +102,16 @@ class CVScores(ModelVisualizer):
     cv_scores_mean_ : float
         Average cross-validated score across all subsections of the data
 
+    fit_times_ : ndarray shape (n_splits, )
+        The time in seconds spent fitting the estimator on each training fold
+
+    score_times_ : ndarray shape (n_splits, )
+        The time in seconds spent scoring the estimator on each test fold
+
+    fold_predictions_ : list of tuples (test_indices, y_true, y_pred)
+        The out-of-fold predictions for each split, only stored if
+        ``return_predictions=True``.
+
 
     Examples
     --------
@@ -99,7 +129,7 @@ class CVScores(ModelVisualizer):
     -----
 
     This visualizer is a wrapper for
-    `sklearn.model_selection.cross_val_score <https://goo.gl/4v7dfL>`_.
+    `sklearn.model_selection.cross_validate <https://goo.gl/4v7dfL>`_.
 
     Refer to the scikit-learn
     `cross-validation guide <https://goo.gl/FS3VU6>`_
@@ -107,12 +137,26 @@ class CVScores(ModelVisualizer):
 
     """
 
-    def __init__(self, estimator, ax=None, cv=None, scoring=None, color=None, **kwargs):
+    def __init__(
+        self,
+        estimator,
+        ax=None,
+        cv=None,
+        scoring=None,
+        color=None,
+        n_jobs=None,
+        pre_dispatch="2*n_jobs",
+        return_predictions=False,
+        **kwargs
+    ):
         super(CVScores, self).__init__(estimator, ax=ax, **kwargs)
 
         self.cv = cv
         self.color = color
         self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.pre_dispatch = pre_dispatch
+        self.return_predictions = return_predictions
 
     def fit(self, X, y, **kwargs):
         """
@@ -136,14 +180,96 @@ class CVScores(ModelVisualizer):
 
         """
 
-        self.cv_scores_ = cross_val_score(
-            self.estimator, X, y, cv=self.cv, scoring=self.scoring
-        )
+        if self.return_predictions:
+            results = self._fit_predict(X, y)
+        else:
+            results = cross_validate(
+                self.estimator,
+                X,
+                y,
+                cv=self.cv,
+                scoring=self.scoring,
+                n_jobs=self.n_jobs,
+                pre_dispatch=self.pre_dispatch,
+            )
+
+        self.cv_scores_ = results["test_score"]
         self.cv_scores_mean_ = self.cv_scores_.mean()
+        self.fit_times_ = results["fit_time"]
+        self.score_times_ = results["score_time"]
 
         self.draw()
         return self
 
+    def _fit_predict(self, X, y):
+        """
+        Fits, scores and predicts each fold in a single parallel task so that
+        only the out-of-fold predictions are returned from the workers rather
+        than the fitted fold estimators.
+        """
+        # Materialize the splits so that the test indices of each fold are
+        # known when the out-of-fold predictions are collected.
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+
+        parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
+        folds = parallel(
+            delayed(fit_and_score)(
+                clone(self.estimator),
+                X,
+                y,
+                scorer,
+                train,
+                test,
+                return_predictions=True,
+            )
+            for train, test in splits
+        )
+
+        self.fold_predictions_ = [
+            (test, fold["y_test"], fold["y_pred"])
+            for (_, test), fold in zip(splits, folds)
+        ]
+
+        return {
+            key: np.array([fold[key] for fold in folds])
+            for key in ("test_score", "fit_time", "score_time")
+        }
+
+    def fold_scores(self, metric, **kwargs):
+        """
+        Computes a metric on each fold from the stored out-of-fold predictions,
+        allowing several metrics to be compared from a single cross validation
+        run rather than refitting the estimator for every metric.
+
+        Parameters
+        ----------
+        metric : callable
+            A function with signature ``metric(y_true, y_pred, **kwargs)`` such
+            as those found in ``sklearn.metrics``.
+
+        kwargs : dict
+            Additional keyword arguments passed to the metric.
+
+        Returns
+        -------
+        scores : ndarray shape (n_splits, )
+            The metric computed on the test set of each fold.
+        """
+        if not hasattr(self, "fold_predictions_"):
+            raise NotFitted(
+                "out-of-fold predictions are only stored when the visualizer "
+                "is fit with return_predictions=True"
+            )
+
+        return np.array(
+            [
+                np.nan if y_pred is None else metric(y_true, y_pred, **kwargs)
+                for _, y_true, y_pred in self.fold_predictions_
+            ]
+        )
+
     def draw(self, **kwargs):
         """
         Creates the bar chart of the cross-validated scores generated from the
@@ -193,7 +319,17 @@ class CVScores(ModelVisualizer):
 
 
 def cv_scores(
-    estimator, X, y, ax=None, cv=None, scoring=None, color=None, show=True, **kwargs
+    estimator,
+    X,
+    y,
+    ax=None,
+    cv=None,
+    scoring=None,
+    color=None,
+    n_jobs=None,
+    pre_dispatch="2*n_jobs",
+    show=True,
+    **kwargs
 ):
     """
     Displays cross validation scores as a bar chart and the
@@ -245,6 +381,14 @@ def cv_scores(
     color: string
         Specify color for barchart
 
+    n_jobs : integer, optional
+        Number of jobs to run in parallel, the folds are fit and scored in
+        parallel (default 1). ``-1`` means using all processors.
+
+    pre_dispatch : integer or string, optional
+        Number of predispatched jobs for parallel execution (default is
+        '2*n_jobs'). The option can reduce the allocated memory.
+
     show: bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -263,7 +407,14 @@ def cv_scores(
 
     # Initialize the visualizer
     visualizer = CVScores(
-        estimator, ax=ax, cv=cv, scoring=scoring, color=None, **kwargs
+        estimator,
+        ax=ax,
+        cv=cv,
+        scoring=scoring,
+        color=None,
+        n_jobs=n_jobs,
+        pre_dispatch=pre_dispatch,
+        **kwargs
     )
 
     # Fit and show the visualizer
@@ -18,10 +18,12 @@ import numpy as np
 from yellowbrick.base import ModelVisualizer
 from yellowbrick.style import resolve_colors
 from yellowbrick.exceptions import YellowbrickValueError
+from yellowbrick.model_selection.utils import fit_and_score
 
-from sklearn.model_selection import validation_curve as sk_validation_curve
-from sklearn.pipeline import make_pipeline
-from sklearn.feature_selection import SelectKBest
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
 
 
 # Default ticks for the model selection curve, relative number of features
@@ -143,7 +145,9 @@ class DroppingCurve(ModelVisualizer):
 
     Notes
     -----
-    This visualizer is based on sklearn.model_selection.validation_curve
+    This visualizer is based on sklearn.model_selection.validation_curve, the
+    features of each subset are passed to the parallel workers as column indices
+    so that they share a single copy of X.
     """
 
     def __init__(
@@ -210,36 +214,39 @@ class DroppingCurve(ModelVisualizer):
                 raise YellowbrickValueError('Expected feature ratio in [0,1]')
             self.feature_sizes_ = np.ceil(n_features * self.feature_sizes).astype(int)
 
-        # The easiest way to prepend a random-dropout layer is to use
-        # SelectKBest with a random scoring function.
-        feature_dropping_pipeline = make_pipeline(
-            SelectKBest(
-                score_func=lambda X,y: np.random.default_rng(self.random_state).standard_normal(size=X.shape[-1])
-                ),
-            self.estimator,
-        )
-
-        # arguments to pass to sk_validation_curve
-        skvc_kwargs = {
-            key: self.get_params()[key]
-            for key in (
-                "groups",
-                "cv",
-                "scoring",
-                "n_jobs",
-                "pre_dispatch",
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y, self.groups))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+
+        # Each subset keeps the k features with the highest random scores in
+        # their original order. Subsets are passed to the workers as column
+        # indices so that they all share X (which joblib memory maps when it is
+        # large) and only copy the rows and columns of their own fold.
+        jobs = [
+            (self._random_features(n_features, k), train, test)
+            for k in self.feature_sizes_
+            for train, test in splits
+        ]
+
+        parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
+        scores = parallel(
+            delayed(fit_and_score)(
+                clone(self.estimator),
+                X,
+                y,
+                scorer,
+                train,
+                test,
+                columns=columns,
+                return_train_score=True,
             )
-        }
-
-        self.train_scores_, self.valid_scores_ = sk_validation_curve(
-            feature_dropping_pipeline,
-            X,
-            y,
-            param_name="selectkbest__k",
-            param_range=self.feature_sizes_,
-            **skvc_kwargs
+            for columns, train, test in jobs
         )
 
+        shape = (len(self.feature_sizes_), len(splits))
+        self.train_scores_ = np.reshape([s["train_score"] for s in scores], shape)
+        self.valid_scores_ = np.reshape([s["test_score"] for s in scores], shape)
+
         # compute the mean and standard deviation of the training data
         self.train_scores_mean_ = np.mean(self.train_scores_, axis=1)
         self.train_scores_std_ = np.std(self.train_scores_, axis=1)
@@ -252,6 +259,13 @@ class DroppingCurve(ModelVisualizer):
         self.draw()
         return self
 
+    def _random_features(self, n_features, k):
+        """
+        Returns the sorted indices of k randomly selected features.
+        """
+        scores = np.random.default_rng(self.random_state).standard_normal(n_features)
+        return np.sort(np.argsort(scores, kind="mergesort")[-k:])
+
     def draw(self, **kwargs):
         """
         Renders the training and validation learning curves.
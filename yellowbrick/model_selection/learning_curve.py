@@ -17,12 +17,19 @@ Implements a learning curve visualization for model selection.
 ## Imports
 ##########################################################################
 
+import warnings
 import numpy as np
 
 from yellowbrick.base import ModelVisualizer
 from yellowbrick.style import resolve_colors
-from yellowbrick.exceptions import YellowbrickValueError
-
+from yellowbrick.exceptions import YellowbrickValueError, ModelError
+from yellowbrick.exceptions import YellowbrickWarning
+from yellowbrick.model_selection.utils import safe_split
+
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.utils import check_random_state
+from sklearn.model_selection import check_cv
 from sklearn.model_selection import learning_curve as sk_learning_curve
 
 
@@ -147,6 +154,10 @@ class LearningCurve(ModelVisualizer):
     test_scores_std_ : array, shape (n_ticks,)
         Standard deviation of test data scores for each test split
 
+    fold_train_sizes_ : array, shape (n_ticks, n_cv_folds)
+        The number of instances each fold model was trained on at each of the
+        ``train_sizes_``. Only available after ``fit_stream``.
+
     Examples
     --------
 
@@ -261,6 +272,170 @@ class LearningCurve(ModelVisualizer):
         self.draw()
         return self
 
+    def fit_stream(self, chunks, X_test, y_test, n_samples=None, classes=None):
+        """
+        Fits the learning curve out-of-core from a stream of training chunks
+        using the ``partial_fit`` method of the wrapped estimator, e.g. for
+        ``SGDClassifier``, ``MultinomialNB`` or ``MiniBatchKMeans``. The stream
+        is consumed exactly once so that learning curves can be computed on
+        training sets that are far larger than memory.
+
+        One model is grown per cross-validation fold (the number of folds is
+        determined by ``cv``): every streamed instance is randomly assigned to
+        a fold (using ``random_state``) and is withheld from that fold's model.
+        At each of the ``train_sizes`` checkpoints, each model is scored on the
+        fixed holdout set. The training score is the weighted average of the
+        scores on each training batch directly after it was learned since the
+        last checkpoint, so no training data is retained.
+
+        The ``train_sizes_`` are the number of streamed instances at each
+        checkpoint, not the training set size of the fold models, which have
+        each learned about ``(k-1)/k`` of them; the actual number of instances
+        learned by each model is stored in ``fold_train_sizes_``. If the stream
+        is exhausted before the last checkpoint, a warning lists the checkpoints
+        that were not reached and the curve stops at the last one that was. With
+        small train sizes a model may not have learned any instances at a
+        checkpoint (or since the previous one), in which case its test (or
+        training) score is NaN and is left out of the mean.
+
+        Parameters
+        ----------
+        chunks : iterable of (X, y) tuples
+            The training data stream, each chunk is an array-like of shape
+            (n_chunk_samples, n_features) and its target (which may be None
+            for unsupervised learning).
+
+        X_test : array-like, shape (n_test_samples, n_features)
+            The fixed holdout set used to compute the test scores.
+
+        y_test : array-like, shape (n_test_samples,) or None
+            The target of the holdout set.
+
+        n_samples : int, optional
+            The total number of instances in the stream, required to resolve
+            relative (float) ``train_sizes``.
+
+        classes : array-like, optional
+            All of the classes of a classification target, passed to the first
+            call of ``partial_fit``. Defaults to the classes in ``y_test``.
+
+        Returns
+        -------
+        self : instance
+            Returns the instance of the learning curve visualizer.
+        """
+        if not hasattr(self.estimator, "partial_fit"):
+            raise ModelError(
+                "fit_stream requires an estimator that implements partial_fit, "
+                "{} does not".format(self.name)
+            )
+
+        # Resolve the checkpoints as absolute numbers of streamed instances
+        if np.issubdtype(self.train_sizes.dtype, np.floating):
+            if n_samples is None:
+                raise YellowbrickValueError(
+                    "n_samples is required for relative train sizes when streaming"
+                )
+            checkpoints = np.ceil(self.train_sizes * n_samples).astype(int)
+        else:
+            checkpoints = self.train_sizes.astype(int)
+        checkpoints = np.unique(checkpoints[checkpoints > 0])
+
+        # Splitters whose number of folds depends on the data, e.g. LeaveOneOut,
+        # only see the holdout set since the stream is not known in advance
+        n_folds = check_cv(self.cv).get_n_splits(X_test, y_test, self.groups)
+        models = [clone(self.estimator) for _ in range(n_folds)]
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+        rng = check_random_state(self.random_state)
+
+        fit_params = {}
+        if is_classifier(self.estimator):
+            fit_params["classes"] = np.unique(y_test) if classes is None else classes
+
+        # Weighted training score totals of each model since the last checkpoint
+        train_totals = np.zeros((n_folds, 2))
+        fold_sizes = np.zeros(n_folds, dtype=int)
+        sizes, fold_train_sizes, train_scores, test_scores = [], [], [], []
+        seen = 0
+
+        for Xc, yc in chunks:
+            start = 0
+            n_chunk = Xc.shape[0]
+
+            # Split the chunk at any checkpoints that fall within it
+            while start < n_chunk and len(sizes) < len(checkpoints):
+                stop = min(n_chunk, start + checkpoints[len(sizes)] - seen)
+                folds = rng.randint(n_folds, size=stop - start)
+
+                for k, model in enumerate(models):
+                    idx = np.flatnonzero(folds != k) + start
+                    if len(idx) == 0:
+                        continue
+
+                    Xk, yk = safe_split(Xc, yc, idx)
+                    model.partial_fit(Xk, yk, **fit_params)
+                    train_totals[k] += (scorer(model, Xk, yk) * len(idx), len(idx))
+                    fold_sizes[k] += len(idx)
+
+                seen += stop - start
+                start = stop
+
+                if seen == checkpoints[len(sizes)]:
+                    # Models that have not learned any instances (since the last
+                    # checkpoint) cannot be scored, so their scores are NaN
+                    sizes.append(seen)
+                    fold_train_sizes.append(fold_sizes.copy())
+                    train_scores.append(
+                        np.divide(
+                            train_totals[:, 0],
+                            train_totals[:, 1],
+                            out=np.full(n_folds, np.nan),
+                            where=train_totals[:, 1] > 0,
+                        )
+                    )
+                    test_scores.append(
+                        [
+                            scorer(model, X_test, y_test) if size else np.nan
+                            for model, size in zip(models, fold_sizes)
+                        ]
+                    )
+                    train_totals[:] = 0
+
+            if len(sizes) == len(checkpoints):
+                break
+
+        if not sizes:
+            raise YellowbrickValueError(
+                "the stream was exhausted before the first train size was reached"
+            )
+
+        if len(sizes) < len(checkpoints):
+            warnings.warn(
+                (
+                    "the stream was exhausted after {} instances, the train sizes {} "
+                    "were not reached"
+                ).format(seen, ", ".join(map(str, checkpoints[len(sizes) :]))),
+                YellowbrickWarning,
+            )
+
+        self.train_sizes_ = np.asarray(sizes)
+        self.fold_train_sizes_ = np.asarray(fold_train_sizes)
+        self.train_scores_ = np.asarray(train_scores)
+        self.test_scores_ = np.asarray(test_scores)
+
+        # compute the mean and standard deviation of the training data; every
+        # instance is learned by all but one model so each row has a score
+        self.train_scores_mean_ = np.nanmean(self.train_scores_, axis=1)
+        self.train_scores_std_ = np.nanstd(self.train_scores_, axis=1)
+
+        # compute the mean and standard deviation of the test data
+        self.test_scores_mean_ = np.nanmean(self.test_scores_, axis=1)
+        self.test_scores_std_ = np.nanstd(self.test_scores_, axis=1)
+
+        # draw the curves on the current axes
+        self.draw()
+        return self
+
     def draw(self, **kwargs):
         """
         Renders the training and test learning curves.
@@ -0,0 +1,152 @@
+# yellowbrick.model_selection.utils
+# Utility functions for fitting and scoring estimators on cross validation folds
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+Utility functions for fitting and scoring estimators on cross validation folds
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import warnings
+import numpy as np
+
+from sklearn.utils import _safe_indexing
+from sklearn.exceptions import FitFailedWarning
+
+from yellowbrick.utils.timer import Timer
+
+
+##########################################################################
+## Fold Helpers
+##########################################################################
+
+
+def safe_split(X, y, indices, columns=None):
+    """
+    Returns the rows of X and y selected by the integer indices. If columns are
+    specified, only those columns of X are selected, before its rows, so that
+    only the selected subset of the data is copied, e.g. from a memory map of X
+    that is shared by parallel workers.
+
+    Parameters
+    ----------
+    X : array-like, sparse matrix or DataFrame of shape n x m
+        The data to select the rows (and columns) from.
+
+    y : array-like of length n or None
+        The target to select the rows from.
+
+    indices : array of int
+        The indices of the rows to select.
+
+    columns : array of int, default: None
+        The indices of the columns of X to select, all columns if None.
+
+    Returns
+    -------
+    X_subset, y_subset : array-like
+        The selected data and target (None if y is None).
+    """
+    if columns is None:
+        X_subset = _safe_indexing(X, indices)
+    elif isinstance(X, np.ndarray):
+        X_subset = X[np.ix_(indices, columns)]
+    else:
+        X_subset = _safe_indexing(_safe_indexing(X, columns, axis=1), indices)
+
+    y_subset = None if y is None else _safe_indexing(y, indices)
+    return X_subset, y_subset
+
+
+def fit_and_score(
+    estimator,
+    X,
+    y,
+    scorer,
+    train,
+    test,
+    columns=None,
+    return_train_score=False,
+    return_predictions=False,
+    error_score=np.nan,
+):
+    """
+    Fits the estimator on the training split of X (restricted to the specified
+    columns) and scores it on the test split. As in scikit-learn's cross
+    validation, if the estimator fails to fit a ``FitFailedWarning`` is issued
+    and the scores of the fold are set to error_score, unless it is "raise".
+
+    Parameters
+    ----------
+    estimator : estimator
+        An unfitted estimator that is fit on the training split.
+
+    X, y : array-like
+        The data and target that are split, y may be None.
+
+    scorer : callable
+        A scorer with signature ``scorer(estimator, X, y)``.
+
+    train, test : array of int
+        The indices of the training and test splits.
+
+    columns : array of int, default: None
+        The indices of the columns of X to fit and score on, all if None.
+
+    return_train_score : bool, default: False
+        If True, the estimator is also scored on the training split.
+
+    return_predictions : bool, default: False
+        If True, the true and predicted values of the test split are returned.
+
+    error_score : "raise" or numeric, default: np.nan
+        The score of a fold whose estimator failed to fit.
+
+    Returns
+    -------
+    result : dict
+        The ``test_score``, ``fit_time`` and ``score_time`` of the fold, the
+        ``train_score`` if return_train_score and the test target ``y_test`` and
+        predictions ``y_pred`` if return_predictions (``y_pred`` is None if the
+        estimator failed to fit).
+    """
+    X_train, y_train = safe_split(X, y, train, columns)
+    X_test, y_test = safe_split(X, y, test, columns)
+
+    try:
+        with Timer() as timer:
+            estimator.fit(X_train, y_train)
+    except Exception as e:
+        if isinstance(error_score, str) and error_score == "raise":
+            raise
+
+        warnings.warn(
+            "estimator fit failed, the scores of the fold are set to {}: {!r}".format(
+                error_score, e
+            ),
+            FitFailedWarning,
+        )
+
+        result = {"test_score": error_score, "fit_time": timer.interval}
+        result["score_time"] = 0.0
+        if return_train_score:
+            result["train_score"] = error_score
+        if return_predictions:
+            result["y_test"], result["y_pred"] = y_test, None
+        return result
+
+    result = {"fit_time": timer.interval}
+    with Timer() as timer:
+        result["test_score"] = scorer(estimator, X_test, y_test)
+    result["score_time"] = timer.interval
+
+    if return_train_score:
+        result["train_score"] = scorer(estimator, X_train, y_train)
+    if return_predictions:
+        result["y_test"], result["y_pred"] = y_test, estimator.predict(X_test)
+    return result
@@ -22,7 +22,12 @@ import numpy as np
 from yellowbrick.base import ModelVisualizer
 from yellowbrick.style import resolve_colors
 from yellowbrick.exceptions import YellowbrickValueError
+from yellowbrick.model_selection.utils import fit_and_score
 
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
 from sklearn.model_selection import validation_curve as sk_validation_curve
 
 
@@ -107,6 +112,14 @@ class ValidationCurve(ModelVisualizer):
         Matplotlib style markers for points on the plot points
         Options: '-,', '-+', '-o', '-*', '-v', '-h', '-d'
 
+    halving_factor : int or None, default: None
+        If specified, the curve is computed with successive halving rather than
+        evaluating every parameter value on every fold. All values are first
+        scored on a single cross-validation fold, then only the best
+        ``1/halving_factor`` of them are kept and evaluated on
+        ``halving_factor`` times as many folds, until the survivors have been
+        evaluated on all of the folds. Abandoned values are marked on the plot.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers.
@@ -131,6 +144,11 @@ class ValidationCurve(ModelVisualizer):
     test_scores_std_ : array, shape (n_ticks,)
         Standard deviation of test data scores for each test split
 
+    abandoned_ : array, shape (n_ticks,)
+        Boolean mask of the parameter values that were abandoned before being
+        evaluated on all folds when ``halving_factor`` is specified. The scores
+        of the folds that were not evaluated are NaN.
+
     Examples
     --------
 
@@ -167,6 +185,7 @@ class ValidationCurve(ModelVisualizer):
         n_jobs=1,
         pre_dispatch="all",
         markers='-d',
+        halving_factor=None,
         **kwargs
     ):
 
@@ -192,6 +211,7 @@ class ValidationCurve(ModelVisualizer):
         self.n_jobs = n_jobs
         self.pre_dispatch = pre_dispatch
         self.markers = markers
+        self.halving_factor = halving_factor
 
     def fit(self, X, y=None):
         """
@@ -230,21 +250,90 @@ class ValidationCurve(ModelVisualizer):
         }
 
         # compute the validation curve and store scores
-        curve = sk_validation_curve(self.estimator, X, y, **skvc_kwargs)
+        if self.halving_factor is None:
+            curve = sk_validation_curve(self.estimator, X, y, **skvc_kwargs)
+        else:
+            curve = self._successive_halving(X, y)
         self.train_scores_, self.test_scores_ = curve
 
+        if self.halving_factor is None:
+            # fold failures remain NaN in the means so that they are visible
+            self.abandoned_ = np.zeros(len(self.param_range), dtype=bool)
+            mean, std = np.mean, np.std
+        else:
+            # the folds that were not evaluated for abandoned values are NaN
+            self.abandoned_ = np.isnan(self.test_scores_).any(axis=1)
+            mean, std = np.nanmean, np.nanstd
+
         # compute the mean and standard deviation of the training data
-        self.train_scores_mean_ = np.mean(self.train_scores_, axis=1)
-        self.train_scores_std_ = np.std(self.train_scores_, axis=1)
+        self.train_scores_mean_ = mean(self.train_scores_, axis=1)
+        self.train_scores_std_ = std(self.train_scores_, axis=1)
 
         # compute the mean and standard deviation of the test data
-        self.test_scores_mean_ = np.mean(self.test_scores_, axis=1)
-        self.test_scores_std_ = np.std(self.test_scores_, axis=1)
+        self.test_scores_mean_ = mean(self.test_scores_, axis=1)
+        self.test_scores_std_ = std(self.test_scores_, axis=1)
 
         # draw the curves on the current axes
         self.draw()
         return self
 
+    def _successive_halving(self, X, y):
+        """
+        Computes the training and test scores of each parameter value on an
+        increasing number of folds, abandoning the worst values at each round.
+        Scores of the folds that were not evaluated are NaN.
+        """
+        factor = int(self.halving_factor)
+        if factor < 2:
+            raise YellowbrickValueError(
+                "halving_factor must be an integer of at least 2"
+            )
+
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y, self.groups))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+
+        n_params, n_splits = len(self.param_range), len(splits)
+        train_scores = np.full((n_params, n_splits), np.nan)
+        test_scores = np.full((n_params, n_splits), np.nan)
+
+        survivors = np.arange(n_params)
+        n_folds, budget = 0, 1
+        parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
+
+        while n_folds < n_splits:
+            # Evaluate the survivors on the folds added to the budget this round
+            folds = range(n_folds, min(budget, n_splits))
+            jobs = [(idx, fold) for idx in survivors for fold in folds]
+            scores = parallel(
+                delayed(fit_and_score)(
+                    clone(self.estimator).set_params(
+                        **{self.param_name: self.param_range[idx]}
+                    ),
+                    X,
+                    y,
+                    scorer,
+                    *splits[fold],
+                    return_train_score=True
+                )
+                for idx, fold in jobs
+            )
+
+            for (idx, fold), score in zip(jobs, scores):
+                train_scores[idx, fold] = score["train_score"]
+                test_scores[idx, fold] = score["test_score"]
+
+            n_folds, budget = folds.stop, budget * factor
+            if n_folds == n_splits:
+                break
+
+            # Keep the best 1/halving_factor values for the next round
+            n_keep = max(1, int(np.ceil(len(survivors) / factor)))
+            means = np.mean(test_scores[survivors, :n_folds], axis=1)
+            survivors = np.sort(survivors[np.argsort(-means, kind="stable")[:n_keep]])
+
+        return train_scores, test_scores
+
     def draw(self, **kwargs):
         """
         Renders the training and test curves.
@@ -259,17 +348,36 @@ class ValidationCurve(ModelVisualizer):
         # Get the colors for the train and test curves
         colors = resolve_colors(n_colors=2)
 
+        # Only values evaluated on the full budget are part of the curves
+        complete = ~self.abandoned_
+        param_range = self.param_range[complete]
+
         # Plot the fill betweens first so they are behind the curves.
         for idx, (mean, std) in enumerate(curves):
+            mean, std = mean[complete], std[complete]
             # Plot one standard deviation above and below the mean
             self.ax.fill_between(
-                self.param_range, mean - std, mean + std, alpha=0.25, color=colors[idx]
+                param_range, mean - std, mean + std, alpha=0.25, color=colors[idx]
             )
 
         # Plot the mean curves so they are in front of the variance fill
         for idx, (mean, _) in enumerate(curves):
             self.ax.plot(
-                self.param_range, mean, self.markers, color=colors[idx], label=labels[idx]
+                param_range,
+                mean[complete],
+                self.markers,
+                color=colors[idx],
+                label=labels[idx],
+            )
+
+        # Mark the partial test scores of the abandoned values
+        if self.abandoned_.any():
+            self.ax.scatter(
+                self.param_range[self.abandoned_],
+                self.test_scores_mean_[self.abandoned_],
+                marker="x",
+                color=colors[1],
+                label="Abandoned",
             )
 
         if self.logx:
@@ -312,6 +420,7 @@ def validation_curve(
     pre_dispatch="all",
     show=True,
     markers='-d',
+    halving_factor=None,
     **kwargs
 ):
     """
@@ -391,6 +500,11 @@ def validation_curve(
         Matplotlib style markers for points on the plot points
         Options: '-,', '-+', '-o', '-*', '-v', '-h', '-d'
 
+    halving_factor : int or None, default: None
+        If specified, the curve is computed with successive halving, keeping
+        only the best ``1/halving_factor`` of the parameter values after each
+        round and evaluating them on ``halving_factor`` times as many folds.
+
     kwargs : dict
         Keyword arguments that are passed to the base class and may influence
         the visualization as defined in other Visualizers. These arguments are
@@ -416,6 +530,7 @@ def validation_curve(
         n_jobs=n_jobs,
         pre_dispatch=pre_dispatch,
         markers=markers,
+        halving_factor=halving_factor,
     )
 
     # Fit the visualizer
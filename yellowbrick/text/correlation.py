@@ -19,6 +19,7 @@ Implementation of word correlation for text visualization.
 ##########################################################################
 
 import numpy as np
+import scipy.sparse as sp
 
 from sklearn.feature_extraction.text import CountVectorizer
 
@@ -53,6 +54,12 @@ class WordCorrelationPlot(TextVisualizer):
     ignore_case : bool, default: False
         If True, all words will be converted to lowercase before processing.
 
+    vocabulary : dict, default: None
+        A mapping of terms to column indices of an existing document-term matrix,
+        e.g. the ``vocabulary_`` of a fitted vectorizer. If specified, fit() expects
+        the document-term matrix rather than the documents, so that a vectorized
+        corpus is not tokenized again.
+
     ax : matplotlib Axes, default: None
         The axes to plot the figure on.
 
@@ -90,6 +97,7 @@ class WordCorrelationPlot(TextVisualizer):
         self,
         words,
         ignore_case=False,
+        vocabulary=None,
         ax=None,
         cmap="RdYlBu",
         colorbar=True,
@@ -105,6 +113,7 @@ class WordCorrelationPlot(TextVisualizer):
 
         # Fitting parameters
         self.ignore_case = ignore_case
+        self.vocabulary = vocabulary
         self.words = self._construct_terms(words, ignore_case)
         self.ngram_range = self._compute_ngram_range()
 
@@ -135,20 +144,41 @@ class WordCorrelationPlot(TextVisualizer):
         ngrams = [len(word.split()) for word in self.words]
         return (min(ngrams), max(ngrams))
 
-    def _compute_coefficient(self, m, n):
+    def _compute_coefficients(self):
+        """
+        Computes the phi-coefficients between all pairs of words, which are
+        correlation values between -1 and 1 inclusive. The number of documents that
+        contain both words of every pair is computed with a single product of the
+        binary document-term matrix with itself, and the number of documents that
+        contain each word is its diagonal.
+        """
+        both = (self.doc_term_matrix_.T @ self.doc_term_matrix_).toarray()
+        totals = np.diag(both)
+        m_total, n_total = totals[:, None], totals[None, :]
+
+        # The denominator is computed in floating point to avoid integer overflow
+        m_total, n_total = m_total.astype(float), n_total.astype(float)
+
+        # Equivalent to (both * neither) - (only_m * only_n) of the contingency table
+        numerator = both * self.num_docs_ - m_total * n_total
+        return numerator / np.sqrt(
+            m_total * n_total * (self.num_docs_ - m_total) * (self.num_docs_ - n_total)
+        )
+
+    def _select_terms(self, X):
         """
-        Computes the phi-coefficient for two words m and n, which is a correlation
-        value between -1 and 1 inclusive.
+        Selects the binary columns of the words from an existing document-term matrix
+        using the vocabulary.
         """
-        m_col = self.doc_term_matrix_.getcol(self.vocab_[m])
-        n_col = self.doc_term_matrix_.getcol(self.vocab_[n])
-        both = m_col.multiply(n_col).sum()
-        m_total = m_col.sum()
-        n_total = n_col.sum()
-        only_m = m_total - both
-        only_n = n_total - both
-        neither = self.num_docs_ - both - only_m - only_n
-        return ((both * neither) - (only_m * only_n)) / np.sqrt(m_total * n_total * (self.num_docs_ - m_total) * (self.num_docs_ - n_total))
+        missing = [word for word in self.words if word not in self.vocabulary]
+        if missing:
+            raise YellowbrickValueError(
+                "Word '{}' does not exist in the corpus.".format(missing[0])
+            )
+
+        columns = [self.vocabulary[word] for word in self.words]
+        X = sp.csc_matrix(X)[:, columns]
+        return (X > 0).astype(np.int64).tocsr()
 
     def fit(self, X, y=None):
         """
@@ -157,9 +187,10 @@ class WordCorrelationPlot(TextVisualizer):
 
         Parameters
         ----------
-        X : list of str or generator
+        X : list of str or generator or array-like of shape (n_docs, n_terms)
             Should be provided as a list of strings or a generator yielding strings
-            that represent the documents in the corpus.
+            that represent the documents in the corpus, or as a document-term matrix
+            if the vocabulary is specified.
         
         y : None
             Labels are not used for the word correlation visualization.
@@ -188,30 +219,34 @@ class WordCorrelationPlot(TextVisualizer):
             The computed matrix containing the phi-coefficients between all features.
         """
 
-        # Instantiate the CountVectorizer
-        vecs = CountVectorizer(
-            vocabulary=self.words,
-            lowercase=self.ignore_case,
-            ngram_range=self.ngram_range,
-            binary=True
-        )
+        if self.vocabulary is not None:
+            # Use the columns of the words in the existing document-term matrix
+            self.doc_term_matrix_ = self._select_terms(X)
+            self.vocab_ = {word: idx for idx, word in enumerate(self.words)}
+        else:
+            # Instantiate the CountVectorizer
+            vecs = CountVectorizer(
+                vocabulary=self.words,
+                lowercase=self.ignore_case,
+                ngram_range=self.ngram_range,
+                binary=True
+            )
+
+            # Get the binary document counts for the target words
+            self.doc_term_matrix_ = vecs.fit_transform(X)
+            self.vocab_ = vecs.vocabulary_
 
-        # Get the binary document counts for the target words
-        self.doc_term_matrix_ = vecs.fit_transform(X)
         self.num_docs_ = self.doc_term_matrix_.shape[0]
-        self.vocab_ = vecs.vocabulary_
 
         # Verify that all target words exist in the corpus
+        totals = np.asarray(self.doc_term_matrix_.sum(axis=0)).ravel()
         for word in self.words:
-            if self.doc_term_matrix_.getcol(self.vocab_[word]).sum() == 0:
+            if totals[self.vocab_[word]] == 0:
                 raise YellowbrickValueError("Word '{}' does not exist in the corpus.".format(word))
 
-        # Compute the phi-coefficient for each pair of words
+        # Compute the phi-coefficient for all pairs of words at once
         self.num_features_ = len(self.words)
-        self.correlation_matrix_ = np.zeros((self.num_features_, self.num_features_))
-        for i, m in enumerate(self.words):
-            for j, n in enumerate(self.words):
-                self.correlation_matrix_[i, j] = self._compute_coefficient(m, n)
+        self.correlation_matrix_ = self._compute_coefficients()
 
         self.draw(X)
         return self
@@ -283,6 +318,7 @@ def word_correlation(
     words,
     corpus,
     ignore_case=True,
+    vocabulary=None,
     ax=None,
     cmap="RdYlBu",
     show=True,
@@ -303,11 +339,16 @@ def word_correlation(
     words : list of str
         The corpus words to display in the heatmap.
     corpus : list of str or generator
-        The corpus as a list of documents or a generator yielding documents.
+        The corpus as a list of documents or a generator yielding documents, or a
+        document-term matrix if the vocabulary is specified.
 
     ignore_case : bool, default: True
         If True, all words will be converted to lowercase before proessing.
 
+    vocabulary : dict, default: None
+        A mapping of terms to column indices of the document-term matrix passed as
+        the corpus, e.g. the ``vocabulary_`` of a fitted vectorizer.
+
     ax : matplotlib axes, default: None
         The axes to plot the figure on.
 
@@ -329,6 +370,7 @@ def word_correlation(
     visualizer = WordCorrelationPlot(
         words=words,
         lowercase=ignore_case,
+        vocabulary=vocabulary,
         ax=ax,
         cmap=cmap,
         colorbar=colorbar,
@@ -123,8 +123,16 @@ class DispersionPlot(TextVisualizer):
 
     def _compute_dispersion(self, X, y):
         """
-        Produces a generator containing the offset word count, y_coordinate, and
-        label/category for each occurrance of the search terms.
+        Computes the offset word count, y_coordinate, and category index for each
+        occurrance of the search terms. The search terms are looked up in a hash map
+        from each word to its y coordinates, so every token of the corpus is only
+        looked up once, and the occurrences of each document are gathered as arrays.
+
+        Returns
+        -------
+        offsets, positions, categories : ndarray of shape (n_occurrences,)
+            The offset, y coordinate and index of the category in ``self.classes_``
+            of each occurrence, in the order they appear in the corpus.
 
         Attributes
         ----------
@@ -132,44 +140,84 @@ class DispersionPlot(TextVisualizer):
             A list of integers indicating the document boundaries with respect to
             word offsets.
         """
+        # Map each search term to all of its y coordinates (if duplicates are given)
+        terms = defaultdict(list)
+        for y_coord, word in enumerate(self.indexed_words_):
+            terms[word].append(y_coord)
+
+        lookup = {word: idx for idx, word in enumerate(terms)}
+        counts = np.array([len(y_coords) for y_coords in terms.values()])
+        starts = np.cumsum(counts) - counts
+        y_coords = np.concatenate([y_coords for y_coords in terms.values()])
+
         self.boundaries_ = []
+        offsets, positions, categories = [], [], []
         offset = 0
 
         if y is None:
             y = itertools.repeat(None)
 
         for doc, category in zip(X, y):
-            for word in doc:
-                if self.ignore_case:
-                    word = word.lower()
-
-                # NOTE: this will find all indices if duplicate words are supplied
-                # In the case that word is not in target words, any empty list is
-                # returned and no data will be yielded
-                offset += 1
-                for y_coord in (self.indexed_words_ == word).nonzero()[0]:
-                    y_coord = int(y_coord)
-                    yield (offset, y_coord, category)
+            if self.ignore_case:
+                doc = [word.lower() for word in doc]
+
+            # Find the term of each word of the document, -1 if not a search term,
+            # and count the words while doing so since documents may be generators
+            codes = np.fromiter((lookup.get(word, -1) for word in doc), dtype=int)
+            hits = np.flatnonzero(codes >= 0)
+            n_words = len(codes)
+
+            if len(hits) > 0:
+                # Expand each occurrence to all of the y coordinates of its term
+                codes = codes[hits]
+                repeats = counts[codes]
+                index = np.arange(repeats.sum()) - np.repeat(
+                    np.cumsum(repeats) - repeats - starts[codes], repeats
+                )
+
+                offsets.append(np.repeat(offset + hits + 1, repeats))
+                positions.append(y_coords[index])
+                categories.append(
+                    np.full(len(index), self._class_index(category), dtype=int)
+                )
 
+            offset += n_words
             if self.annotate_docs:
                 self.boundaries_.append(offset)
 
         self.boundaries_ = np.array(self.boundaries_, dtype=int)
 
+        if not offsets:
+            return (np.empty(0, dtype=int),) * 3
+        return (
+            np.concatenate(offsets),
+            np.concatenate(positions),
+            np.concatenate(categories),
+        )
+
+    def _class_index(self, category):
+        """
+        Returns the index of the category in the sorted ``self.classes_``.
+        """
+        if category is None:
+            return 0
+        return int(np.searchsorted(self.classes_, category))
+
     def _check_missing_words(self, points):
         """
         Helper method to raise an error if any of the requested search
         terms do not appear in the corpus.
         """
-        for index in range(len(self.indexed_words_)):
-            if index in points[:, 1]:
-                pass
-            else:
-                raise YellowbrickValueError(
-                    ("The search term '{}' is not found in " "this corpus").format(
-                        self.indexed_words_[index]
-                    )
+        found = np.zeros(len(self.indexed_words_), dtype=bool)
+        found[points[:, 1]] = True
+
+        missing = np.flatnonzero(~found)
+        if len(missing) > 0:
+            raise YellowbrickValueError(
+                ("The search term '{}' is not found in " "this corpus").format(
+                    self.indexed_words_[missing[0]]
                 )
+            )
 
     def fit(self, X, y=None, **kwargs):
         """
@@ -219,20 +267,12 @@ class DispersionPlot(TextVisualizer):
         if self.ignore_case:
             self.indexed_words_ = np.array([w.lower() for w in self.indexed_words_])
 
-        # Stack is used to create a 2D array from the generator
-        try:
-            offsets_positions_categories = np.stack(self._compute_dispersion(X, y))
-        except ValueError:
+        offsets, positions, categories = self._compute_dispersion(X, y)
+        if len(offsets) == 0:
             raise YellowbrickValueError(("No search terms were found in the corpus"))
 
-        word_positions = np.stack(
-            zip(
-                offsets_positions_categories[:, 0].astype(int),
-                offsets_positions_categories[:, 1].astype(int),
-            )
-        )
-
-        self.word_categories_ = offsets_positions_categories[:, 2]
+        word_positions = np.column_stack((offsets, positions))
+        self.word_categories_ = self.classes_[categories]
 
         self._check_missing_words(word_positions)
 
@@ -273,23 +313,19 @@ class DispersionPlot(TextVisualizer):
             for xcoords in self.boundaries_:
                 self.ax.axvline(x=xcoords, color="lightgray", linestyle="dashed")
 
-        series = defaultdict(lambda: {"x": [], "y": []})
-
-        if self.word_categories_ is not None:
-            for point, t in zip(points, self.word_categories_):
-                label = labels[t]
-                series[label]["x"].append(point[0])
-                series[label]["y"].append(point[1])
+        # Draw a single scatter for each category in order of first occurrence
+        if len(self.classes_) > 1:
+            codes = np.searchsorted(self.classes_, self.word_categories_)
         else:
-            label = self.classes_[0]
-            for x, y in points:
-                series[label]["x"].append(x)
-                series[label]["y"].append(y)
+            codes = np.zeros(len(points), dtype=int)
 
-        for label, points in series.items():
+        _, first = np.unique(codes, return_index=True)
+        for code in codes[np.sort(first)]:
+            label = labels[self.classes_[code]]
+            mask = codes == code
             self.ax.scatter(
-                points["x"],
-                points["y"],
+                points[mask, 0],
+                points[mask, 1],
                 marker="|",
                 c=colors[label],
                 zorder=100,
@@ -18,6 +18,7 @@ Implementations of frequency distributions for text visualization
 ##########################################################################
 
 import numpy as np
+import scipy.sparse as sp
 
 from operator import itemgetter
 
@@ -130,6 +131,26 @@ class FrequencyVisualizer(TextVisualizer):
 
     These parameters can be influenced later on in the visualization
     process, but can and should be set as early as possible.
+
+    Attributes
+    ----------
+    freqdist_ : ndarray of shape (n_features,)
+        The total count of each term in the corpus.
+
+    conditional_freqdist_ : dict or None
+        The counts of each term in the documents of each class, if y is given.
+
+    sorted_ : ndarray of shape (n,)
+        The indices of the top n terms in descending order of their count.
+
+    vocab_, words_, hapaxes_ : int
+        The number of terms, of words and of terms that only occur once.
+
+    Notes
+    -----
+    Counts can be accumulated over batches of documents with ``partial_fit``, or
+    computed on separate parts of the corpus (e.g. by parallel workers) and
+    combined with ``merge``, so that the corpus never has to be held in memory.
     """
 
     def __init__(self, features, ax=None, n=50, orient="h", color=None, **kwargs):
@@ -194,27 +215,102 @@ class FrequencyVisualizer(TextVisualizer):
         .. note:: Text documents must be vectorized before ``fit()``.
         """
 
-        # Compute the conditional word frequency
+        # Reset the counts and accumulate the entire corpus
+        self.freqdist_ = None
+        self.conditional_freqdist_ = None
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X, y=None):
+        """
+        Adds the term counts of a batch of vectorized documents to the total (and
+        per-class) counts and redraws the distribution, so that the distribution of
+        a corpus that does not fit in memory can be computed one batch at a time.
+
+        Parameters
+        ----------
+        X : ndarray or sparse matrix of shape n x m
+            A batch of n documents vectorized with the same m features.
+
+        y : ndarray or Series of shape n
+            Labels for the documents for conditional frequency distribution.
+        """
+        counts = self.count(X)
+
+        # Count the terms of all classes with a single product of a sparse class
+        # indicator matrix with the documents rather than one mask per class.
+        conditional = None
         if y is not None:
-            # Fit the frequencies
-            self.conditional_freqdist_ = {}
+            labels, y = np.unique(np.asarray(y), return_inverse=True)
+            indicator = sp.csr_matrix(
+                (np.ones(len(y)), (y, np.arange(len(y)))),
+                shape=(len(labels), len(y)),
+                dtype=counts.dtype,
+            )
+            class_counts = indicator @ X
+            if sp.issparse(class_counts):
+                class_counts = class_counts.toarray()
+            class_counts = np.asarray(class_counts)
+            conditional = {
+                str(label): class_counts[idx] for idx, label in enumerate(labels)
+            }
+
+        return self._accumulate(counts, conditional)
+
+    def merge(self, other):
+        """
+        Merges the counts of another fitted frequency visualizer with the same
+        features into this one and redraws the distribution, e.g. to combine the
+        counts of parts of a corpus computed by parallel workers.
 
-            # Conditional frequency distribution
-            self.classes_ = [str(label) for label in set(y)]
-            for label in self.classes_:
-                self.conditional_freqdist_[label] = self.count(X[y == label])
-        else:
-            # No conditional frequencies
+        Parameters
+        ----------
+        other : FrequencyVisualizer
+            A visualizer fitted on another part of the corpus.
+        """
+        if getattr(other, "freqdist_", None) is None:
+            raise YellowbrickValueError("cannot merge an unfitted visualizer")
+
+        return self._accumulate(other.freqdist_, other.conditional_freqdist_)
+
+    def _accumulate(self, counts, conditional=None):
+        """
+        Adds the total and conditional counts to the fitted counts, then computes
+        the top terms and the corpus statistics and draws the distribution.
+        """
+        if getattr(self, "freqdist_", None) is None:
+            self.freqdist_ = np.zeros_like(counts)
             self.conditional_freqdist_ = None
 
+        if counts.shape != self.freqdist_.shape:
+            raise YellowbrickValueError(
+                "cannot count {} features into a distribution of {} features".format(
+                    counts.shape[0], self.freqdist_.shape[0]
+                )
+            )
+
         # Frequency distribution of entire corpus.
-        self.freqdist_ = self.count(X)
-        self.sorted_ = self.freqdist_.argsort()[::-1]  # Descending order
+        self.freqdist_ = self.freqdist_ + counts
+
+        # Compute the conditional word frequency
+        if conditional is not None:
+            if self.conditional_freqdist_ is None:
+                self.conditional_freqdist_ = {}
+
+            for label, values in conditional.items():
+                if label in self.conditional_freqdist_:
+                    values = self.conditional_freqdist_[label] + values
+                self.conditional_freqdist_[label] = values
+            self.classes_ = sorted(self.conditional_freqdist_)
+
+        # Select the top N words without sorting the entire vocabulary
+        n = min(self.N, self.freqdist_.shape[0])
+        top = np.argpartition(-self.freqdist_, n - 1)[:n]
+        self.sorted_ = top[np.lexsort((-top, -self.freqdist_[top]))]  # Descending
 
         # Compute the number of words, vocab, and hapaxes
         self.vocab_ = self.freqdist_.shape[0]
         self.words_ = self.freqdist_.sum()
-        self.hapaxes_ = sum(1 for c in self.freqdist_ if c == 1)
+        self.hapaxes_ = int(np.count_nonzero(self.freqdist_ == 1))
 
         # Draw and ensure that we return self
         self.draw()
@@ -231,7 +327,7 @@ class FrequencyVisualizer(TextVisualizer):
 
         """
         # Prepare the data
-        bins = np.arange(self.N)
+        bins = np.arange(len(self.sorted_))
         words = [self.features[i] for i in self.sorted_[: self.N]]
         freqs = {}
 
@@ -244,18 +340,28 @@ class FrequencyVisualizer(TextVisualizer):
         else:
             freqs["corpus"] = [self.freqdist_[i] for i in self.sorted_[: self.N]]
 
+        # Remove the bars drawn for previously accumulated batches
+        for bars in getattr(self, "_bars", []):
+            bars.remove()
+        self._bars = []
+
         # Draw a horizontal barplot
         if self.orient == "h":
             # Add the barchart, stacking if necessary
             for label, freq in freqs.items():
-                self.ax.barh(bins, freq, label=label, color=self.color, align="center")
+                self._bars.append(
+                    self.ax.barh(
+                        bins, freq, label=label, color=self.color, align="center"
+                    )
+                )
 
             # Set the y ticks to the words
             self.ax.set_yticks(bins)
             self.ax.set_yticklabels(words)
 
             # Order the features from top to bottom on the y axis
-            self.ax.invert_yaxis()
+            if not self.ax.yaxis_inverted():
+                self.ax.invert_yaxis()
 
             # Turn off y grid lines and turn on x grid lines
             self.ax.yaxis.grid(False)
@@ -265,7 +371,9 @@ class FrequencyVisualizer(TextVisualizer):
         elif self.orient == "v":
             # Add the barchart, stacking if necessary
             for label, freq in freqs.items():
-                self.ax.bar(bins, freq, label=label, color=self.color, align="edge")
+                self._bars.append(
+                    self.ax.bar(bins, freq, label=label, color=self.color, align="edge")
+                )
 
             # Set the y ticks to the words
             self.ax.set_xticks(bins)
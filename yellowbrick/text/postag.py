@@ -20,10 +20,14 @@ small subset of documents.
 ##########################################################################
 
 import numpy as np
+import itertools
 import importlib
 
+from joblib import Parallel, delayed, effective_n_jobs
+
 from yellowbrick.draw import bar_stack
 from yellowbrick.text.base import TextVisualizer
+from yellowbrick.utils.cache import fingerprint, resolve_cache
 from yellowbrick.style.colors import resolve_colors
 from yellowbrick.exceptions import YellowbrickValueError
 
@@ -76,6 +80,57 @@ UNIVERSAL_TAGS = [
     "other",
 ]
 
+# Map of Universal Dependencies tags to the part-of-speech they are counted as
+UNIVERSAL_JUMP = {
+    # combine proper and regular nouns
+    "NOUN": "noun",
+    "PROPN": "noun",
+    "ADJ": "adjective",
+    "VERB": "verb",
+    # include particles with adverbs
+    "ADV": "adverb",
+    "PART": "adverb",
+    "ADP": "adposition",
+    "PRON": "pronoun",
+    "CCONJ": "conjunction",
+    "PUNCT": "punctuation",
+    "DET": "determiner",
+    "NUM": "number",
+    "INTJ": "interjection",
+    "SYM": "symbol",
+}
+
+
+##########################################################################
+# Tagging helpers
+##########################################################################
+
+
+def _batches(X, batch_size):
+    """
+    Yields lists of at most batch_size consecutive documents from an iterable.
+    """
+    X = iter(X)
+    while True:
+        batch = list(itertools.islice(X, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _nltk_tag(docs, tagger="word"):
+    """
+    Tags a batch of raw documents with NLTK into lists of (sentence) lists of
+    (token, tag) tuples. This is a module level function so that batches can be
+    tagged in worker processes.
+    """
+    nltk = importlib.import_module("nltk")
+    tokenize = getattr(nltk, "{}_tokenize".format(tagger))
+    return [
+        [nltk.pos_tag(tokenize(sent)) for sent in nltk.sent_tokenize(doc)]
+        for doc in docs
+    ]
+
 
 ##########################################################################
 # PosTagVisualizer
@@ -134,6 +189,23 @@ class PosTagVisualizer(TextVisualizer):
         'nltk_wordpunct' would use the NLTK library with 'wordpunct' tagset. Or
         'spacy_en_core_web_sm' would use SpaCy with the 'en_core_web_sm' tagset.
 
+    n_jobs : int, default: None
+        The number of processes used to tag raw documents when a parser is
+        specified; NLTK batches are tagged in a process pool and SpaCy batches are
+        streamed through ``nlp.pipe`` with as many processes. None means 1 unless
+        in a joblib.parallel_backend context, -1 means using all processors.
+
+    batch_size : int, default: 100
+        The number of raw documents tagged at a time when a parser is specified.
+        The tags are counted as the tagged batches are produced, so only the
+        batches being tagged are held in memory.
+
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the part-of-speech counts of each raw document when
+        a parser is specified, so that fitting the corpus again with the same parser
+        and tagset only tags the new or changed documents. See ``EmbeddingCache``
+        for the accepted values.
+
     kwargs : dict
         Pass any additional keyword arguments to the PosTagVisualizer.
 
@@ -142,6 +214,9 @@ class PosTagVisualizer(TextVisualizer):
     pos_tag_counts_: dict
         Mapping of part-of-speech tags to counts.
 
+    cached_docs_: int
+        The number of documents whose counts were read from the cache.
+
     Examples
     --------
     >>> viz = PosTagVisualizer()
@@ -158,6 +233,9 @@ class PosTagVisualizer(TextVisualizer):
         frequency=False,
         stack=False,
         parser=None,
+        n_jobs=None,
+        batch_size=100,
+        cache=None,
         **kwargs,
     ):
         super(PosTagVisualizer, self).__init__(ax=ax, **kwargs)
@@ -180,6 +258,15 @@ class PosTagVisualizer(TextVisualizer):
         self.stack = stack
         self.parser = parser
 
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise YellowbrickValueError(
+                "batch_size must be a positive integer not {}".format(batch_size)
+            )
+
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
+        self.cache = cache
+
     @property
     def parser(self):
         return self._parser
@@ -276,11 +363,16 @@ class PosTagVisualizer(TextVisualizer):
             Returns the instance of the transformer/visualizer
         """
         self.labels_ = ["documents"]
+        counts = None
 
         if self.parser:
-            parser_name = self.parser.split("_", 1)[0]
-            parse_func = getattr(self, "parse_{}".format(parser_name))
-            X = parse_func(X)
+            cache = resolve_cache(self.cache)
+            if cache is not None:
+                counts = self._cached_counts(X, cache)
+            else:
+                parser_name = self.parser.split("_", 1)[0]
+                parse_func = getattr(self, "parse_{}".format(parser_name))
+                X = parse_func(X)
 
         if self.stack:
             if y is None:
@@ -289,11 +381,17 @@ class PosTagVisualizer(TextVisualizer):
 
         if self.tagset == "penn_treebank":
             self.pos_tag_counts_ = self._penn_tag_map()
-            self._handle_treebank(X, y)
+            if counts is None:
+                self._handle_treebank(X, y)
 
         elif self.tagset == "universal":
             self.pos_tag_counts_ = self._uni_tag_map()
-            self._handle_universal(X, y)
+            if counts is None:
+                self._handle_universal(X, y)
+
+        # Read the counts of each document from the cache
+        if counts is not None:
+            self._handle_counts(counts, y)
 
         self.draw()
 
@@ -314,18 +412,26 @@ class PosTagVisualizer(TextVisualizer):
         nltk.data.find("corpora/treebank")
         tagger = self.parser.split("_", 1)[1]
 
-        if tagger == "word":
-            for doc in X:
-                yield [
-                    nltk.pos_tag(nltk.word_tokenize(sent))
-                    for sent in nltk.sent_tokenize(doc)
-                ]
-        elif tagger == "wordpunct":
-            for doc in X:
-                yield [
-                    nltk.pos_tag(nltk.wordpunct_tokenize(sent))
-                    for sent in nltk.sent_tokenize(doc)
-                ]
+        batches = _batches(X, self.batch_size)
+        n_jobs = effective_n_jobs(self.n_jobs)
+
+        if n_jobs == 1:
+            for batch in batches:
+                yield from _nltk_tag(batch, tagger)
+            return
+
+        # Tag n_jobs batches at a time in the worker processes, yielding the tagged
+        # documents in order so that they can be counted as they are produced.
+        with Parallel(n_jobs=n_jobs) as parallel:
+            while True:
+                group = list(itertools.islice(batches, n_jobs))
+                if not group:
+                    break
+
+                for tagged in parallel(
+                    delayed(_nltk_tag)(batch, tagger) for batch in group
+                ):
+                    yield from tagged
 
     def parse_spacy(self, X):
         """
@@ -340,21 +446,86 @@ class PosTagVisualizer(TextVisualizer):
         """
         spacy = importlib.import_module("spacy")
         tagger = self.parser.split("_", 1)[1]
-        nlp = spacy.load(tagger)
-
-        if isinstance(X, list):
-            for doc in X:
-                tagged = nlp(doc)
-                yield [
-                    [(token.text, token.pos_) for token in sents]
-                    for sents in tagged.sents
-                ]
-        elif isinstance(X, str):
-            tagged = nlp(X)
+
+        # Load the model once rather than every time a batch is parsed
+        if getattr(self, "_nlp", (None,))[0] != tagger:
+            self._nlp = (tagger, spacy.load(tagger))
+        nlp = self._nlp[1]
+
+        if isinstance(X, str):
+            X = [X]
+
+        # Stream the documents through the pipeline in batches
+        for tagged in nlp.pipe(
+            X, batch_size=self.batch_size, n_process=effective_n_jobs(self.n_jobs)
+        ):
             yield [
                 [(token.text, token.pos_) for token in sents] for sents in tagged.sents
             ]
 
+    def _cached_counts(self, X, cache):
+        """
+        Yields the part-of-speech counts of each raw document in the order of the
+        tagset, reading them from the cache if the document has been tagged before
+        with the same parser and tagset. The documents that are not cached are tagged
+        in batches with the parser and their counts are added to the cache. The
+        counts are stored in the "postag" namespace of the cache, so that they are
+        evicted separately from the embeddings, once per fit.
+        """
+        parser_name = self.parser.split("_", 1)[0]
+        parse_func = getattr(self, "parse_{}".format(parser_name))
+        tag_func = getattr(self, "_{}_tag".format(self.tagset))
+        tags = PENN_TAGS if self.tagset == "penn_treebank" else UNIVERSAL_TAGS
+        index = {tag: idx for idx, tag in enumerate(tags)}
+
+        if isinstance(X, str):
+            X = [X]
+
+        cache = cache.namespace("postag")
+        self.cached_docs_ = 0
+        chunk_size = self.batch_size * effective_n_jobs(self.n_jobs)
+
+        for chunk in _batches(X, chunk_size):
+            keys = [
+                fingerprint(doc, self.parser, tagset=self.tagset) for doc in chunk
+            ]
+            counts = [cache.get(key) for key in keys]
+            missing = [idx for idx, count in enumerate(counts) if count is None]
+            self.cached_docs_ += len(chunk) - len(missing)
+
+            # Tag all of the missing documents of the chunk at once
+            tagged_docs = []
+            if missing:
+                tagged_docs = parse_func([chunk[idx] for idx in missing])
+            for idx, tagged_doc in zip(missing, tagged_docs):
+                count = np.zeros(len(tags), dtype=int)
+                for tagged_sent in tagged_doc:
+                    for _, tag in tagged_sent:
+                        tag = tag_func(tag)
+                        if tag is not None:
+                            count[index[tag]] += 1
+
+                cache.set(keys[idx], count, evict=False)
+                counts[idx] = count
+
+            yield from counts
+
+        cache.evict()
+
+    def _handle_counts(self, counts, y=None):
+        """
+        Adds the part-of-speech counts of each document, in the order of the
+        tagset, to the counts of its label.
+        """
+        for idx, count in enumerate(counts):
+            if self.stack:
+                counter = self.pos_tag_counts_[y[idx]]
+            else:
+                counter = self.pos_tag_counts_["documents"]
+
+            for tag, value in zip(self._pos_tags, count):
+                counter[tag] += int(value)
+
     def _penn_tag_map(self):
         """
         Returns a Penn Treebank part-of-speech tag map.
@@ -391,36 +562,27 @@ class PosTagVisualizer(TextVisualizer):
             that yields a list of documents that contain a list of
             sentences that contain (token, tag) tuples.
         """
-        jump = {
-            # combine proper and regular nouns
-            "NOUN": "noun",
-            "PROPN": "noun",
-            "ADJ": "adjective",
-            "VERB": "verb",
-            # include particles with adverbs
-            "ADV": "adverb",
-            "PART": "adverb",
-            "ADP": "adposition",
-            "PRON": "pronoun",
-            "CCONJ": "conjunction",
-            "PUNCT": "punctuation",
-            "DET": "determiner",
-            "NUM": "number",
-            "INTJ": "interjection",
-            "SYM": "symbol",
-        }
-
         for idx, tagged_doc in enumerate(X):
             for tagged_sent in tagged_doc:
                 for _, tag in tagged_sent:
-                    if tag == "SPACE":
+                    tag = self._universal_tag(tag)
+                    if tag is None:
                         continue
                     if self.stack:
                         counter = self.pos_tag_counts_[y[idx]]
                     else:
                         counter = self.pos_tag_counts_["documents"]
 
-                    counter[jump.get(tag, "other")] += 1
+                    counter[tag] += 1
+
+    def _universal_tag(self, tag):
+        """
+        Returns the part-of-speech of a Universal Dependencies tag, or None if the
+        tag is not counted.
+        """
+        if tag == "SPACE":
+            return None
+        return UNIVERSAL_JUMP.get(tag, "other")
 
     def _handle_treebank(self, X, y=None):
         """
@@ -441,48 +603,54 @@ class PosTagVisualizer(TextVisualizer):
                     else:
                         counter = self.pos_tag_counts_["documents"]
 
-                    if tag.startswith("N"):
-                        counter["noun"] += 1
-                    elif tag.startswith("J"):
-                        counter["adjective"] += 1
-                    elif tag.startswith("V"):
-                        counter["verb"] += 1
-                    # include particles with adverbs
-                    elif tag.startswith("RB") or tag == "RP":
-                        counter["adverb"] += 1
-                    elif tag.startswith("PR"):
-                        counter["pronoun"] += 1
-                    elif tag.startswith("W"):
-                        counter["wh- word"] += 1
-                    elif tag == "CC":
-                        counter["conjunction"] += 1
-                    elif tag == "CD":
-                        counter["digit"] += 1
-                    # combine predeterminer and determiner
-                    elif tag in ["DT" or "PDT"]:
-                        counter["determiner"] += 1
-                    elif tag == "EX":
-                        counter["existential"] += 1
-                    elif tag == "FW":
-                        counter["non-English"] += 1
-                    elif tag == "IN":
-                        counter["preposition"] += 1
-                    elif tag == "POS":
-                        counter["possessive"] += 1
-                    elif tag == "LS":
-                        counter["list"] += 1
-                    elif tag == "MD":
-                        counter["modal"] += 1
-                    elif tag in self.punct_tags:
-                        counter["punctuation"] += 1
-                    elif tag == "TO":
-                        counter["infinitive"] += 1
-                    elif tag == "UH":
-                        counter["interjection"] += 1
-                    elif tag == "SYM":
-                        counter["symbol"] += 1
-                    else:
-                        counter["other"] += 1
+                    counter[self._penn_treebank_tag(tag)] += 1
+
+    def _penn_treebank_tag(self, tag):
+        """
+        Returns the part-of-speech of a Penn Treebank tag.
+        """
+        if tag.startswith("N"):
+            return "noun"
+        elif tag.startswith("J"):
+            return "adjective"
+        elif tag.startswith("V"):
+            return "verb"
+        # include particles with adverbs
+        elif tag.startswith("RB") or tag == "RP":
+            return "adverb"
+        elif tag.startswith("PR"):
+            return "pronoun"
+        elif tag.startswith("W"):
+            return "wh- word"
+        elif tag == "CC":
+            return "conjunction"
+        elif tag == "CD":
+            return "digit"
+        # combine predeterminer and determiner
+        elif tag in ["DT" or "PDT"]:
+            return "determiner"
+        elif tag == "EX":
+            return "existential"
+        elif tag == "FW":
+            return "non-English"
+        elif tag == "IN":
+            return "preposition"
+        elif tag == "POS":
+            return "possessive"
+        elif tag == "LS":
+            return "list"
+        elif tag == "MD":
+            return "modal"
+        elif tag in self.punct_tags:
+            return "punctuation"
+        elif tag == "TO":
+            return "infinitive"
+        elif tag == "UH":
+            return "interjection"
+        elif tag == "SYM":
+            return "symbol"
+        else:
+            return "other"
 
     def draw(self, **kwargs):
         """
@@ -588,6 +756,9 @@ def postag(
     frequency=False,
     stack=False,
     parser=None,
+    n_jobs=None,
+    batch_size=100,
+    cache=None,
     show=True,
     **kwargs,
 ):
@@ -639,6 +810,23 @@ def postag(
         'nltk_wordpunct' would use the NLTK library with 'wordpunct' tagset. Or
         'spacy_en_core_web_sm' would use SpaCy with the 'en_core_web_sm' tagset.
 
+    n_jobs : int, default: None
+        The number of processes used to tag raw documents when a parser is
+        specified; NLTK batches are tagged in a process pool and SpaCy batches are
+        streamed through ``nlp.pipe`` with as many processes. None means 1 unless
+        in a joblib.parallel_backend context, -1 means using all processors.
+
+    batch_size : int, default: 100
+        The number of raw documents tagged at a time when a parser is specified.
+        The tags are counted as the tagged batches are produced, so only the
+        batches being tagged are held in memory.
+
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the part-of-speech counts of each raw document when
+        a parser is specified, so that fitting the corpus again with the same parser
+        and tagset only tags the new or changed documents. See ``EmbeddingCache``
+        for the accepted values.
+
     show: bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -661,6 +849,9 @@ def postag(
         frequency=frequency,
         stack=stack,
         parser=parser,
+        n_jobs=n_jobs,
+        batch_size=batch_size,
+        cache=cache,
         **kwargs,
     )
 
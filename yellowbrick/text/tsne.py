@@ -19,18 +19,26 @@ Implements TSNE visualizations of documents in 2D space.
 ##########################################################################
 
 import numpy as np
+import scipy.sparse as sp
 
 from collections import defaultdict
 
 from yellowbrick.draw import manual_legend
 from yellowbrick.text.base import TextVisualizer
 from yellowbrick.style.colors import resolve_colors
+from yellowbrick.utils.cache import fingerprint, resolve_cache
 from yellowbrick.exceptions import YellowbrickValueError
 
 from sklearn.manifold import TSNE
 from sklearn.pipeline import Pipeline
+from sklearn.utils import check_random_state
 from sklearn.decomposition import TruncatedSVD, PCA
 
+try:
+    from pynndescent import PyNNDescentTransformer
+except ImportError:
+    PyNNDescentTransformer = None
+
 ##########################################################################
 ## Quick Methods
 ##########################################################################
@@ -46,6 +54,10 @@ def tsne(
     colors=None,
     colormap=None,
     alpha=0.7,
+    cache=None,
+    decompose_sample=None,
+    block_size=10000,
+    neighbors=None,
     show=True,
     **kwargs
 ):
@@ -95,6 +107,30 @@ def tsne(
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding and of the decomposed data, so that
+        fitting the same data again skips straight to drawing, and only the TSNE
+        is recomputed when its parameters change. See ``EmbeddingCache`` for the
+        accepted values.
+
+    decompose_sample : int or float, default: None
+        If specified, the preliminary decomposition is fit on a random sample of
+        the instances, the number of instances if an int or the fraction of the
+        instances if a float, rather than on all of them. At least one more
+        instance than ``decompose_by`` is sampled.
+
+    block_size : int, default: 10000
+        The number of instances transformed at a time by the preliminary
+        decomposition, so that it is never densified all at once.
+
+    neighbors : None, 'approximate' or estimator, default: None
+        How the nearest neighbors of the TSNE affinities are computed. If None the
+        TSNE computes exact neighbors, if 'approximate' a nearest neighbor descent
+        index (which requires the pynndescent package) is used, which makes large
+        corpora feasible. Alternatively any transformer that returns a sparse
+        neighbors distance graph, e.g. ``KNeighborsTransformer(mode='distance')``,
+        with at least ``3 * perplexity + 1`` neighbors per instance.
+
     show : bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however you cannot
         call ``plt.savefig`` from this signature, nor ``clear_figure``. If False, simply
@@ -128,6 +164,10 @@ def tsne(
         colors=colors,
         colormap=colormap,
         alpha=alpha,
+        cache=cache,
+        decompose_sample=decompose_sample,
+        block_size=block_size,
+        neighbors=neighbors,
         **kwargs
     )
 
@@ -207,6 +247,30 @@ class TSNEVisualizer(TextVisualizer):
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding and of the decomposed data, so that
+        fitting the same data again skips straight to drawing, and only the TSNE
+        is recomputed when its parameters change. See ``EmbeddingCache`` for the
+        accepted values.
+
+    decompose_sample : int or float, default: None
+        If specified, the preliminary decomposition is fit on a random sample of
+        the instances, the number of instances if an int or the fraction of the
+        instances if a float, rather than on all of them. At least one more
+        instance than ``decompose_by`` is sampled.
+
+    block_size : int, default: 10000
+        The number of instances transformed at a time by the preliminary
+        decomposition, so that it is never densified all at once.
+
+    neighbors : None, 'approximate' or estimator, default: None
+        How the nearest neighbors of the TSNE affinities are computed. If None the
+        TSNE computes exact neighbors, if 'approximate' a nearest neighbor descent
+        index (which requires the pynndescent package) is used, which makes large
+        corpora feasible. Alternatively any transformer that returns a sparse
+        neighbors distance graph, e.g. ``KNeighborsTransformer(mode='distance')``,
+        with at least ``3 * perplexity + 1`` neighbors per instance.
+
     kwargs : dict
         Pass any additional keyword arguments to the TSNE transformer.
     """
@@ -225,6 +289,10 @@ class TSNEVisualizer(TextVisualizer):
         colormap=None,
         random_state=None,
         alpha=0.7,
+        cache=None,
+        decompose_sample=None,
+        block_size=10000,
+        neighbors=None,
         **kwargs
     ):
 
@@ -234,17 +302,33 @@ class TSNEVisualizer(TextVisualizer):
         self.colors = colors
         self.colormap = colormap
         self.random_state = random_state
+        self.cache = cache
+
+        # Decomposition Parameters
+        if decompose_sample is not None:
+            if isinstance(decompose_sample, float) and not 0 < decompose_sample <= 1:
+                raise YellowbrickValueError(
+                    "decompose_sample fraction must be between 0 and 1"
+                )
+            if decompose_sample <= 0:
+                raise YellowbrickValueError("decompose_sample must be positive")
+        self.decompose_sample = decompose_sample
+        self.block_size = block_size
 
         # Fetch TSNE kwargs from kwargs by popping only keys belonging to TSNE params
         tsne_kwargs = {
             key: kwargs.pop(key) for key in TSNE().get_params() if key in kwargs
         }
-        self.transformer_ = self.make_transformer(decompose, decompose_by, tsne_kwargs)
+        self.transformer_ = self.make_transformer(
+            decompose, decompose_by, tsne_kwargs, neighbors=neighbors
+        )
 
         # Call super at the end so that size and title are set correctly
         super(TSNEVisualizer, self).__init__(ax=ax, **kwargs)
 
-    def make_transformer(self, decompose="svd", decompose_by=50, tsne_kwargs={}):
+    def make_transformer(
+        self, decompose="svd", decompose_by=50, tsne_kwargs={}, neighbors=None
+    ):
         """
         Creates an internal transformer pipeline to project the data set into
         2D space using TSNE, applying an pre-decomposition technique ahead of
@@ -264,6 +348,13 @@ class TSNEVisualizer(TextVisualizer):
             Specify the number of components for preliminary decomposition, by
             default this is 50; the more components, the slower TSNE will be.
 
+        tsne_kwargs : dict
+            Keyword arguments passed to the TSNE manifold.
+
+        neighbors : None, 'approximate' or estimator, default: None
+            The nearest neighbors transformer that computes the sparse distance
+            graph of the TSNE affinities, by default the TSNE computes them.
+
         Returns
         -------
 
@@ -295,6 +386,35 @@ class TSNEVisualizer(TextVisualizer):
                 )
             )
 
+        # Add the nearest neighbors graph for the TSNE affinities
+        if neighbors is not None:
+            perplexity = tsne_kwargs.get("perplexity", TSNE().perplexity)
+            n_neighbors = int(3.0 * perplexity + 1)
+
+            if isinstance(neighbors, str):
+                if neighbors != "approximate":
+                    raise YellowbrickValueError(
+                        "'{}' is not a valid neighbors method, use 'approximate', "
+                        "a neighbors transformer or None".format(neighbors)
+                    )
+
+                if PyNNDescentTransformer is None:
+                    raise YellowbrickValueError(
+                        (
+                            "pynndescent package doesn't seem to be installed. "
+                            "Please install it via: pip install pynndescent"
+                        )
+                    )
+
+                neighbors = PyNNDescentTransformer(
+                    n_neighbors=n_neighbors, random_state=self.random_state
+                )
+
+            # The TSNE uses the precomputed graph, which cannot be initialized by PCA
+            steps.append(("neighbors", neighbors))
+            tsne_kwargs = dict(tsne_kwargs, metric="precomputed")
+            tsne_kwargs.setdefault("init", "random")
+
         # Add the TSNE manifold
         steps.append(
             (
@@ -343,8 +463,26 @@ class TSNEVisualizer(TextVisualizer):
         else:
             self.classes_ = np.array([self.NULL_CLASS])
 
-        # Fit our internal transformer and transform the data.
-        vecs = self.transformer_.fit_transform(X)
+        # Fit our internal transformer and transform the data, unless the
+        # embedding of the data by the same transformer is already cached.
+        vecs = None
+        cache = resolve_cache(self.cache)
+        if cache is not None:
+            self.cache_key_ = fingerprint(X, self.transformer_)
+            vecs = cache.get(self.cache_key_)
+
+        if vecs is None:
+            # Reuse the decomposition if only the later stages have changed
+            name, decomposition = self.transformer_.steps[0]
+            if name in {"svd", "pca"}:
+                vecs = self._decompose(X, decomposition, cache)
+                vecs = self.transformer_[1:].fit_transform(vecs)
+            else:
+                vecs = self.transformer_.fit_transform(X)
+
+            if cache is not None:
+                cache.set(self.cache_key_, vecs)
+
         self.n_instances_ = vecs.shape[0]
 
         # Draw the vectors
@@ -353,6 +491,57 @@ class TSNEVisualizer(TextVisualizer):
         # Fit always returns self.
         return self
 
+    def _decompose(self, X, decomposition, cache=None):
+        """
+        Fits the preliminary decomposition, on a sample of the instances if
+        decompose_sample is specified, and transforms X in blocks of block_size
+        instances. The decomposed data is kept and reused by later fits of the same
+        data and decomposition, and is stored in the cache if one is specified.
+        """
+        key = fingerprint(
+            X,
+            decomposition,
+            decompose_sample=self.decompose_sample,
+            random_state=self.random_state,
+            stage="decompose",
+        )
+        if key == getattr(self, "_decomposed_key", None):
+            return self._decomposed
+
+        Xd = cache.get(key) if cache is not None else None
+        if Xd is None:
+            # Convert to a format that supports indexing and slicing rows
+            X = X.tocsr() if sp.issparse(X) else np.asarray(X)
+            n_samples = X.shape[0]
+            if self.decompose_sample is None:
+                decomposition.fit(X)
+            else:
+                if isinstance(self.decompose_sample, float):
+                    n_sample = int(self.decompose_sample * n_samples)
+                else:
+                    n_sample = int(self.decompose_sample)
+
+                # The decomposition needs more instances than components
+                n_sample = max(n_sample, decomposition.n_components + 1)
+                n_sample = min(n_sample, n_samples)
+
+                rng = check_random_state(self.random_state)
+                rows = np.sort(rng.choice(n_samples, n_sample, replace=False))
+                decomposition.fit(X[rows])
+
+            Xd = np.vstack(
+                [
+                    decomposition.transform(X[start : start + self.block_size])
+                    for start in range(0, n_samples, self.block_size)
+                ]
+            )
+
+            if cache is not None:
+                cache.set(key, Xd)
+
+        self._decomposed_key, self._decomposed = key, Xd
+        return Xd
+
     def draw(self, points, target=None, **kwargs):
         """
         Called from the fit method, this method draws the TSNE scatter plot,
@@ -25,6 +25,7 @@ from collections import defaultdict
 from yellowbrick.draw import manual_legend
 from yellowbrick.text.base import TextVisualizer
 from yellowbrick.style.colors import resolve_colors
+from yellowbrick.utils.cache import ModelCache, fingerprint, resolve_cache
 from yellowbrick.exceptions import YellowbrickValueError
 
 from sklearn.pipeline import Pipeline
@@ -52,6 +53,7 @@ def umap(
     colors=None,
     colormap=None,
     alpha=0.7,
+    cache=None,
     show=True,
     **kwargs
 ):
@@ -100,6 +102,13 @@ def umap(
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding, so that fitting the same data with
+        the same UMAP parameters skips straight to drawing. The fitted UMAP model
+        is cached with the embedding and restored on a hit, so new documents can
+        still be projected with ``transform`` or ``partial_fit``. See
+        ``EmbeddingCache`` for the accepted values.
+
     show : bool, default: True
         If True, calls ``show()``, which in turn calls ``plt.show()`` however
         you cannot call ``plt.savefig`` from this signature, nor
@@ -114,7 +123,13 @@ def umap(
     """
     # Instantiate the visualizer
     visualizer = UMAPVisualizer(
-        ax=ax, classes=classes, colors=colors, colormap=colormap, alpha=alpha, **kwargs
+        ax=ax,
+        classes=classes,
+        colors=colors,
+        colormap=colormap,
+        alpha=alpha,
+        cache=cache,
+        **kwargs
     )
 
     # Fit the visualizer (calls draw)
@@ -179,6 +194,13 @@ class UMAPVisualizer(TextVisualizer):
         Specify a transparency where 1 is completely opaque and 0 is completely
         transparent. This property makes densely clustered points more visible.
 
+    cache : bool, str or EmbeddingCache, default: None
+        Opt-in on-disk cache of the embedding, so that fitting the same data with
+        the same UMAP parameters skips straight to drawing. The fitted UMAP model
+        is cached with the embedding and restored on a hit, so new documents can
+        still be projected with ``transform`` or ``partial_fit``. See
+        ``EmbeddingCache`` for the accepted values.
+
     kwargs : dict
         Pass any additional keyword arguments to the UMAP transformer.
 
@@ -203,6 +225,7 @@ class UMAPVisualizer(TextVisualizer):
         colormap=None,
         random_state=None,
         alpha=0.7,
+        cache=None,
         **kwargs
     ):
 
@@ -220,6 +243,7 @@ class UMAPVisualizer(TextVisualizer):
         self.colors = colors
         self.colormap = colormap
         self.random_state = random_state
+        self.cache = cache
 
         # Fetch UMAP kwargs from kwargs by popping only keys belonging to UMAP params
         umap_kwargs = {
@@ -293,7 +317,8 @@ class UMAPVisualizer(TextVisualizer):
             Returns the instance of the transformer/visualizer
         """
 
-        # Store the classes we observed in y
+        # Store the classes we observed in y and whether fit saw a target
+        self._target_fit = y is not None
         if y is not None:
             self.classes_ = np.unique(y)
         elif y is None and self.labels is not None:
@@ -301,8 +326,28 @@ class UMAPVisualizer(TextVisualizer):
         else:
             self.classes_ = np.array([self.NULL_CLASS])
 
-        # Fit our internal transformer and transform the data.
-        vecs = self.transformer_.fit_transform(X)
+        # Fit our internal transformer and transform the data, unless the
+        # embedding of the data by the same transformer is already cached. The
+        # embedding is only reused along with the fitted transformer.
+        vecs = None
+        cache = resolve_cache(self.cache)
+        if cache is not None:
+            models = cache.namespace("umap", ModelCache)
+            self.cache_key_ = fingerprint(X, self.transformer_)
+            vecs = cache.get(self.cache_key_)
+            transformer = models.get(self.cache_key_)
+            if vecs is None or transformer is None:
+                vecs = None
+            else:
+                self.transformer_ = transformer
+
+        if vecs is None:
+            vecs = self.transformer_.fit_transform(X)
+            if cache is not None:
+                cache.set(self.cache_key_, vecs)
+                models.set(self.cache_key_, self.transformer_)
+
+        self.embedding_ = vecs
         self.n_instances_ = vecs.shape[0]
 
         # Draw the vectors
@@ -311,6 +356,77 @@ class UMAPVisualizer(TextVisualizer):
         # Fit always returns self.
         return self
 
+    def transform(self, X):
+        """
+        Projects documents into the existing layout with the fitted UMAP model,
+        without refitting it.
+
+        Parameters
+        ----------
+        X : ndarray or DataFrame of shape n x m
+            A matrix of n instances with the same m features as the corpus the
+            visualizer was fit on.
+
+        Returns
+        -------
+        Xp : ndarray of shape n x 2
+            The positions of the documents in the embedding.
+        """
+        if not hasattr(self.transformer_.named_steps["umap"], "embedding_"):
+            raise YellowbrickValueError("the UMAP model has not been fit")
+        return self.transformer_.transform(X)
+
+    def partial_fit(self, X, y=None, **kwargs):
+        """
+        Adds new documents to a fitted visualizer by projecting them into the
+        existing layout with the fitted UMAP model and drawing them over the base
+        embedding, so that only the new documents are embedded. If the visualizer
+        has not been fit yet, this is equivalent to ``fit``.
+
+        Parameters
+        ----------
+        X : ndarray or DataFrame of shape n x m
+            A matrix of n new instances with the same m features as the corpus the
+            visualizer was fit on.
+
+        y : ndarray or Series of length n
+            The target or class values of the new instances, which must be classes
+            seen in fit. Required if the visualizer was fit with a target.
+
+        kwargs : dict
+            Pass generic arguments to the drawing method
+
+        Returns
+        -------
+        self : instance
+            Returns the instance of the transformer/visualizer
+        """
+        if not hasattr(self, "embedding_"):
+            return self.fit(X, y, **kwargs)
+
+        # The new documents are colored with the classes of the base embedding
+        if y is None:
+            if self._target_fit:
+                raise YellowbrickValueError(
+                    "specify y to add documents to an embedding fit with a target"
+                )
+        else:
+            unknown = np.setdiff1d(np.unique(y), self.classes_)
+            if len(unknown) > 0:
+                raise YellowbrickValueError(
+                    "classes {} were not seen in fit".format(
+                        ", ".join(map(str, unknown))
+                    )
+                )
+
+        vecs = self.transform(X)
+        self.embedding_ = np.vstack((self.embedding_, vecs))
+        self.n_instances_ = self.embedding_.shape[0]
+
+        # Draw the new vectors over the base embedding
+        self.draw(vecs, y, **kwargs)
+        return self
+
     def draw(self, points, target=None, **kwargs):
         """
         Called from the fit method, this method draws the UMAP scatter plot,
@@ -0,0 +1,295 @@
+# yellowbrick.utils.cache
+# An on-disk cache of expensive embeddings keyed by a fingerprint of the data.
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+An on-disk cache of expensive embeddings (e.g. t-SNE or UMAP projections) keyed
+by a fingerprint of the data and of the parameters of the transformer, so that
+a visualization can be restyled or redrawn without recomputing the embedding.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pickle
+import joblib
+import tempfile
+import numpy as np
+import scipy.sparse as sp
+
+from sklearn.base import clone
+
+from yellowbrick.utils.types import is_estimator
+from yellowbrick.exceptions import YellowbrickTypeError, YellowbrickValueError
+
+
+# Default maximum size of the embedding cache in bytes (1 GiB)
+DEFAULT_CACHE_SIZE = 2 ** 30
+
+# Default location of the embedding cache
+DEFAULT_CACHE_HOME = os.path.join("~", ".cache", "yellowbrick")
+
+
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def get_cache_home(path=None):
+    """
+    Return the path of the Yellowbrick cache directory. By default this is
+    ``~/.cache/yellowbrick``, alternatively it can be set by the
+    ``$YELLOWBRICK_CACHE`` environment variable, or programmatically by giving
+    a folder path. The ``'~'`` symbol and environment variables are expanded.
+    """
+    if path is None:
+        path = os.environ.get("YELLOWBRICK_CACHE", DEFAULT_CACHE_HOME)
+
+    path = os.path.expanduser(path)
+    path = os.path.expandvars(path)
+
+    if not os.path.exists(path):
+        os.makedirs(path)
+
+    return path
+
+
+def fingerprint(X, transformer, **params):
+    """
+    Computes a key that identifies the embedding of X by the transformer. The
+    key is a hash of the data (dense, sparse or DataFrame), of the unfitted
+    hyperparameters of the transformer and of any additional parameters that
+    influence the embedding, such that a change to any of them is a miss.
+
+    Parameters
+    ----------
+    X : array-like or sparse matrix
+        The data that is embedded.
+
+    transformer : estimator
+        The transformer or pipeline that computes the embedding, it is cloned
+        so that fitted attributes do not affect the key.
+
+    params : dict
+        Additional parameters that influence the embedding.
+
+    Returns
+    -------
+    key : str
+        The hexadecimal fingerprint.
+    """
+    # Hash the components of sparse matrices, whose pickles are not canonical
+    if sp.issparse(X):
+        X = X.tocsr()
+        X = (X.shape, X.data, X.indices, X.indptr)
+
+    if is_estimator(transformer):
+        transformer = clone(transformer)
+    return joblib.hash((X, transformer, sorted(params.items())))
+
+
+def resolve_cache(cache):
+    """
+    Resolves the ``cache`` parameter of a visualizer: None or False disables
+    caching, True uses an ``EmbeddingCache`` in the default cache directory,
+    a string uses an ``EmbeddingCache`` in that directory, and an existing
+    ``EmbeddingCache`` is returned as is.
+    """
+    if cache is None or cache is False:
+        return None
+
+    if cache is True:
+        return EmbeddingCache()
+
+    if isinstance(cache, str):
+        return EmbeddingCache(cache)
+
+    if isinstance(cache, EmbeddingCache):
+        return cache
+
+    raise YellowbrickTypeError(
+        "cache must be a bool, a path or an EmbeddingCache not {}".format(
+            type(cache).__name__
+        )
+    )
+
+
+##########################################################################
+## Embedding Cache
+##########################################################################
+
+
+class EmbeddingCache(object):
+    """
+    A size-bounded cache of embeddings stored as ``.npy`` files in a directory.
+    The files are named by the fingerprint of the data and the transformer, so
+    any change to either results in a miss. Every hit updates the modification
+    time of the file, and when the total size of the cache exceeds ``max_size``
+    the least recently used embeddings are evicted.
+
+    Visualizers with a ``cache`` parameter accept True to use the default cache
+    directory (``~/.cache/yellowbrick`` or ``$YELLOWBRICK_CACHE``), a string to
+    use that directory, or an ``EmbeddingCache`` to bound the size of the cache.
+    The key of the last embedding is stored on the visualizer as ``cache_key_``
+    so that it can be invalidated with ``remove``.
+
+    Parameters
+    ----------
+    path : str, default: None
+        The directory to store the embeddings in, see ``get_cache_home``.
+
+    max_size : int, default: 1 GiB
+        The maximum total size of the cached embeddings in bytes.
+
+    Examples
+    --------
+    >>> cache = EmbeddingCache(max_size=2**28)
+    >>> viz = TSNEVisualizer(cache=cache)
+    >>> viz.fit(X, y)
+    >>> cache.clear()
+    """
+
+    EXTENSION = ".npy"
+
+    def __init__(self, path=None, max_size=DEFAULT_CACHE_SIZE):
+        if max_size <= 0:
+            raise YellowbrickValueError("max_size must be a positive number of bytes")
+
+        self.path = get_cache_home(path)
+        self.max_size = max_size
+
+    def namespace(self, name, cache_class=None):
+        """
+        Returns a cache in the subdirectory name of this cache with the same
+        maximum size, so that many small entries (e.g. per document counts) or
+        fitted models (with ``cache_class=ModelCache``) are bounded and evicted
+        separately from the embeddings.
+        """
+        cache_class = cache_class or EmbeddingCache
+        return cache_class(os.path.join(self.path, name), self.max_size)
+
+    def _path(self, key):
+        return os.path.join(self.path, key + self.EXTENSION)
+
+    def _load(self, path):
+        return np.load(path, allow_pickle=False)
+
+    def _dump(self, embedding, f):
+        np.save(f, np.asarray(embedding), allow_pickle=False)
+
+    def keys(self):
+        """
+        Returns the keys of the cached embeddings, least recently used first.
+        """
+        names = [os.path.basename(path) for path in self._files()]
+        return [name[: -len(self.EXTENSION)] for name in names]
+
+    def _files(self):
+        """
+        Returns the paths of the cached embeddings, least recently used first.
+        """
+        paths = [
+            os.path.join(self.path, name)
+            for name in os.listdir(self.path)
+            if name.endswith(self.EXTENSION)
+        ]
+        return sorted(paths, key=lambda path: os.stat(path).st_mtime)
+
+    def get(self, key):
+        """
+        Returns the cached embedding for the key or None if it is not cached.
+        """
+        path = self._path(key)
+        try:
+            embedding = self._load(path)
+        except (IOError, OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Mark the embedding as most recently used
+        os.utime(path)
+        return embedding
+
+    def set(self, key, embedding, evict=True):
+        """
+        Stores the embedding for the key, then evicts the least recently used
+        embeddings if the cache exceeds its maximum size. When many small arrays
+        are stored at once, pass ``evict=False`` and call ``evict`` at the end.
+        """
+        # Write to a temporary file first so readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self._dump(embedding, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used embeddings until the total size of the
+        cache is no more than ``max_size``.
+        """
+        files = self._files()
+        sizes = [os.path.getsize(path) for path in files]
+        total = sum(sizes)
+
+        for path, size in zip(files, sizes):
+            if total <= self.max_size:
+                break
+            os.remove(path)
+            total -= size
+
+    def remove(self, key):
+        """
+        Invalidates the cached embedding for the key, if any.
+        """
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def clear(self):
+        """
+        Invalidates all of the cached embeddings.
+        """
+        for path in self._files():
+            os.remove(path)
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def __len__(self):
+        return len(self._files())
+
+
+class ModelCache(EmbeddingCache):
+    """
+    A size-bounded cache of fitted models stored with joblib, used next to an
+    ``EmbeddingCache`` so that a transformer that was fit when an embedding was
+    cached is restored on a hit, e.g. to transform new data with the fitted UMAP
+    model. Models are unpickled when loaded, so only use trusted directories.
+
+    Parameters
+    ----------
+    path : str, default: None
+        The directory to store the models in, see ``get_cache_home``.
+
+    max_size : int, default: 1 GiB
+        The maximum total size of the cached models in bytes.
+    """
+
+    EXTENSION = ".joblib"
+
+    def _load(self, path):
+        return joblib.load(path)
+
+    def _dump(self, model, f):
+        joblib.dump(model, f)
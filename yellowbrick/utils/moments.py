@@ -0,0 +1,196 @@
+# yellowbrick.utils.moments
+# One-pass accumulation of the moments of data streamed in row blocks.
+#
+# Copyright (C) 2022 The scikit-yb developers
+# For license information, see LICENSE.txt
+
+"""
+One-pass accumulation of the moments of data streamed in row blocks, so that
+statistics like the covariance matrix of data that does not fit in memory can
+be computed with memory that only depends on the number of features.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+import scipy.sparse as sp
+
+from yellowbrick.exceptions import YellowbrickValueError
+
+
+# Default number of rows of each block when iterating over a matrix
+DEFAULT_BLOCK_SIZE = 4096
+
+
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def row_blocks(X, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Iterates over the rows of a matrix in blocks, sparse blocks are densified
+    one at a time so that only ``block_size`` rows are ever held in memory as
+    a dense array.
+
+    Parameters
+    ----------
+    X : ndarray or sparse matrix of shape n x m
+        The matrix to iterate over, CSR matrices are sliced most efficiently.
+
+    block_size : int, default: 4096
+        The maximum number of rows in each block.
+
+    Yields
+    ------
+    block : ndarray of shape block_size x m
+        A dense block of consecutive rows of X.
+    """
+    for start in range(0, X.shape[0], block_size):
+        block = X[start : start + block_size]
+        if sp.issparse(block):
+            block = block.toarray()
+        yield np.asarray(block)
+
+
+##########################################################################
+## Co-moment Accumulator
+##########################################################################
+
+
+class CoMoments(object):
+    """
+    Accumulates the mean and the co-moment matrix (the sum of the outer
+    products of the centered rows) of data in a single pass over row blocks,
+    using the pairwise update of Chan, Golub and LeVeque. The update is
+    numerically stable and accumulators of separate blocks of data (e.g. from
+    parallel workers) can be merged.
+
+    Parameters
+    ----------
+    blocks : iterable of array-like, optional
+        Row blocks of shape (n_rows, m) to accumulate on instantiation.
+
+    Attributes
+    ----------
+    n_samples_ : int
+        The number of rows that have been accumulated.
+
+    mean_ : ndarray of shape (m,)
+        The mean of each column.
+
+    comoment_ : ndarray of shape (m, m)
+        The co-moment matrix of the columns.
+
+    Examples
+    --------
+    >>> moments = CoMoments(row_blocks(X))
+    >>> moments.correlation()
+    """
+
+    def __init__(self, blocks=None):
+        self.n_samples_ = 0
+        self.mean_ = None
+        self.comoment_ = None
+
+        if blocks is not None:
+            for block in blocks:
+                self.update(block)
+
+    def update(self, X):
+        """
+        Accumulates a block of rows.
+
+        Parameters
+        ----------
+        X : array-like or sparse matrix of shape (n_rows, m)
+            A block of rows of the data.
+
+        Returns
+        -------
+        self : CoMoments
+            The accumulator to allow chaining.
+        """
+        if sp.issparse(X):
+            X = X.toarray()
+
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2:
+            raise YellowbrickValueError("row blocks must be 2D arrays")
+
+        if X.shape[0] == 0:
+            return self
+
+        mean = X.mean(axis=0)
+        centered = X - mean
+
+        block = CoMoments()
+        block.n_samples_ = X.shape[0]
+        block.mean_ = mean
+        block.comoment_ = centered.T @ centered
+        return self.merge(block)
+
+    def merge(self, other):
+        """
+        Merges the moments accumulated by another accumulator into this one.
+
+        Parameters
+        ----------
+        other : CoMoments
+            The accumulator of a separate part of the data.
+
+        Returns
+        -------
+        self : CoMoments
+            The accumulator to allow chaining.
+        """
+        if other.n_samples_ == 0:
+            return self
+
+        if self.n_samples_ == 0:
+            self.n_samples_ = other.n_samples_
+            self.mean_ = other.mean_.copy()
+            self.comoment_ = other.comoment_.copy()
+            return self
+
+        if self.mean_.shape != other.mean_.shape:
+            raise YellowbrickValueError(
+                "cannot merge moments of {} and {} columns".format(
+                    self.mean_.shape[0], other.mean_.shape[0]
+                )
+            )
+
+        n = self.n_samples_ + other.n_samples_
+        delta = other.mean_ - self.mean_
+
+        self.comoment_ += other.comoment_
+        self.comoment_ += np.outer(delta, delta) * (
+            self.n_samples_ * other.n_samples_ / n
+        )
+        self.mean_ += delta * (other.n_samples_ / n)
+        self.n_samples_ = n
+        return self
+
+    def covariance(self, ddof=1):
+        """
+        Returns the covariance matrix of the accumulated data, equivalent to
+        ``np.cov(X.T, ddof=ddof)``.
+        """
+        if self.n_samples_ == 0:
+            raise YellowbrickValueError("no data has been accumulated")
+        return self.comoment_ / (self.n_samples_ - ddof)
+
+    def correlation(self):
+        """
+        Returns the Pearson correlation matrix of the accumulated data,
+        equivalent to ``np.corrcoef(X.T)``. The correlations of constant
+        columns are NaN.
+        """
+        cov = self.covariance()
+        std = np.sqrt(np.diag(cov))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        return np.clip(corr, -1, 1)